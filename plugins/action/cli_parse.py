@@ -13,7 +13,9 @@ __metaclass__ = type
 
 import json
 
+from copy import deepcopy
 from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
 
 from ansible.errors import AnsibleActionFail
 from ansible.module_utils.common.text.converters import to_native, to_text
@@ -24,13 +26,23 @@ from ansible.plugins.action import ActionBase
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     check_argspec,
 )
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import to_native_types
 from ansible_collections.ansible.utils.plugins.modules.cli_parse import DOCUMENTATION
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.parse_cache import (
+    parse_cache,
+    parse_cache_key,
+)
 
 
 ARGSPEC_CONDITIONALS = {
-    "argument_spec": {"parser": {"mutually_exclusive": [["command", "template_path"]]}},
-    "required_one_of": [["command", "text"]],
-    "mutually_exclusive": [["command", "text"]],
+    "argument_spec": {
+        "parser": {"mutually_exclusive": [["command", "template_path"]]},
+        "commands": {
+            "options": {"parser": {"mutually_exclusive": [["command", "template_path"]]}},
+        },
+    },
+    "required_one_of": [["command", "text", "commands"]],
+    "mutually_exclusive": [["command", "text", "commands"]],
 }
 
 
@@ -47,6 +59,8 @@ class ActionModule(ActionBase):
         self._parser_name = None
         self._result = {}
         self._task_vars = None
+        self._cache = None
+        self._cache_hit = None
 
     def _debug(self, msg):
         """Output text using ansible's display
@@ -71,19 +85,39 @@ class ActionModule(ActionBase):
         that cannot be covered using stnd techniques
         """
         errors = []
-        requested_parser = self._task.args.get("parser").get("name")
-        if len(requested_parser.split(".")) != 3:
+        parser = self._task.args.get("parser")
+        if self._task.args.get("commands"):
+            commands = [entry.get("command") for entry in self._task.args["commands"]]
+            duplicates = sorted(set(c for c in commands if commands.count(c) > 1))
+            if duplicates:
+                msg = "commands must be unique, the results are keyed by command: {0}".format(
+                    ", ".join(duplicates),
+                )
+                errors.append(msg)
+            parsers = [entry.get("parser") or parser for entry in self._task.args["commands"]]
+            if not all(parsers):
+                msg = "parser is required unless every entry of commands has its own parser"
+                errors.append(msg)
+                parsers = [p for p in parsers if p]
+        elif parser:
+            parsers = [parser]
+        else:
+            errors.append("missing required arguments: parser")
+            parsers = []
+        if any(len(p.get("name").split(".")) != 3 for p in parsers):
             msg = "Parser name should be provided as a full name including collection"
             errors.append(msg)
 
-        if self._task.args.get("text") and requested_parser not in [
-            "ansible.utils.json",
-            "ansible.utils.xml",
-        ]:
-            if not (
-                self._task.args.get("parser").get("command")
-                or self._task.args.get("parser").get("template_path")
-            ):
+        if (
+            self._task.args.get("text")
+            and parser
+            and parser.get("name")
+            not in [
+                "ansible.utils.json",
+                "ansible.utils.xml",
+            ]
+        ):
+            if not (parser.get("command") or parser.get("template_path")):
                 msg = "Either parser/command or parser/template_path needs to be provided when parsing text."
                 errors.append(msg)
         if errors:
@@ -198,6 +232,41 @@ class ActionModule(ActionBase):
                 )
         return template_contents
 
+    def _parse_cache_key(self, parser):
+        """The cache key of the parse of the task args, everything the
+        result depends on: the text, the parser, its library, the OS and
+        the raw contents of the template
+
+        :param parser: The parser loaded for the task args
+        :type parser: CliParser
+        :return: The key, None if the parse is not cached
+        :rtype: str
+        """
+        # a parser without a template is not cached, neither is one whose
+        # template can not be read, the parser then reports the error
+        template_path = self._task.args.get("parser").get("template_path")
+        if not template_path:
+            return None
+        try:
+            with open(template_path, "rb") as file_handler:
+                template = file_handler.read()
+        except (IOError, OSError):
+            return None
+
+        library = getattr(parser, "LIBRARY", None)
+        if library:
+            try:
+                library = "{name} {version}".format(name=library, version=version(library))
+            except PackageNotFoundError:
+                pass
+        return parse_cache_key(
+            self._task.args.get("text"),
+            self._task.args["parser"],
+            template,
+            oper_sys=self._task.args["parser"].get("os") or self._os_from_task_vars(),
+            library=library,
+        )
+
     def _prune_result(self):
         """In the case of an error, remove stdout and stdout_lines
         this allows for easier visibility of the error message.
@@ -232,6 +301,151 @@ class ActionModule(ActionBase):
                 self._result["stdout"] = result["stdout"]
                 self._result["stdout_lines"] = result["stdout_lines"]
 
+    def _run_commands(self, commands):
+        """Run a list of commands on the host
+        A network device is sent all the commands in a single request,
+        else they are run one by one
+
+        :param commands: The commands
+        :type commands: list
+        :return: The output of each command, in the same order
+        :rtype: list
+        """
+        socket_path = self._connection.socket_path
+        if socket_path:
+            connection = Connection(socket_path)
+            try:
+                responses = connection.run_commands(commands=commands, check_rc=True)
+            except AnsibleConnectionError as exc:
+                self._result["failed"] = True
+                self._result["msg"] = [to_text(exc)]
+                return None
+            # the cliconf plugins decode the output which is valid JSON,
+            # the parsers are given text as for a single command
+            return [
+                response if isinstance(response, str) else json.dumps(response)
+                for response in responses
+            ]
+
+        responses = []
+        for command in commands:
+            result = self._low_level_execute_command(cmd=command)
+            if result["rc"]:
+                self._result["failed"] = True
+                self._result["msg"] = result["stderr"]
+                return None
+            responses.append(result["stdout"])
+        return responses
+
+    def _parse(self, task_vars):
+        """Load the parser of the task args and parse their text
+
+        :param task_vars: The vars provided when the task is run
+        :type task_vars: dict
+        :return: The result from the parser, None if it could not be loaded
+        :rtype: dict
+        """
+        parser = self._load_parser(task_vars)
+        if self._result.get("failed"):
+            return None
+
+        # Not all parsers use a template, in the case a parser provides
+        # an extension, provide it the template path
+        if getattr(parser, "DEFAULT_TEMPLATE_EXTENSION", False):
+            self._update_template_path(parser.DEFAULT_TEMPLATE_EXTENSION)
+
+        # Not all parsers require the template contents
+        # when true, provide the template contents
+        provide_contents = getattr(parser, "PROVIDE_TEMPLATE_CONTENTS", False) is True
+        if provide_contents:
+            template_contents = self._get_template_contents()
+        else:
+            template_contents = None
+
+        key = None
+        if self._cache is not None:
+            key = self._parse_cache_key(parser)
+        if key is not None:
+            parsed = self._cache.get(key)
+            self._cache_hit = parsed is not None
+            if self._cache_hit:
+                self._debug("parse result read from the cache")
+                return {"parsed": parsed}
+        else:
+            self._cache_hit = False
+
+        try:
+            result = parser.parse(template_contents=template_contents)
+            # ensure the response returned to the controller
+            # contains only native types, nothing unique to the parser
+            result = to_native_types(result)
+        except Exception as exc:
+            raise AnsibleActionFail(
+                "Unhandled exception from parser '{parser}'. Error: {err}".format(
+                    parser=self._parser_name,
+                    err=to_native(exc),
+                ),
+            )
+        if key is not None and not result.get("errors"):
+            self._cache.set(key, result.get("parsed"))
+        return result
+
+    def _run_batch(self, task_vars):
+        """Run and parse the commands of the task
+
+        :param task_vars: The vars provided when the task is run
+        :type task_vars: dict
+        :return: The parsed output of each command, keyed by command
+        :rtype: dict
+        """
+        task_args = self._task.args
+        entries = task_args["commands"]
+        responses = self._run_commands([entry["command"] for entry in entries])
+        if self._result.get("failed"):
+            return self._result
+        self._result["stdout"] = dict(
+            (entry["command"], response) for entry, response in zip(entries, responses)
+        )
+
+        parsed = {}
+        cache_hit = {}
+        try:
+            for entry, response in zip(entries, responses):
+                # the single command steps work on the task args
+                parser = deepcopy(entry.get("parser") or task_args["parser"])
+                parser.setdefault("command", entry["command"])
+                self._task.args = {"command": entry["command"], "parser": parser, "text": response}
+                self._parser_name = parser["name"]
+                result = self._parse(task_vars)
+                if result is None or result.get("errors"):
+                    self._prune_result()
+                    if result is not None:
+                        errors = result["errors"]
+                        if not isinstance(errors, str):
+                            errors = " ".join(errors)
+                        self._result.update(
+                            {
+                                "failed": True,
+                                "msg": "{command}: {errors}".format(
+                                    command=entry["command"],
+                                    errors=errors,
+                                ),
+                            },
+                        )
+                    return self._result
+                parsed[entry["command"]] = result["parsed"]
+                cache_hit[entry["command"]] = self._cache_hit
+        finally:
+            self._task.args = task_args
+
+        self._result["parsed"] = parsed
+        if self._cache is not None:
+            self._result["cache_hit"] = cache_hit
+        set_fact = task_args.get("set_fact")
+        if set_fact:
+            self._result["ansible_facts"] = {set_fact: parsed}
+        return self._result
+
     def run(self, tmp=None, task_vars=None):
         """The std execution entry pt for an action plugin
 
@@ -257,6 +471,11 @@ class ActionModule(ActionBase):
 
         self._task_vars = task_vars
         self._playhost = task_vars.get("inventory_hostname")
+        cache = updated_params.get("cache")
+        if cache:
+            self._cache = parse_cache(cache["path"], cache["max_size"])
+        if self._task.args.get("commands"):
+            return self._run_batch(task_vars)
         self._parser_name = self._task.args.get("parser").get("name")
 
         self._run_command()
@@ -266,41 +485,18 @@ class ActionModule(ActionBase):
         self._set_parser_command()
         self._set_text()
 
-        parser = self._load_parser(task_vars)
-        if self._result.get("failed"):
+        result = self._parse(task_vars)
+        if result is None:
             self._prune_result()
             return self._result
 
-        # Not all parsers use a template, in the case a parser provides
-        # an extension, provide it the template path
-        if getattr(parser, "DEFAULT_TEMPLATE_EXTENSION", False):
-            self._update_template_path(parser.DEFAULT_TEMPLATE_EXTENSION)
-
-        # Not all parsers require the template contents
-        # when true, provide the template contents
-        if getattr(parser, "PROVIDE_TEMPLATE_CONTENTS", False) is True:
-            template_contents = self._get_template_contents()
-        else:
-            template_contents = None
-
-        try:
-            result = parser.parse(template_contents=template_contents)
-            # ensure the response returned to the controller
-            # contains only native types, nothing unique to the parser
-            result = json.loads(json.dumps(result))
-        except Exception as exc:
-            raise AnsibleActionFail(
-                "Unhandled exception from parser '{parser}'. Error: {err}".format(
-                    parser=self._parser_name,
-                    err=to_native(exc),
-                ),
-            )
-
         if result.get("errors"):
             self._prune_result()
             self._result.update({"failed": True, "msg": " ".join(result["errors"])})
         else:
             self._result["parsed"] = result["parsed"]
+            if self._cache is not None:
+                self._result["cache_hit"] = self._cache_hit
             set_fact = self._task.args.get("set_fact")
             if set_fact:
                 self._result["ansible_facts"] = {set_fact: result["parsed"]}
@@ -8,13 +8,28 @@ filter plugin file for ipaddr filters: cidr_merge
 """
 from __future__ import absolute_import, division, print_function
 
+from collections.abc import Iterator
 from functools import partial
 
 from ansible.errors import AnsibleFilterError
+from ansible.utils.display import Display
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ipaddr_stdlib
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_range_merge import (
+    merge_prefixes,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    IPPrefix,
+    int_to_str,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_network,
+    _ipaddress_backend_selected,
+    ipaddr_backend,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_netaddr,
 )
@@ -40,6 +55,8 @@ try:
 except ImportError:
     from jinja2.filters import environmentfilter as pass_environment
 
+display = Display()
+
 DOCUMENTATION = """
     name: cidr_merge
     author: Ashwini Mhatre (@amhatre)
@@ -48,10 +65,13 @@ DOCUMENTATION = """
     description:
         - This filter can be used to merge subnets or individual addresses into their minimal representation, collapsing
         - overlapping subnets and merging adjacent ones wherever possible.
+        - The subnets are merged as integer ranges in bounded memory, the list can be a generator,
+          ie. the output of the C(map) filter, and hold millions of subnets.
     options:
         value:
             description:
             - list of subnets or individual address to be merged
+            - A generator is read only once, as the subnets are merged.
             type: list
             elements: str
             required: True
@@ -60,6 +80,13 @@ DOCUMENTATION = """
             - Action to be performed.example merge,span
             default: merge
             type: str
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -149,37 +176,75 @@ def _cidr_merge(*args, **kwargs):
     # Unwrap lazy list when present to avoid resolution bug in macro context (no template.j2 change).
     if "value" in data:
         data["value"] = _unwrap_lazy_list(data["value"])
+    value = data.get("value")
+    if isinstance(value, Iterator):
+        # only validate the options, a generator is consumed by the merge
+        data["value"] = []
     aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="cidr_merge")
     valid, errors, updated_data = aav.validate()
     if not valid:
         raise AnsibleFilterError(errors)
+    if isinstance(value, Iterator):
+        updated_data["value"] = value
     return cidr_merge(**updated_data)
 
 
-def cidr_merge(value, action="merge"):
+def _merge_prefix(value, backend):
+    """Parse a value given to cidr_merge, strings in the common formats
+    are parsed directly, anything else by the backend network type
+    :param value: An IP address or network
+    :param backend: netaddr or ipaddress
+    :type backend: str
+    :rtype: IPPrefix
+    """
+    if isinstance(value, str):
+        try:
+            return IPPrefix.parse(value)
+        except ValueError:
+            pass
+    if backend == "ipaddress":
+        return IPPrefix.from_network(ipaddr_stdlib.StdlibIPNetwork.parse(value))
+    return IPPrefix.from_network(netaddr.IPNetwork(value))
+
+
+def cidr_merge(value, action="merge", backend=None):
     if not hasattr(value, "__iter__"):
         raise AnsibleFilterError("cidr_merge: expected iterable, got " + repr(value))
 
+    backend = ipaddr_backend(backend)
+    lib = ipaddr_stdlib if backend == "ipaddress" else netaddr
     if action == "merge":
+        stats = {}
         try:
-            return [str(ip) for ip in netaddr.cidr_merge(value)]
+            parse = partial(_merge_prefix, backend=backend)
+            result = [
+                "{0}/{1}".format(int_to_str(address, version), prefixlen)
+                for address, prefixlen, version in merge_prefixes(value, parse, stats=stats)
+            ]
         except Exception as e:
-            raise AnsibleFilterError("cidr_merge: error in netaddr:\n%s" % e)
+            raise AnsibleFilterError("cidr_merge: error in %s:\n%s" % (backend, e))
+        display.vvvv(
+            "cidr_merge: merged {prefixes} prefixes into {networks} networks,"
+            " peak buffer memory {peak_bytes} bytes".format(**stats),
+        )
+        return result
 
     elif action == "span":
+        if isinstance(value, Iterator):
+            value = list(value)
         # spanning_cidr needs at least two values
         if len(value) == 0:
             return None
         elif len(value) == 1:
             try:
-                return str(netaddr.IPNetwork(value[0]))
+                return str(_ip_network(value[0], backend))
             except Exception as e:
-                raise AnsibleFilterError("cidr_merge: error in netaddr:\n%s" % e)
+                raise AnsibleFilterError("cidr_merge: error in %s:\n%s" % (backend, e))
         else:
             try:
-                return str(netaddr.spanning_cidr(value))
+                return str(lib.spanning_cidr(value))
             except Exception as e:
-                raise AnsibleFilterError("cidr_merge: error in netaddr:\n%s" % e)
+                raise AnsibleFilterError("cidr_merge: error in %s:\n%s" % (backend, e))
 
     else:
         raise AnsibleFilterError("cidr_merge: invalid action '%s'" % action)
@@ -194,7 +259,7 @@ class FilterModule(object):
     }
 
     def filters(self):
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             # Need to install python's netaddr for these filters to work
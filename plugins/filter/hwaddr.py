@@ -51,10 +51,14 @@ DOCUMENTATION = """
     - This filter check if string is a HW/MAC address and filter it
     - You can use the hwaddr() filter to check if a given string is a MAC address or convert it between various
       formats.
+    - A list of addresses returns the list of their results, the usual formats of EUI-48 addresses
+      are parsed and formatted as integers, without building a C(netaddr.EUI) per address.
     options:
         value:
-            description: HW/MAC address.
-            type: str
+            description:
+            - HW/MAC address.
+            - A list of HW/MAC addresses returns a list of results.
+            type: raw
             required: True
         query:
             description: query string. Example. cisco,linux,unix etc
@@ -77,6 +81,10 @@ EXAMPLES = r"""
   debug:
     msg: "{{ '1a:2b:3c:4d:5e:6f' | ansible.utils.hwaddr('cisco') }}"
 
+- name: Convert a list of HW addresses to Linux format
+  debug:
+    msg: "{{ ['1A2B.3C4D.5E6F', '1a-2b-3c-4d-5e-70'] | ansible.utils.hwaddr('linux') }}"
+
 # TASK [Check if given string is a MAC address] ***************************************************************
 # ok: [localhost] => {
 #     "msg": "1a:2b:3c:4d:5e:6f"
@@ -90,9 +98,10 @@ EXAMPLES = r"""
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - mac/Hw address
+      - A list of results when I(value) is a list.
 
 """
 
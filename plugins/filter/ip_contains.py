@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: ip_contains
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_interval_set import (
+    ip_interval_set,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: ip_contains
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Check if a list of IP addresses and networks contains some addresses.
+    description:
+        - Check if all the addresses of I(other) are in the addresses and networks of I(value).
+        - A network of I(other) can be covered by several networks of I(value), ie. C(10.0.0.0/24)
+          is in C(['10.0.0.0/25', '10.0.0.128/25']).
+        - IPv4 and IPv6 addresses can be mixed.
+        - The host bits of the networks are ignored, ie. C(10.0.0.5/24) is C(10.0.0.0/24).
+    options:
+        value:
+            description:
+            - An IP address or network, or a list of them.
+            type: raw
+            required: True
+        other:
+            description:
+            - An IP address or network, or a list of them, to look for in I(value).
+            type: raw
+            required: True
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Check if a network is part of the allowed ranges
+  debug:
+    msg: "{{ ['10.0.0.0/25', '10.0.0.128/25', '2001:db8::/32'] | ansible.utils.ip_contains('10.0.0.0/24') }}"
+
+# TASK [Check if a network is part of the allowed ranges] *******************************
+# ok: [localhost] => {
+#     "msg": true
+# }
+
+- name: Check a list of addresses
+  debug:
+    msg: "{{ ['10.0.0.0/24'] | ansible.utils.ip_contains(['10.0.0.1', '10.0.1.1']) }}"
+
+# TASK [Check a list of addresses] ******************************************************
+# ok: [localhost] => {
+#     "msg": false
+# }
+"""
+
+RETURN = """
+  data:
+    type: bool
+    description:
+      - True if all the addresses of I(other) are in I(value), False otherwise.
+"""
+
+
+@pass_environment
+def _ip_contains(*args, **kwargs):
+    """Check if a list of IP addresses and networks contains some addresses"""
+    keys = ["value", "other"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="ip_contains")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return ip_contains(**updated_data)
+
+
+def ip_contains(value, other):
+    """
+    Check if a list of IP addresses and networks contains some addresses.
+    :param value: An IP address or network, or a list of them.
+    :param other: An IP address or network, or a list of them.
+    :return: True if all the addresses of other are in value.
+    """
+    return ip_interval_set(value, "ip_contains").issuperset(
+        ip_interval_set(other, "ip_contains"),
+    )
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "ip_contains": _ip_contains,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
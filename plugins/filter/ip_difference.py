@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: ip_difference
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_interval_set import (
+    ip_interval_set,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: ip_difference
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Remove a list of IP addresses and networks from another.
+    description:
+        - Return the minimal list of networks covering the addresses of I(value) which are not in I(other).
+        - IPv4 and IPv6 addresses can be mixed, the IPv4 networks are returned first.
+        - The host bits of the networks are ignored, ie. C(10.0.0.5/24) is C(10.0.0.0/24).
+    options:
+        value:
+            description:
+            - An IP address or network, or a list of them.
+            type: raw
+            required: True
+        other:
+            description:
+            - An IP address or network, or a list of them, to remove from I(value).
+            type: raw
+            required: True
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Find the free addresses of a pool
+  vars:
+    allowed: ['192.0.2.0/24']
+    used: ['192.0.2.0/26', '192.0.2.64/27']
+    reserved: ['192.0.2.255']
+  debug:
+    msg: "{{ allowed | ansible.utils.ip_difference(used + reserved) }}"
+
+# TASK [Find the free addresses of a pool] *********************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "192.0.2.96/27",
+#         "192.0.2.128/26",
+#         "192.0.2.192/27",
+#         "192.0.2.224/28",
+#         "192.0.2.240/29",
+#         "192.0.2.248/30",
+#         "192.0.2.252/31",
+#         "192.0.2.254/32"
+#     ]
+# }
+"""
+
+RETURN = """
+  data:
+    type: list
+    elements: str
+    description:
+      - The minimal list of networks covering the addresses of I(value) which are not in I(other).
+"""
+
+
+@pass_environment
+def _ip_difference(*args, **kwargs):
+    """Remove a list of IP addresses and networks from another"""
+    keys = ["value", "other"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="ip_difference")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return ip_difference(**updated_data)
+
+
+def ip_difference(value, other):
+    """
+    Remove a list of IP addresses and networks from another.
+    :param value: An IP address or network, or a list of them.
+    :param other: An IP address or network, or a list of them.
+    :return: The minimal list of networks covering the addresses of value not in other.
+    """
+    result = ip_interval_set(value, "ip_difference").difference(
+        ip_interval_set(other, "ip_difference"),
+    )
+    return result.cidrs()
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "ip_difference": _ip_difference,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
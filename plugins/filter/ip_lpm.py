@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: ip_lpm
+"""
+from __future__ import absolute_import, division, print_function
+
+from collections import OrderedDict
+from functools import partial
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_prefix_trie import PrefixTrie
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: ip_lpm
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Find the most specific prefix containing an address in a list of prefixes.
+    description:
+        - For each address, find the longest prefix in a list of prefixes, like a route lookup in a routing table.
+        - The prefixes are indexed once and the index is reused by the later calls of the task with the
+          same prefixes, ie. in a loop, passing all the addresses to a single call is still the fastest.
+        - An address with a prefix length, ie. C(10.1.1.0/24), only matches prefixes containing the whole network.
+    options:
+        value:
+            description:
+            - An IP address or network, or a list of them.
+            type: raw
+            required: True
+        prefixes:
+            description:
+            - The prefixes to match the addresses against.
+            - A list of prefixes, ie. C(['10.0.0.0/8', '10.1.0.0/16']).
+            - A dictionary of prefixes, the value of each prefix is returned as its payload.
+            - A list of dictionaries, the prefix is read from the I(key) of each dictionary and
+              the dictionary itself is returned as the payload.
+            - When a prefix is given more than once, the last one is used.
+            type: raw
+            required: True
+        key:
+            description:
+            - The key holding the prefix when I(prefixes) is a list of dictionaries.
+            type: str
+            default: prefix
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Find the most specific route for each host
+  debug:
+    msg: "{{ ['10.1.1.1', '10.2.2.2', '192.0.2.1'] | ansible.utils.ip_lpm(['10.0.0.0/8', '10.1.0.0/16']) }}"
+
+# TASK [Find the most specific route for each host] *************************************
+# ok: [localhost] => {
+#     "msg": [
+#         {
+#             "address": "10.1.1.1",
+#             "payload": null,
+#             "prefix": "10.1.0.0/16",
+#             "prefixlen": 16
+#         },
+#         {
+#             "address": "10.2.2.2",
+#             "payload": null,
+#             "prefix": "10.0.0.0/8",
+#             "prefixlen": 8
+#         },
+#         {
+#             "address": "192.0.2.1",
+#             "payload": null,
+#             "prefix": null,
+#             "prefixlen": null
+#         }
+#     ]
+# }
+
+- name: Return the next hop of the matching route
+  vars:
+    routes:
+      - destination: 0.0.0.0/0
+        next_hop: 192.0.2.1
+      - destination: 10.1.0.0/16
+        next_hop: 10.0.0.1
+  debug:
+    msg: "{{ ('10.1.2.3' | ansible.utils.ip_lpm(routes, key='destination'))['payload']['next_hop'] }}"
+
+# TASK [Return the next hop of the matching route] **************************************
+# ok: [localhost] => {
+#     "msg": "10.0.0.1"
+# }
+
+- name: Attach a payload to the prefixes with a dictionary
+  debug:
+    msg: "{{ '2001:db8:1::1' | ansible.utils.ip_lpm({'2001:db8::/32': 'lab', '2001:db8:1::/48': 'site1'}) }}"
+
+# TASK [Attach a payload to the prefixes with a dictionary] *****************************
+# ok: [localhost] => {
+#     "msg": {
+#         "address": "2001:db8:1::1",
+#         "payload": "site1",
+#         "prefix": "2001:db8:1::/48",
+#         "prefixlen": 48
+#     }
+# }
+"""
+
+RETURN = """
+  data:
+    type: raw
+    description:
+      - A dictionary with the I(address), the matching I(prefix), its I(prefixlen) and I(payload),
+        or a list of them when I(value) is a list.
+      - I(prefix), I(prefixlen) and I(payload) are null when no prefix contains the address
+        or when the address is not valid.
+"""
+
+
+@pass_environment
+def _ip_lpm(*args, **kwargs):
+    """Find the most specific prefix containing an address in a list of prefixes"""
+    keys = ["value", "prefixes", "key"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    # the prefixes are raw and checked while indexed, the validator would
+    # only deep copy the whole table on every call
+    checked = dict(data, prefixes=[]) if "prefixes" in data else data
+    aav = AnsibleArgSpecValidator(data=checked, schema=DOCUMENTATION, name="ip_lpm")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    updated_data["prefixes"] = data["prefixes"]
+    return ip_lpm(**updated_data)
+
+
+# Compiled prefix lists, keyed by the prefixes, so that a routing table
+# looked up for every item of a loop is only indexed once
+PREFIX_TRIE_CACHE_SIZE = 16
+_PREFIX_TRIE_CACHE = OrderedDict()
+
+
+def _prefix_entries(prefixes, key):
+    """Read the prefixes given to ip_lpm and their payloads
+    :param prefixes: A list of prefixes or of dictionaries, or a dictionary
+    :param key: The key holding the prefix in a list of dictionaries
+    :type key: str
+    :return: The (prefix, payload) of each prefix
+    :rtype: list
+    """
+    if isinstance(prefixes, dict):
+        return list(prefixes.items())
+    if not isinstance(prefixes, list):
+        raise AnsibleFilterError(
+            "ip_lpm: prefixes must be a list or a dictionary, got {0}".format(
+                type(prefixes).__name__,
+            ),
+        )
+    entries = []
+    for prefix in prefixes:
+        if not isinstance(prefix, dict):
+            entries.append((prefix, None))
+        elif key in prefix:
+            entries.append((prefix[key], prefix))
+        else:
+            raise AnsibleFilterError("ip_lpm: key '{0}' not found in {1}".format(key, prefix))
+    return entries
+
+
+def _prefix_trie(prefixes):
+    """Build the index of a list of prefixes, memoized on the list
+
+    The payload of each prefix in the index is its position in the list,
+    the caller looks its own payload up, so that the payloads are never
+    shared between the calls using the same index.
+    :param prefixes: The prefixes
+    :type prefixes: list
+    :rtype: PrefixTrie
+    """
+    try:
+        cache_key = tuple(prefixes)
+        trie = _PREFIX_TRIE_CACHE.get(cache_key)
+    except TypeError:
+        # an invalid prefix, the trie will complain
+        cache_key = trie = None
+    if trie is not None:
+        _PREFIX_TRIE_CACHE.move_to_end(cache_key)
+        return trie
+
+    trie = PrefixTrie()
+    for position, prefix in enumerate(prefixes):
+        try:
+            trie.add(prefix, position)
+        except (ValueError, TypeError):
+            raise AnsibleFilterError("ip_lpm: invalid prefix {0}".format(prefix))
+    if cache_key is not None:
+        _PREFIX_TRIE_CACHE[cache_key] = trie
+        if len(_PREFIX_TRIE_CACHE) > PREFIX_TRIE_CACHE_SIZE:
+            _PREFIX_TRIE_CACHE.popitem(last=False)
+    return trie
+
+
+def ip_lpm(value, prefixes, key="prefix"):
+    """
+    Find the most specific prefix containing an address in a list of prefixes.
+    :param value: An IP address or network, or a list of them.
+    :param prefixes: The prefixes to match against, see the DOCUMENTATION.
+    :param key: The key holding the prefix when prefixes is a list of dictionaries.
+    :return: The match of value, or a list of matches when value is a list.
+    """
+    if isinstance(prefixes, PrefixTrie):
+        trie, payloads = prefixes, None
+    else:
+        entries = _prefix_entries(prefixes, key)
+        trie = _prefix_trie([entry[0] for entry in entries])
+        payloads = [entry[1] for entry in entries]
+
+    def _match(address):
+        result = {"address": address, "prefix": None, "prefixlen": None, "payload": None}
+        try:
+            entry = trie.lookup(address)
+        except (ValueError, TypeError):
+            entry = None
+        if entry is not None:
+            prefix, payload = entry
+            if payloads is not None:
+                payload = payloads[payload]
+            result.update(prefix=str(prefix), prefixlen=prefix.prefixlen, payload=payload)
+        return result
+
+    if isinstance(value, (list, tuple)):
+        return [_match(address) for address in value]
+    return _match(value)
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "ip_lpm": _ip_lpm,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
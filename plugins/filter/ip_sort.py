@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: ip_sort
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    _WIDTH,
+    StdlibIPNetwork,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_prefix_bulk,
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: ip_sort
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Sort a list of IP addresses and networks in address order.
+    description:
+        - Sort IP addresses and networks on their IP version, their address as an integer, then their
+          prefix length, ie. C(10.0.0.0/8) before C(10.0.0.0/24) before C(10.0.0.1) before C(10.0.0.10).
+        - Each value is parsed once, the sort is stable, values with the same key keep their order.
+        - IPv4 and IPv6 can be mixed, the IPv4 values come first.
+        - An address without a prefix length is sorted like a C(/32) or C(/128) network.
+    options:
+        value:
+            description:
+            - A list of IP addresses and networks, ie. C(['10.0.0.10', '10.0.0.0/24']).
+            - A list of dictionaries, the address is read from the I(key) of each dictionary.
+            type: list
+            elements: raw
+            required: True
+        key:
+            description:
+            - The key holding the address when I(value) is a list of dictionaries.
+            type: str
+            default: prefix
+        reverse:
+            description:
+            - Sort in descending order.
+            type: bool
+            default: False
+        unique:
+            description:
+            - Only keep the first value of the values with the same version, address and prefix length,
+              ie. C(10.0.0.1) and C(10.0.0.1/32).
+            type: bool
+            default: False
+        output:
+            description:
+            - C(values) returns the sorted values.
+            - C(keys) returns a dictionary per value with the I(value) and its sort key, its I(version),
+              I(int) address and I(prefixlen).
+            type: str
+            choices: ['values', 'keys']
+            default: values
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Sort addresses and networks
+  debug:
+    msg: "{{ ['10.0.0.10', '2001:db8::1', '10.0.0.0/24', '10.0.0.9', '10.0.0.0/8'] | ansible.utils.ip_sort }}"
+
+# TASK [Sort addresses and networks] ****************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "10.0.0.0/8",
+#         "10.0.0.0/24",
+#         "10.0.0.9",
+#         "10.0.0.10",
+#         "2001:db8::1"
+#     ]
+# }
+
+- name: Sort and deduplicate in descending order
+  debug:
+    msg: "{{ ['10.0.0.1', '10.0.0.2', '10.0.0.1/32'] | ansible.utils.ip_sort(reverse=true, unique=true) }}"
+
+# TASK [Sort and deduplicate in descending order] ***************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "10.0.0.2",
+#         "10.0.0.1"
+#     ]
+# }
+
+- name: Sort interfaces on their address
+  vars:
+    interfaces:
+      - name: eth1
+        address: 192.168.1.10/24
+      - name: eth0
+        address: 10.0.0.1/24
+  debug:
+    msg: "{{ interfaces | ansible.utils.ip_sort(key='address') | map(attribute='name') }}"
+
+# TASK [Sort interfaces on their address] ***********************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "eth0",
+#         "eth1"
+#     ]
+# }
+
+- name: Return the sort keys
+  debug:
+    msg: "{{ ['10.0.0.1/24'] | ansible.utils.ip_sort(output='keys') }}"
+
+# TASK [Return the sort keys] ***********************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         {
+#             "int": 167772161,
+#             "prefixlen": 24,
+#             "value": "10.0.0.1/24",
+#             "version": 4
+#         }
+#     ]
+# }
+"""
+
+RETURN = """
+  data:
+    type: list
+    elements: raw
+    description:
+      - The sorted values, or a dictionary per value with I(output=keys).
+"""
+
+
+@pass_environment
+def _ip_sort(*args, **kwargs):
+    """Sort a list of IP addresses and networks"""
+    keys = ["value"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="ip_sort")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return ip_sort(**updated_data)
+
+
+def _sort_key(entry, key):
+    """Parse a value given to ip_sort into its (version << 128 | int) << 8 | prefixlen key"""
+    address = entry
+    if isinstance(entry, dict):
+        if key not in entry:
+            raise AnsibleFilterError("ip_sort: key '{0}' not found in {1}".format(key, entry))
+        address = entry[key]
+    if isinstance(address, str):
+        # only the integers are needed, skip building a prefix object
+        try:
+            ip, prefixlen, version = StdlibIPNetwork._parse(address)
+            if 0 <= prefixlen <= _WIDTH[version]:
+                return (version << 128 | ip) << 8 | prefixlen
+        except ValueError:
+            pass
+    p = _ip_prefix_bulk(address)
+    if p is None:
+        raise AnsibleFilterError("ip_sort: invalid IP address or network {0!r}".format(address))
+    return (p.version << 128 | p.value) << 8 | p.prefixlen
+
+
+def ip_sort(value, key="prefix", reverse=False, unique=False, output="values"):
+    """
+    Sort a list of IP addresses and networks.
+    :param value: A list of IP addresses and networks, or of dictionaries.
+    :param key: The key holding the address in a list of dictionaries.
+    :param reverse: Sort in descending order.
+    :param unique: Only keep the first value with a given sort key.
+    :param output: values or keys, see the DOCUMENTATION.
+    :return: The sorted values, or their sort keys.
+    """
+    sort_keys = [_sort_key(entry, key) for entry in value]
+
+    # sorting one integer per value, the sort key followed by the index,
+    # is much faster than sorting tuples, the index keeps the sort stable
+    bits = max(len(value) - 1, 0).bit_length()
+    mask = (1 << bits) - 1
+    if reverse:
+        # the index is complemented so equal keys keep their order
+        order = sorted((k << bits | (mask ^ i) for i, k in enumerate(sort_keys)), reverse=True)
+        indexes = [mask ^ (packed & mask) for packed in order]
+    else:
+        order = sorted(k << bits | i for i, k in enumerate(sort_keys))
+        indexes = [packed & mask for packed in order]
+    del order
+
+    if unique:
+        previous = None
+        kept = []
+        for index in indexes:
+            if sort_keys[index] != previous:
+                kept.append(index)
+                previous = sort_keys[index]
+        indexes = kept
+
+    if output == "keys":
+        return [
+            {
+                "value": value[index],
+                "version": sort_keys[index] >> 136,
+                "int": sort_keys[index] >> 8 & ((1 << 128) - 1),
+                "prefixlen": sort_keys[index] & 0xFF,
+            }
+            for index in indexes
+        ]
+    return [value[index] for index in indexes]
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "ip_sort": _ip_sort,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
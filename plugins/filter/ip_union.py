@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: ip_union
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_interval_set import (
+    ip_interval_set,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: ip_union
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Merge two lists of IP addresses and networks into the networks covering both.
+    description:
+        - Return the minimal list of networks covering all the addresses of I(value) and of I(other).
+        - IPv4 and IPv6 addresses can be mixed, the IPv4 networks are returned first.
+        - The host bits of the networks are ignored, ie. C(10.0.0.5/24) is C(10.0.0.0/24).
+    options:
+        value:
+            description:
+            - An IP address or network, or a list of them.
+            type: raw
+            required: True
+        other:
+            description:
+            - An IP address or network, or a list of them, to add to I(value).
+            type: raw
+            required: True
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Merge two lists of networks
+  debug:
+    msg: "{{ ['10.0.0.0/25', '2001:db8::/33'] | ansible.utils.ip_union(['10.0.0.128/25', '2001:db8:8000::/33', '10.1.0.1']) }}"
+
+# TASK [Merge two lists of networks] ***************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "10.0.0.0/24",
+#         "10.1.0.1/32",
+#         "2001:db8::/32"
+#     ]
+# }
+"""
+
+RETURN = """
+  data:
+    type: list
+    elements: str
+    description:
+      - The minimal list of networks covering the addresses of I(value) and I(other).
+"""
+
+
+@pass_environment
+def _ip_union(*args, **kwargs):
+    """Merge two lists of IP addresses and networks"""
+    keys = ["value", "other"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="ip_union")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return ip_union(**updated_data)
+
+
+def ip_union(value, other):
+    """
+    Merge two lists of IP addresses and networks.
+    :param value: An IP address or network, or a list of them.
+    :param other: An IP address or network, or a list of them.
+    :return: The minimal list of networks covering value and other.
+    """
+    result = ip_interval_set(value, "ip_union").union(ip_interval_set(other, "ip_union"))
+    return result.cidrs()
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "ip_union": _ip_union,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
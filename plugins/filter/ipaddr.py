@@ -16,6 +16,7 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
     _need_netaddr,
     ipaddr,
 )
@@ -67,6 +68,9 @@ DOCUMENTATION = """
               1. query by name: ansible.utils.ipaddr('address'), ansible.utils.ipv4('network');
               2. query by CIDR range: ansible.utils.ipaddr('192.168.0.0/24'), ansible.utils.ipv6('2001:db8::/32');
               3. query by index number: ansible.utils.ipaddr('1'), ansible.utils.ipaddr('-1');
+            - >-
+              Queries can be chained with a pipe, ie. ansible.utils.ipaddr('private|network/prefix'),
+              each query is applied to the result of the previous one.
             type: str
             default: ''
         version:
@@ -75,6 +79,13 @@ DOCUMENTATION = """
         alias:
             type: str
             description: type of filter. example ipaddr, ipv4, ipv6, ipwrap
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
     requirements:
         - netaddr>=0.10.1
@@ -296,7 +307,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipaddr filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
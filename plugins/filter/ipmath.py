@@ -11,11 +11,18 @@ from __future__ import absolute_import, division, print_function
 from functools import partial
 
 from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.validation import check_type_int
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
-from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import _need_netaddr
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import IPPrefix
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_bulk_pairs,
+    _ipaddress_backend_selected,
+    _need_netaddr,
+    ipaddr_backend,
+)
 
 
 __metaclass__ = type
@@ -47,15 +54,28 @@ DOCUMENTATION = """
     short_description: This filter is designed to do simple IP math/arithmetic.
     description:
         - This filter is designed to do simple IP math/arithmetic.
+        - I(value), I(amount) or both can be lists, the addresses are then parsed once and a list of
+          results is returned, a single I(value) or I(amount) is used with every item of the other list.
     options:
         value:
             description:
             - list of subnets or individual address or any other values input for ipaddr plugin
-            type: str
+            - A list of addresses returns a list of results.
+            type: raw
             required: True
         amount:
-            type: int
-            description: integer for arithmetic. Example -1,2,3
+            type: raw
+            description:
+            - integer for arithmetic. Example -1,2,3
+            - A list of integers returns a list of results, when I(value) is a list as well both lists
+              must have the same length.
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
 """
 
 EXAMPLES = r"""
@@ -124,13 +144,22 @@ EXAMPLES = r"""
 # ok: [localhost] => {
 #     "msg": "2000:ffff:ffff:ffff:ffff:ffff:ffff:fffb"
 # }
+
+# The first address of each VLAN interface: ['10.0.0.1', '10.0.1.1']
+- debug:
+    msg: "{{ ['10.0.0.0/24', '10.0.1.0/24'] | ansible.utils.ipmath(1) }}"
+
+# The next three addresses: ['192.168.1.6', '192.168.1.7', '192.168.1.8']
+- debug:
+    msg: "{{ '192.168.1.5' | ansible.utils.ipmath(range(1, 4)) }}"
 """
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - Returns result of IP math/arithmetic.
+      - A list of results when I(value) or I(amount) is a list.
 """
 
 
@@ -147,23 +176,58 @@ def _ipmath(*args, **kwargs):
     return ipmath(**updated_data)
 
 
-def ipmath(value, amount):
+def _amount(amount):
+    """Check the amount given to ipmath is an integer"""
     try:
-        if "/" in value:
-            ip = netaddr.IPNetwork(value).ip
-        else:
-            ip = netaddr.IPAddress(value)
-    except (netaddr.AddrFormatError, ValueError):
-        msg = "You must pass a valid IP address; {0} is invalid".format(value)
-        raise AnsibleFilterError(msg)
-
-    if not isinstance(amount, int):
+        return check_type_int(amount)
+    except TypeError:
         msg = ("You must pass an integer for arithmetic; " "{0} is not a valid integer").format(
             amount,
         )
         raise AnsibleFilterError(msg)
 
-    return str(ip + amount)
+
+def ipmath(value, amount, backend=None):
+    # both backends accept the same addresses, ipmath is integer math only
+    ipaddr_backend(backend)
+    pairs = _ip_bulk_pairs("ipmath", value, amount, "amount")
+    if pairs is not None:
+        return _ipmath_bulk(pairs)
+
+    try:
+        ip = IPPrefix.parse(value)
+    except ValueError:
+        msg = "You must pass a valid IP address; {0} is invalid".format(value)
+        raise AnsibleFilterError(msg)
+
+    return ip.format(ip.offset(_amount(amount)))
+
+
+def _ipmath_bulk(pairs):
+    """ipmath over a list of (value, amount) pairs, each address is
+    parsed once and the results are checked one by one"""
+    results = []
+    last_value = ip = None
+    for index, (value, amount) in enumerate(pairs):
+        # a single value paired with a list of amounts is parsed once
+        if ip is None or value is not last_value:
+            try:
+                ip = IPPrefix.parse(value)
+            except ValueError:
+                msg = "You must pass a valid IP address; {0} (item {1}) is invalid".format(
+                    value,
+                    index,
+                )
+                raise AnsibleFilterError(msg)
+            last_value = value
+        amount = _amount(amount)
+        try:
+            results.append(ip.format(ip.offset(amount)))
+        except IndexError as exc:
+            raise AnsibleFilterError(
+                "ipmath: {0} (item {1}) {2:+d}: {3}".format(value, index, amount, exc),
+            )
+    return results
 
 
 class FilterModule(object):
@@ -176,7 +240,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipmath filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
@@ -15,9 +15,16 @@ from ansible.errors import AnsibleFilterError
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_sequences import (
+    SubnetSequence,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_network,
+    _ipaddress_backend_selected,
     _need_netaddr,
+    _v_address,
     ipaddr,
+    ipaddr_backend,
 )
 
 
@@ -73,6 +80,35 @@ DOCUMENTATION = """
                 The second argument of the ipsubnet() filter is an index number; by specifying it you can get a new subnet
                 with the specified index.
             type: int
+        offset:
+            description:
+            - List the subnets of size I(query) of the network, starting at the subnet with this index
+              instead of returning their number. Negative indexes count from the last subnet.
+            - The subnets are returned as a lazy sequence, only the subnets read by the template are built.
+              It can be indexed, sliced or passed to the C(length) filter. Its C(size) attribute holds the
+              number of subnets, the C(length) filter fails beyond 2**63 - 1 subnets, ie. the /128 of an
+              IPv6 /32.
+            - Use the C(list) filter to loop over the sequence or store it in a variable, ie. with C(loop)
+              or C(set_fact), ansible-core does not store the lazy sequence itself.
+            type: int
+            version_added: "6.1.0"
+        limit:
+            description:
+            - List at most this number of subnets of size I(query), see I(offset).
+            type: int
+            version_added: "6.1.0"
+        step:
+            description:
+            - List every I(step)-th subnet of size I(query), see I(offset).
+            type: int
+            version_added: "6.1.0"
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -129,6 +165,16 @@ tasks:
   - name: The fifth subnet /30 in a /24
     debug:
       msg: '{{ ''192.168.144.16/30'' | ansible.utils.ipsubnet(''192.168.144.0/24'') }}'
+  - name: List the first three /20 subnets
+    debug:
+      msg: '{{ subnet | ansible.utils.ipsubnet(20, offset=0, limit=3) | list }}'
+  - name: Loop over every fourth /64 of a /48, starting at the 256th
+    debug:
+      msg: '{{ item }}'
+    loop: '{{ ''2001:db8:1::/48'' | ansible.utils.ipsubnet(64, offset=256, limit=3, step=4) | list }}'
+  - name: Count the /128 of an IPv6 /32, too many for the length filter
+    debug:
+      msg: '{{ (''2001:db8::/32'' | ansible.utils.ipsubnet(128, offset=0)).size }}'
 
 
 # PLAY [Ipsubnet filter plugin with different queries.] ****************************************************************
@@ -215,6 +261,26 @@ tasks:
 # ok: [localhost] => {
 #     "msg": "5"
 # }
+#
+# TASK [List the first three /20 subnets] *********************************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "192.168.0.0/20",
+#         "192.168.16.0/20",
+#         "192.168.32.0/20"
+#     ]
+# }
+#
+# TASK [Loop over every fourth /64 of a /48, starting at the 256th] *******************************************
+# ok: [localhost] => (item=2001:db8:1:100::/64) => {
+#     "msg": "2001:db8:1:100::/64"
+# }
+# ok: [localhost] => (item=2001:db8:1:104::/64) => {
+#     "msg": "2001:db8:1:104::/64"
+# }
+# ok: [localhost] => (item=2001:db8:1:108::/64) => {
+#     "msg": "2001:db8:1:108::/64"
+# }
 """
 
 RETURN = """
@@ -222,6 +288,7 @@ RETURN = """
     type: raw
     description:
       - Returns values valid for a particular query.
+      - A lazy sequence of subnets when I(offset), I(limit) or I(step) is set.
 """
 
 
@@ -238,18 +305,19 @@ def _ipsubnet(*args, **kwargs):
     return ipsubnet(**updated_data)
 
 
-def ipsubnet(value, query="", index=None):
+def ipsubnet(value, query="", index=None, backend=None, offset=None, limit=None, step=None):
     """Manipulate IPv4/IPv6 subnets"""
 
-    vtype = ipaddr(value, "type")
+    backend = ipaddr_backend(backend)
+    vtype = ipaddr(value, "type", backend=backend)
     if not vtype:
         return False
     elif vtype == "address":
-        v = ipaddr(value, "cidr")
+        v = ipaddr(value, "cidr", backend=backend)
     elif vtype == "network":
-        v = ipaddr(value, "subnet")
-    value = netaddr.IPNetwork(v).cidr
-    vtype = ipaddr(value, "type")
+        v = ipaddr(value, "subnet", backend=backend)
+    value = _ip_network(v, backend).cidr
+    vtype = ipaddr(value, "type", backend=backend)
 
     if not query:
         return to_text(value)
@@ -260,6 +328,9 @@ def ipsubnet(value, query="", index=None):
         if query < 0 or query > vtotalbits:
             return False
 
+        if index is None and (offset, limit, step) != (None, None, None):
+            return _subnet_sequence(value, query, offset, limit, step)
+
         if index is None:
             if vtype == "address":
                 return to_text(value.supernet(query)[0])
@@ -284,28 +355,30 @@ def ipsubnet(value, query="", index=None):
                 # subnet index out of range
                 return False
             return to_text(
-                netaddr.IPNetwork(
+                _ip_network(
                     to_text(
-                        netaddr.IPAddress(
-                            value.network.value + (index << vtotalbits - query),
+                        _v_address(
+                            value,
+                            int(value.network) + (index << vtotalbits - query),
                         ),
                     )
                     + "/"
                     + to_text(query),
+                    backend,
                 ),
             )
     else:
-        vtype = ipaddr(query, "type")
+        vtype = ipaddr(query, "type", backend=backend)
         if vtype == "address":
-            v = ipaddr(query, "cidr")
+            v = ipaddr(query, "cidr", backend=backend)
         elif vtype == "network":
-            v = ipaddr(query, "subnet")
+            v = ipaddr(query, "subnet", backend=backend)
         else:
             msg = "You must pass a valid subnet or IP address; {0} is invalid".format(
                 to_text(query),
             )
             raise AnsibleFilterError(msg)
-        query = netaddr.IPNetwork(v)
+        query = _ip_network(v, backend)
         if (
             value.value >> vtotalbits - query.prefixlen
             == query.value >> vtotalbits - query.prefixlen
@@ -327,6 +400,29 @@ def ipsubnet(value, query="", index=None):
     return False
 
 
+def _subnet_sequence(value, prefixlen, offset, limit, step):
+    """List the subnets of a network lazily
+    :param value: The network
+    :param prefixlen: The prefix length of the subnets
+    :type prefixlen: int
+    :param offset: The index of the first subnet
+    :type offset: int
+    :param limit: The maximum number of subnets
+    :type limit: int
+    :param step: List every step-th subnet
+    :type step: int
+    :rtype: SubnetSequence
+    """
+    if prefixlen < value.prefixlen:
+        msg = "Requested subnet size of {0} is invalid".format(to_text(prefixlen))
+        raise AnsibleFilterError(msg)
+    subnets = SubnetSequence(int(value.network), value.version, value.prefixlen, prefixlen)
+    try:
+        return subnets.page(offset or 0, limit, 1 if step is None else step)
+    except ValueError as e:
+        raise AnsibleFilterError("ipsubnet: {0}".format(to_text(e)))
+
+
 class FilterModule(object):
     """IP address and network manipulation filters"""
 
@@ -337,7 +433,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipsubnet filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
@@ -16,6 +16,7 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
     _need_netaddr,
     ipaddr,
 )
@@ -60,6 +61,13 @@ DOCUMENTATION = """
             - Example. query type 'ipv6' to convert ipv4 into ipv6
             type: str
             default: ''
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -158,8 +166,8 @@ def _ipv4(*args, **kwargs):
     return ipv4(**updated_data)
 
 
-def ipv4(value, query=""):
-    return ipaddr(value, query, version=4, alias="ipv4")
+def ipv4(value, query="", backend=None):
+    return ipaddr(value, query, version=4, alias="ipv4", backend=backend)
 
 
 class FilterModule(object):
@@ -172,7 +180,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipaddr filter"""
-        if netaddr:
+        if netaddr or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
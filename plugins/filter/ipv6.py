@@ -16,6 +16,7 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ipaddress_backend_selected,
     _need_netaddr,
     ipaddr,
 )
@@ -62,6 +63,13 @@ DOCUMENTATION = """
             - Example. query type 'ipv4' to convert ipv6 into ipv4
             type: str
             default: ''
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
+            type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -176,8 +184,8 @@ def _ipv6(*args, **kwargs):
     return ipv6(**updated_data)
 
 
-def ipv6(value, query=""):
-    return ipaddr(value, query, version=6, alias="ipv6")
+def ipv6(value, query="", backend=None):
+    return ipaddr(value, query, version=6, alias="ipv6", backend=backend)
 
 
 class FilterModule(object):
@@ -190,7 +198,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipv6 filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
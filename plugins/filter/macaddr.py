@@ -52,10 +52,14 @@ DOCUMENTATION = """
     - This filter check if string is a MAC address and filter it
     - You can use the macaddr() filter to check if a given string is a MAC address or convert it between various
       formats.
+    - A list of addresses returns the list of their results, the usual formats of EUI-48 addresses
+      are parsed and formatted as integers, without building a C(netaddr.EUI) per address.
     options:
         value:
-            description: HW/MAC address.
-            type: str
+            description:
+            - HW/MAC address.
+            - A list of HW/MAC addresses returns a list of results.
+            type: raw
             required: True
         query:
             description: query string. Example. cisco,linux,unix etc
@@ -83,13 +87,26 @@ EXAMPLES = r"""
 # ok: [localhost] => {
 #     "msg": "1a2b.3c4d.5e6f"
 # }
+
+- name: Convert a list of MAC addresses to Linux format
+  debug:
+    msg: "{{ ['1A2B.3C4D.5E6F', '1a-2b-3c-4d-5e-70'] | ansible.utils.macaddr('linux') }}"
+
+# TASK [Convert a list of MAC addresses to Linux format] ******************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "1a:2b:3c:4d:5e:6f",
+#         "1a:2b:3c:4d:5e:70"
+#     ]
+# }
 """
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - mac/Hw address
+      - A list of results when I(value) is a list.
 
 """
 
@@ -16,10 +16,9 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
-    _address_normalizer,
+    _ip_prefix,
     _need_netaddr,
     _range_checker,
-    ipaddr,
 )
 
 
@@ -130,15 +129,17 @@ def network_in_usable(value, test):
     :param test: The string representation of an address or network to validate if it is within the range of 'value'.
     :return: bool
     """
-    # normalize value and test variables into an ipaddr
-    v = _address_normalizer(value)
-    w = _address_normalizer(test)
+    # parse value and test variables, their host bits are not used
+    v = _ip_prefix(value)
+    w = _ip_prefix(test)
+    if v is None or w is None:
+        return False
 
     # get first and last addresses as integers to compare value and test; or cathes value when case is /32
-    v_first = ipaddr(ipaddr(v, "first_usable") or ipaddr(v, "address"), "int")
-    v_last = ipaddr(ipaddr(v, "last_usable") or ipaddr(v, "address"), "int")
-    w_first = ipaddr(ipaddr(w, "network") or ipaddr(w, "address"), "int")
-    w_last = ipaddr(ipaddr(w, "broadcast") or ipaddr(w, "address"), "int")
+    v_first, v_last = v.usable_range() or (v.network, v.network)
+    w_first = w.network
+    # /31 and /32 networks have no broadcast address, only their network is checked
+    w_last = w.broadcast if w.size > 2 else w.network
 
     if _range_checker(w_first, v_first, v_last) and _range_checker(w_last, v_first, v_last):
         return True
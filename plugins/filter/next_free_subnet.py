@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: next_free_subnet
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+from itertools import islice
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_interval_set import (
+    IPIntervalSet,
+    ip_interval_set,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    _WIDTH,
+    int_to_str,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_prefix_bulk,
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: next_free_subnet
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Find the first free subnets of a given size in a network.
+    description:
+        - Return the first subnets of the prefix length I(prefix) in the network I(value) which do not
+          overlap any of the I(used) addresses and networks, in ascending order.
+        - The free space of the network is worked out once from I(used), so the cost of the filter
+          depends on the number of used networks, not on the number of candidate subnets.
+        - Fewer than I(count) subnets, or none, are returned when the network is full.
+    options:
+        value:
+            description:
+            - The network to allocate the subnets from, ie. C(10.0.0.0/16).
+            type: str
+            required: True
+        used:
+            description:
+            - The addresses and networks already allocated, ie. C(['10.0.0.0/24', '10.0.1.5']).
+            - They may overlap each other or lie partly outside I(value).
+            type: raw
+            default: []
+        prefix:
+            description:
+            - The prefix length of the subnets, ie. C(29) for /29 subnets.
+            type: int
+            required: True
+        count:
+            description:
+            - The number of subnets to return.
+            type: int
+            default: 1
+        align:
+            description:
+            - Only return subnets starting on a boundary of this prefix length, ie. C(24) to only return
+              subnets starting at the beginning of a /24.
+            - Defaults to I(prefix), the subnets are always aligned on their own size.
+            - An I(align) larger than I(prefix) has no effect.
+            type: int
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Find the next two free /29 subnets
+  debug:
+    msg: "{{ '192.0.2.0/24' | ansible.utils.next_free_subnet(['192.0.2.0/28', '192.0.2.20'], prefix=29, count=2) }}"
+
+# TASK [Find the next two free /29 subnets] *****************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "192.0.2.24/29",
+#         "192.0.2.32/29"
+#     ]
+# }
+
+- name: Find the next free /26 starting on a /25 boundary
+  debug:
+    msg: "{{ '192.0.2.0/24' | ansible.utils.next_free_subnet(['192.0.2.0/28'], prefix=26, align=25) }}"
+
+# TASK [Find the next free /26 starting on a /25 boundary] **************************
+# ok: [localhost] => {
+#     "msg": [
+#         "192.0.2.128/26"
+#     ]
+# }
+"""
+
+RETURN = """
+  data:
+    type: list
+    elements: str
+    description:
+      - The free subnets, in ascending order.
+"""
+
+
+@pass_environment
+def _next_free_subnet(*args, **kwargs):
+    """Find the first free subnets of a given size in a network"""
+    keys = ["value", "used"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="next_free_subnet")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return next_free_subnet(**updated_data)
+
+
+def next_free_subnet(value, prefix, used=None, count=1, align=None):
+    """
+    Find the first free subnets of a given size in a network.
+    :param value: The network to allocate the subnets from.
+    :param prefix: The prefix length of the subnets.
+    :param used: The addresses and networks already allocated.
+    :param count: The number of subnets to return.
+    :param align: The prefix length the subnets start on a boundary of.
+    :return: The free subnets, in ascending order.
+    """
+    network = _ip_prefix_bulk(value)
+    if network is None:
+        raise AnsibleFilterError(
+            "next_free_subnet: invalid IP network {0!r}".format(value),
+        )
+    if not network.prefixlen <= prefix <= _WIDTH[network.version]:
+        raise AnsibleFilterError(
+            "next_free_subnet: invalid prefix /{0} for the network {1}".format(prefix, value),
+        )
+    if count < 0:
+        raise AnsibleFilterError(
+            "next_free_subnet: count must not be negative, got {0}".format(count),
+        )
+    if align is not None and not 0 <= align <= _WIDTH[network.version]:
+        raise AnsibleFilterError(
+            "next_free_subnet: invalid align /{0} for the network {1}".format(align, value),
+        )
+
+    version = network.version
+    free = IPIntervalSet({version: [(network.network, network.broadcast)]}).difference(
+        ip_interval_set(used or [], "next_free_subnet"),
+    )
+    return [
+        "{0}/{1}".format(int_to_str(subnet, version), prefix)
+        for subnet in islice(free.subnets(version, prefix, align), count)
+    ]
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "next_free_subnet": _next_free_subnet,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
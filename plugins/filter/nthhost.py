@@ -16,8 +16,11 @@ from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_valid
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_bulk_pairs,
+    _ip_prefix,
+    _ip_prefix_bulk,
+    _ipaddress_backend_selected,
     _need_netaddr,
-    ipaddr,
 )
 
 
@@ -51,14 +54,28 @@ DOCUMENTATION = """
     description:
     - This filter returns the nth host within a network described by value. To return the nth ip from a network, use the filter nthhost.
     - Nthhost also supports a negative value.
+    - I(value), I(query) or both can be lists, the networks are then parsed once and a list of results
+      is returned, a single I(value) or I(query) is used with every item of the other list.
     options:
         value:
-            description: The network address or range to test against.
-            type: str
+            description:
+            - The network address or range to test against.
+            - A list of networks returns a list of results.
+            type: raw
             required: True
         query:
-            description: nth host
+            description:
+            - nth host
+            - A list of indexes returns a list of results, when I(value) is a list as well both lists
+              must have the same length.
+            type: raw
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
             type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -85,13 +102,26 @@ EXAMPLES = r"""
 # ok: [localhost] => {
 #     "msg": "10.255.255.255"
 # }
+
+- name: nthhost also accepts a list of networks or of indexes.
+  debug:
+    msg: "{{ ['10.0.0.0/24', '10.0.1.0/24'] | ansible.utils.nthhost(1) }}"
+
+# TASK [nthhost also accepts a list of networks or of indexes.] ***********************************************
+# ok: [localhost] => {
+#     "msg": [
+#         "10.0.0.1",
+#         "10.0.1.1"
+#     ]
+# }
 """
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - Returns nth host from network
+      - A list of results when I(value) or I(query) is a list.
 
 """
 
@@ -109,26 +139,47 @@ def _nthhost(*args, **kwargs):
     return nthhost(**updated_data)
 
 
-def nthhost(value, query=""):
+def nthhost(value, query="", backend=None):
     """Returns the nth host within a network described by value."""
+    pairs = _ip_bulk_pairs("nthhost", value, query, "query")
+    if pairs is not None:
+        results = []
+        last_value = prefix = None
+        for index, (item, nth) in enumerate(pairs):
+            # a single network paired with a list of indexes is parsed once
+            if index == 0 or item is not last_value:
+                prefix = _nthhost_prefix(item, backend, bulk=True)
+                last_value = item
+            results.append(_nth_host(prefix, nth))
+        return results
+
+    return _nth_host(_nthhost_prefix(value, backend), query)
+
+
+def _nthhost_prefix(value, backend, bulk=False):
+    """Parse the network given to nthhost, None if it is not valid"""
     try:
-        vtype = ipaddr(value, "type")
-        if vtype == "address":
-            v = ipaddr(value, "cidr")
-        elif vtype == "network":
-            v = ipaddr(value, "subnet")
-
-        value = netaddr.IPNetwork(v)
+        return (_ip_prefix_bulk if bulk else _ip_prefix)(value, backend)
     except Exception:
+        return None
+
+
+def _nth_host(value, query):
+    """Returns the nth host of a parsed network, False if there is none"""
+    if value is None:
         return False
 
-    if not query:
+    if query is None or query == "":
         return False
 
     try:
-        nth = int(query)
+        nth = int(str(query))
         if value.size > nth:
-            return str(value[nth])
+            if nth < 0:
+                nth += value.size
+                if nth < 0:
+                    raise IndexError("index out range for address range size!")
+            return value.format(value.network + nth)
 
     except ValueError:
         return False
@@ -146,7 +197,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipaddr filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+filter plugin file for ipaddr filters: prefix_overlaps
+"""
+from __future__ import absolute_import, division, print_function
+
+from functools import partial
+from itertools import islice
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
+    AnsibleArgSpecValidator,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_overlaps import (
+    overlapping_groups,
+    overlapping_pairs,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_prefix_bulk,
+    _ipaddress_backend_selected,
+    _need_netaddr,
+)
+
+
+__metaclass__ = type
+
+
+try:
+    from jinja2.filters import pass_environment
+except ImportError:
+    from jinja2.filters import environmentfilter as pass_environment
+
+try:
+    import netaddr  # noqa: F401
+
+    HAS_NETADDR = True
+except ImportError:
+    # in this case, we'll make the filters return error messages (see bottom)
+    HAS_NETADDR = False
+
+DOCUMENTATION = """
+    name: prefix_overlaps
+    author: Ansible Community
+    version_added: "6.1.0"
+    short_description: Find the overlapping prefixes in a list of prefixes.
+    description:
+        - Find the prefixes of a list which overlap, ie. duplicate or contain, another prefix of the list.
+        - The prefixes are sorted once and swept in order, rather than compared pair by pair, so the
+          filter can check lists of hundreds of thousands of prefixes.
+        - The host bits of the prefixes are ignored, ie. C(10.0.0.5/24) is C(10.0.0.0/24).
+        - IPv4 and IPv6 prefixes can be mixed, they never overlap.
+    options:
+        value:
+            description:
+            - A list of prefixes, ie. C(['10.0.0.0/8', '10.1.0.0/16']).
+            - A list of dictionaries, the prefix is read from the I(key) of each dictionary.
+            type: list
+            elements: raw
+            required: True
+        key:
+            description:
+            - The key holding the prefix when I(value) is a list of dictionaries.
+            type: str
+            default: prefix
+        output:
+            description:
+            - C(pairs) returns every pair of prefixes where one contains the other.
+            - C(groups) returns every top-level prefix, one no other prefix of the list contains, together
+              with everything it contains, nested prefixes included. A nested prefix containing others is
+              not reported as a group of its own, use C(pairs) to find every containing prefix.
+            type: str
+            choices: ['pairs', 'groups']
+            default: pairs
+        stop_at_first:
+            description:
+            - Stop at the first overlap found and only return it, to check a list quickly.
+            type: bool
+            default: False
+    notes:
+"""
+
+EXAMPLES = r"""
+
+#### examples
+- name: Find the overlapping prefixes
+  debug:
+    msg: "{{ ['10.0.0.0/16', '192.0.2.0/24', '10.0.1.0/24', '192.0.2.0/24'] | ansible.utils.prefix_overlaps }}"
+
+# TASK [Find the overlapping prefixes] **************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         {
+#             "index": 0,
+#             "other": "10.0.1.0/24",
+#             "other_index": 2,
+#             "prefix": "10.0.0.0/16",
+#             "relation": "contains"
+#         },
+#         {
+#             "index": 1,
+#             "other": "192.0.2.0/24",
+#             "other_index": 3,
+#             "prefix": "192.0.2.0/24",
+#             "relation": "duplicate"
+#         }
+#     ]
+# }
+
+- name: Group the overlapping prefixes
+  debug:
+    msg: "{{ ['10.0.0.0/16', '10.0.1.0/24', '10.0.2.0/24', '10.1.0.0/16'] | ansible.utils.prefix_overlaps(output='groups') }}"
+
+# TASK [Group the overlapping prefixes] *************************************************
+# ok: [localhost] => {
+#     "msg": [
+#         [
+#             "10.0.0.0/16",
+#             "10.0.1.0/24",
+#             "10.0.2.0/24"
+#         ]
+#     ]
+# }
+
+- name: Fail when site prefixes overlap
+  vars:
+    sites:
+      - name: site1
+        prefix: 10.1.0.0/16
+      - name: site2
+        prefix: 10.1.128.0/17
+  assert:
+    that: "{{ sites | ansible.utils.prefix_overlaps(stop_at_first=true) | length == 0 }}"
+"""
+
+RETURN = """
+  data:
+    type: list
+    elements: raw
+    description:
+      - With I(output=pairs), a list of dictionaries with the containing I(prefix), the I(other)
+        prefix it contains, their I(index) and I(other_index) in I(value) and the I(relation),
+        C(contains) or C(duplicate) when both prefixes are the same network.
+      - With I(output=groups), a list of lists of prefixes, each one starting with a top-level prefix
+        followed by all the prefixes it contains.
+      - The pairs and groups are in the order of the prefixes' addresses, IPv4 first.
+      - The prefixes are returned as given in I(value).
+"""
+
+
+@pass_environment
+def _prefix_overlaps(*args, **kwargs):
+    """Find the overlapping prefixes in a list of prefixes"""
+    keys = ["value"]
+    data = dict(zip(keys, args[1:]))
+    data.update(kwargs)
+    aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="prefix_overlaps")
+    valid, errors, updated_data = aav.validate()
+    if not valid:
+        raise AnsibleFilterError(errors)
+    return prefix_overlaps(**updated_data)
+
+
+def _prefix_values(value, key):
+    """The prefixes of the list given to prefix_overlaps"""
+    values = []
+    for entry in value:
+        if isinstance(entry, dict):
+            if key not in entry:
+                raise AnsibleFilterError(
+                    "prefix_overlaps: key '{0}' not found in {1}".format(key, entry),
+                )
+            entry = entry[key]
+        values.append(entry)
+    return values
+
+
+def prefix_overlaps(value, key="prefix", output="pairs", stop_at_first=False):
+    """
+    Find the overlapping prefixes in a list of prefixes.
+    :param value: A list of prefixes or of dictionaries.
+    :param key: The key holding the prefix in a list of dictionaries.
+    :param output: pairs or groups, see the DOCUMENTATION.
+    :param stop_at_first: Only return the first overlap.
+    :return: The overlapping pairs or groups of prefixes.
+    """
+    values = _prefix_values(value, key)
+    prefixes = []
+    for prefix in values:
+        p = _ip_prefix_bulk(prefix)
+        if p is None:
+            raise AnsibleFilterError("prefix_overlaps: invalid prefix {0!r}".format(prefix))
+        prefixes.append(p)
+
+    limit = 1 if stop_at_first else None
+    if output == "groups":
+        return [
+            [values[index] for index in group]
+            for group in islice(overlapping_groups(prefixes), limit)
+        ]
+
+    result = []
+    for index, other_index in islice(overlapping_pairs(prefixes), limit):
+        same = prefixes[index].prefixlen == prefixes[other_index].prefixlen
+        result.append(
+            {
+                "prefix": values[index],
+                "index": index,
+                "other": values[other_index],
+                "other_index": other_index,
+                "relation": "duplicate" if same else "contains",
+            },
+        )
+    return result
+
+
+class FilterModule(object):
+    """IP address and network manipulation filters"""
+
+    filter_map = {
+        # IP addresses and networks
+        "prefix_overlaps": _prefix_overlaps,
+    }
+
+    def filters(self):
+        """ipaddr filter"""
+        if HAS_NETADDR or _ipaddress_backend_selected():
+            return self.filter_map
+        else:
+            return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
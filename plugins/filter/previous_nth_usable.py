@@ -11,14 +11,16 @@ from __future__ import absolute_import, division, print_function
 from functools import partial
 
 from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.validation import check_type_int
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
-    _first_last,
+    _ip_bulk_pairs,
+    _ip_prefix,
+    _ip_prefix_bulk,
     _need_netaddr,
-    ipaddr,
 )
 
 
@@ -52,17 +54,22 @@ DOCUMENTATION = """
     description:
         - This filter returns the previous nth usable ip within a network described by value.
         - Use previous_nth_usable to find the previous nth usable IP address in relation to another within a range
+        - I(value), I(offset) or both can be lists, the addresses are then parsed once and a list of
+          results is returned, a single I(value) or I(offset) is used with every item of the other list.
     options:
         value:
             description:
             - subnets or individual address input for previous_nth_usable plugin
-            type: str
+            - A list of addresses returns a list of results.
+            type: raw
             required: True
         offset:
             description:
             - index value
             - previous nth usable IP address
-            type: int
+            - A list of integers returns a list of results, when I(value) is a list as well both lists
+              must have the same length.
+            type: raw
     notes:
 """
 
@@ -93,9 +100,11 @@ EXAMPLES = r"""
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - Returns the previous nth usable ip within a network described by value.
+      - A list of results when I(value) or I(offset) is a list, with a null result for each address
+        without a usable address at I(offset) and C(False) for each invalid address.
 """
 
 
@@ -116,29 +125,47 @@ def previous_nth_usable(value, offset):
     """
     Returns the previous nth usable ip within a network described by value.
     """
+    pairs = _ip_bulk_pairs("previous_nth_usable", value, offset, "offset")
+    if pairs is not None:
+        results = []
+        last_value = v = None
+        for index, (item, item_offset) in enumerate(pairs):
+            # a single address paired with a list of offsets is parsed once
+            if index == 0 or item is not last_value:
+                try:
+                    v = _ip_prefix_bulk(item)
+                except Exception:
+                    v = None
+                last_value = item
+            results.append(_nth_usable(v, _offset(item_offset)) if v is not None else False)
+        return results
+
     try:
-        v = None
-        vtype = ipaddr(value, "type")
-        if vtype == "address":
-            v = ipaddr(value, "cidr")
-        elif vtype == "network":
-            v = ipaddr(value, "subnet")
-
-        if v is not None:
-            v = netaddr.IPNetwork(v)
-        else:
+        v = _ip_prefix(value)
+        if v is None:
             return False
-
     except Exception:
         return False
 
-    if not isinstance(offset, int):
+    return _nth_usable(v, _offset(offset))
+
+
+def _offset(offset):
+    """Check the offset is an integer"""
+    try:
+        return check_type_int(offset)
+    except TypeError:
         raise AnsibleFilterError("Must pass in an integer")
+
+
+def _nth_usable(v, offset):
+    """Returns the previous nth usable ip of a parsed address, None if there is none"""
     if v.size > 1:
-        first_usable, last_usable = _first_last(v)
-        nth_ip = int(netaddr.IPAddress(int(v.ip) - offset))
+        first_usable, last_usable = v.usable_range()
+        nth_ip = v.value - offset
         if nth_ip >= first_usable and nth_ip <= last_usable:
-            return str(netaddr.IPAddress(int(v.ip) - offset))
+            return v.format(nth_ip)
+    return None
 
 
 class FilterModule(object):
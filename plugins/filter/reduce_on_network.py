@@ -15,11 +15,12 @@ from ansible.errors import AnsibleFilterError
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_prefix_trie import PrefixTrie
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import IPPrefix
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
-    _address_normalizer,
+    _ip_prefix_bulk,
+    _ipaddress_backend_selected,
     _need_netaddr,
-    _range_checker,
-    ipaddr,
 )
 
 
@@ -60,8 +61,10 @@ DOCUMENTATION = """
             elements: str
             required: True
         network:
-            description: The network to validate against.
-            type: str
+            description:
+            - The network to validate against.
+            - A list of networks can be given, the addresses are then grouped by the networks they belong to.
+            type: raw
     notes:
 """
 
@@ -79,6 +82,23 @@ EXAMPLES = r"""
 #         "192.168.0.34"
 #     ]
 # }
+
+- name: Group addresses by the networks they belong to
+  debug:
+    msg: "{{ ['192.168.0.34', '10.3.0.3', '192.168.2.34'] | ansible.utils.reduce_on_network(['192.168.0.0/16', '192.168.0.0/24']) }}"
+
+# TASK [Group addresses by the networks they belong to] *******************************
+# ok: [localhost] => {
+#     "msg": {
+#         "192.168.0.0/16": [
+#             "192.168.0.34",
+#             "192.168.2.34"
+#         ],
+#         "192.168.0.0/24": [
+#             "192.168.0.34"
+#         ]
+#     }
+# }
 """
 
 RETURN = """
@@ -86,6 +106,7 @@ RETURN = """
     type: bool
     description:
       - Returns the filtered list of addresses belonging to the network.
+      - When I(network) is a list, returns a dictionary of each network and the list of addresses belonging to it.
 
 """
 
@@ -107,31 +128,67 @@ def reduce_on_network(value, network):
     """
     Reduces a list of addresses to only the addresses that match a given network.
     :param: value: The list of addresses to filter on.
-    :param: network: The network to validate against.
-    :return: The reduced list of addresses.
+    :param: network: The network to validate against, or a list of networks.
+    :return: The reduced list of addresses, or the addresses grouped per network.
     """
-    # normalize network variable into an ipaddr
-    n = _address_normalizer(network)
+    if isinstance(network, (list, tuple)):
+        return _group_on_networks(value, network)
 
-    # get first and last addresses as integers to compare value and test; or cathes value when case is /32
-    n_first = ipaddr(ipaddr(n, "network") or ipaddr(n, "address"), "int")
-    n_last = ipaddr(ipaddr(n, "broadcast") or ipaddr(n, "address"), "int")
+    # parse the network once, each address is then checked with two integer comparisons
+    n = _ip_prefix_bulk(network)
+    if n is None:
+        return []
+    n_first, n_last, n_version = n.network, n.broadcast, n.version
 
     # create an empty list to fill and return
     r = []
 
     for address in value:
-        # normalize address variables into an ipaddr
-        a = _address_normalizer(address)
+        # the host bits of an address with a prefix length are not used,
+        # the whole network of the address has to be in network
+        a = _ip_prefix_bulk(address)
+        if a is not None and a.version == n_version:
+            if n_first <= a.network and a.broadcast <= n_last:
+                r.append(address)
+
+    return r
+
 
-        # get first and last addresses as integers to compare value and test; or cathes value when case is /32
-        a_first = ipaddr(ipaddr(a, "network") or ipaddr(a, "address"), "int")
-        a_last = ipaddr(ipaddr(a, "broadcast") or ipaddr(a, "address"), "int")
+def _group_on_networks(value, networks):
+    """
+    Group a list of addresses by the networks they are in.
+    :param: value: The list of addresses to group.
+    :param: networks: The list of networks.
+    :return: A dictionary of each network and the list of its addresses.
+    """
+    for network in networks:
+        if not isinstance(network, str):
+            raise AnsibleFilterError(
+                "reduce_on_network: networks must be strings, got {0}".format(
+                    type(network).__name__,
+                ),
+            )
+    groups = dict((network, []) for network in networks)
+
+    # networks with the same prefix written differently share a node of the trie
+    prefixes = {}
+    for network in groups:
+        n = _ip_prefix_bulk(network)
+        if n is not None:
+            prefixes.setdefault((n.network, n.prefixlen, n.version), []).append(network)
+    trie = PrefixTrie()
+    for (first, prefixlen, version), names in prefixes.items():
+        trie.add(IPPrefix(first, prefixlen, version), names)
 
-        if _range_checker(a_first, n_first, n_last) and _range_checker(a_last, n_first, n_last):
-            r.append(address)
+    for address in value:
+        a = _ip_prefix_bulk(address)
+        if a is None:
+            continue
+        for _prefix, names in trie.matches_int(a.network, a.version, a.prefixlen):
+            for name in names:
+                groups[name].append(address)
 
-    return r
+    return groups
 
 
 class FilterModule(object):
@@ -144,7 +201,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipaddr filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
@@ -15,10 +15,19 @@ from ansible.errors import AnsibleFilterError
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
 )
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    eui64_ipv6,
+    mac_to_int,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _hwaddr_str,
+    _ip_bulk_pairs,
+    _ip_network,
+    _ipaddress_backend_selected,
     _need_netaddr,
     hwaddr,
     ipaddr,
+    ipaddr_backend,
 )
 
 
@@ -52,14 +61,28 @@ DOCUMENTATION = """
     description:
     - This filter returns the SLAAC address within a network for a given HW/MAC address.
     - The filter slaac() generates an IPv6 address for a given network and a MAC Address in Stateless Configuration.
+    - I(value), I(query) or both can be lists, the networks and MAC addresses are then parsed once and a list of
+      results is returned, a single I(value) or I(query) is used with every item of the other list.
     options:
         value:
-            description: The network address or range to test against.
-            type: str
+            description:
+            - The network address or range to test against.
+            - A list of networks returns a list of results.
+            type: raw
             required: True
         query:
-            description: nth host
+            description:
+            - The MAC address.
+            - A list of MAC addresses returns a list of results, when I(value) is a list as well both lists
+              must have the same length.
+            type: raw
+        backend:
+            description:
+            - The library used to work on the addresses, defaults to netaddr.
+            - The default can be changed with the C(ANSIBLE_UTILS_IPADDR_BACKEND) environment variable.
             type: str
+            choices: ['netaddr', 'ipaddress']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -69,6 +92,10 @@ EXAMPLES = r"""
   debug:
     msg: "{{ 'fdcf:1894:23b5:d38c:0000:0000:0000:0000' | slaac('c2:31:b3:83:bf:2b') }}"
 
+- name: The SLAAC addresses of a list of MAC addresses in a network.
+  debug:
+    msg: "{{ '2001:db8::/64' | ansible.utils.slaac(['c2:31:b3:83:bf:2b', 'c231.b383.bf2c']) }}"
+
 # TASK [The filter slaac() generates an IPv6 address for a given network and a MAC Address in Stateless Configuration.] ***
 # task path: /Users/amhatre/ansible-collections/playbooks/test_slaac.yaml:7
 # Loading collection ansible.utils from /Users/amhatre/ansible-collections/collections/ansible_collections/ansible/utils
@@ -79,9 +106,10 @@ EXAMPLES = r"""
 
 RETURN = """
   data:
-    type: str
+    type: raw
     description:
       - Returns the SLAAC address within a network for a given HW/MAC address.
+      - A list of results when I(value) or I(query) is a list.
 
 """
 
@@ -99,25 +127,56 @@ def _slaac(*args, **kwargs):
     return slaac(**updated_data)
 
 
-def slaac(value, query=""):
+def slaac(value, query="", backend=None):
     """Get the SLAAC address within given network"""
+    backend = ipaddr_backend(backend)
+    pairs = _ip_bulk_pairs("slaac", value, query, "query")
+    if pairs is not None:
+        results = []
+        last_value = network = None
+        for index, (item, mac) in enumerate(pairs):
+            # a single network paired with a list of MAC addresses is parsed once
+            if index == 0 or item is not last_value:
+                network = _slaac_network(_hwaddr_str(item), backend)
+                last_value = item
+            results.append(_slaac_address(network, _hwaddr_str(mac), backend))
+        return results
+
+    return _slaac_address(_slaac_network(_hwaddr_str(value), backend), _hwaddr_str(query), backend)
+
+
+def _slaac_network(value, backend):
+    """Parse the network given to slaac, None if it is not an IPv6 network"""
     try:
-        vtype = ipaddr(value, "type")
+        vtype = ipaddr(value, "type", backend=backend)
         if vtype == "address":
-            v = ipaddr(value, "cidr")
+            v = ipaddr(value, "cidr", backend=backend)
         elif vtype == "network":
-            v = ipaddr(value, "subnet")
+            v = ipaddr(value, "subnet", backend=backend)
 
-        if ipaddr(value, "version") != 6:
-            return False
+        if ipaddr(value, "version", backend=backend) != 6:
+            return None
 
-        value = netaddr.IPNetwork(v)
+        return _ip_network(v, backend)
     except Exception:
+        return None
+
+
+def _slaac_address(value, query, backend):
+    """Get the SLAAC address of a MAC address within a parsed network"""
+    if value is None:
         return False
 
     if not query:
         return False
 
+    # EUI-48 addresses are worked out as integers with both backends
+    try:
+        return str(eui64_ipv6(mac_to_int(query), value))
+    except ValueError:
+        if backend == "ipaddress":
+            return False
+
     try:
         mac = hwaddr(query, alias="slaac")
 
@@ -138,7 +197,7 @@ class FilterModule(object):
 
     def filters(self):
         """ipaddr filter"""
-        if HAS_NETADDR:
+        if HAS_NETADDR or _ipaddress_backend_selected():
             return self.filter_map
         else:
             return dict((f, partial(_need_netaddr, f)) for f in self.filter_map)
@@ -9,8 +9,11 @@ Filter plugin file for usable_range
 
 from __future__ import absolute_import, division, print_function
 
-from ipaddress import IPv4Network, IPv6Network
+from functools import partial
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_sequences import (
+    AddressSequence,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_ipaddress,
     ip_network,
@@ -31,6 +34,8 @@ DOCUMENTATION = """
     short_description: Expand the usable IP addresses
     description:
         - For a given IP address (IPv4 or IPv6) in CIDR form, the plugin generates a list of usable IP addresses belonging to the network.
+        - Use I(start) and I(count) to list a window of the addresses of a large network, or I(output=range)
+          to only get the first and last address.
     options:
         ip:
             description:
@@ -38,6 +43,40 @@ DOCUMENTATION = """
             - 'For example: C(10.0.0.0/24) or C(2001:db8:abcd:0012::0/124)'
             type: str
             required: True
+        start:
+            description:
+            - The index of the first address to list, negative indexes count from the last address.
+            type: int
+            default: 0
+            version_added: "6.1.0"
+        count:
+            description:
+            - The number of addresses to list from I(start), defaults to all the remaining addresses.
+            type: int
+            version_added: "6.1.0"
+        max_items:
+            description:
+            - The maximum number of addresses to list with I(output=list), larger windows fail
+              instead of building the list. No limit by default.
+            - With I(output=lazy), the maximum number of addresses the sequence can be iterated over.
+            - Use I(start) and I(count), or another I(output), to work on larger networks.
+            type: int
+            version_added: "6.1.0"
+        output:
+            description:
+            - C(list) returns the addresses as a list under the key C(usable_ips).
+            - C(range) returns the first and last address of the window under the keys C(first_ip) and
+              C(last_ip) and their number under the key C(count), without listing them.
+            - C(lazy) returns the addresses under the key C(usable_ips) as a lazy sequence, which builds
+              each address when it is read. It can be indexed, sliced or sampled whatever its size.
+            - Use the C(list) filter to loop over the lazy sequence or store it in a variable, ie. with
+              C(loop) or C(set_fact), ansible-core does not store the lazy sequence itself. This builds
+              the list of all its addresses and fails beyond I(max_items), slice it first on a large
+              network, ie. C(usable_ips[:100] | list).
+            type: str
+            default: list
+            choices: ['list', 'range', 'lazy']
+            version_added: "6.1.0"
     notes:
 """
 
@@ -143,6 +182,73 @@ EXAMPLES = r"""
 # changed: [localhost] => (item=127.0.0.13)
 # changed: [localhost] => (item=127.0.0.14)
 # changed: [localhost] => (item=127.0.0.15)
+
+#### Large networks
+
+- name: List the third block of 4 addresses of a /16
+  ansible.builtin.set_fact:
+    data: "{{ '10.1.0.0/16' | ansible.utils.usable_range(start=8, count=4) }}"
+
+# TASK [List the third block of 4 addresses of a /16] ****************************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": {
+#             "number_of_ips": 65536,
+#             "usable_ips": [
+#                 "10.1.0.8",
+#                 "10.1.0.9",
+#                 "10.1.0.10",
+#                 "10.1.0.11"
+#             ]
+#         }
+#     },
+#     "changed": false
+# }
+
+- name: Get the bounds of an IPv6 /64 without listing its addresses
+  ansible.builtin.set_fact:
+    data: "{{ '2001:db8::/64' | ansible.utils.usable_range(output='range') }}"
+
+# TASK [Get the bounds of an IPv6 /64 without listing its addresses] **************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": {
+#             "count": 18446744073709551616,
+#             "first_ip": "2001:db8::",
+#             "last_ip": "2001:db8::ffff:ffff:ffff:ffff",
+#             "number_of_ips": 18446744073709551616
+#         }
+#     },
+#     "changed": false
+# }
+
+- name: Pick a random address of a /8
+  ansible.builtin.set_fact:
+    data: "{{ ('10.0.0.0/8' | ansible.utils.usable_range(output='lazy')).usable_ips | random }}"
+
+# TASK [Pick a random address of a /8] *******************************************************
+# ok: [localhost] => {
+#     "ansible_facts": {
+#         "data": "10.142.7.201"
+#     },
+#     "changed": false
+# }
+
+- name: Loop over the first three addresses of a /8
+  ansible.builtin.debug:
+    msg: "{{ item }}"
+  loop: "{{ ('10.0.0.0/8' | ansible.utils.usable_range(output='lazy')).usable_ips[:3] | list }}"
+
+# TASK [Loop over the first three addresses of a /8] *****************************************
+# ok: [localhost] => (item=10.0.0.0) => {
+#     "msg": "10.0.0.0"
+# }
+# ok: [localhost] => (item=10.0.0.1) => {
+#     "msg": "10.0.0.1"
+# }
+# ok: [localhost] => (item=10.0.0.2) => {
+#     "msg": "10.0.0.2"
+# }
 """
 
 RETURN = """
@@ -150,30 +256,68 @@ RETURN = """
         description:
         - Total number of usable IP addresses under the key C(number_of_ips)
         - List of usable IP addresses under the key C(usable_ips)
+        - With I(output=range), the first and last address under the keys C(first_ip) and C(last_ip)
+          and the number of addresses between them under the key C(count)
 """
 
 
+def _format_address(address_type, value):
+    """Format an address given as an integer with an ipaddress type"""
+    return to_text(address_type(value))
+
+
 @_need_ipaddress
-def _usable_range(ip):
+def _usable_range(ip, start=None, count=None, max_items=None, output=None):
     """Expand the usable IP addresses"""
 
-    params = {"ip": ip}
-    _validate_args("usable_range", DOCUMENTATION, params)
+    params = {"ip": ip, "start": start, "count": count, "max_items": max_items, "output": output}
+    params = _validate_args(
+        "usable_range",
+        DOCUMENTATION,
+        dict((k, v) for k, v in params.items() if v is not None),
+    )
 
-    try:
-        if ip_network(ip).version == 4:
-            ips = [to_text(usable_ips) for usable_ips in IPv4Network(to_text(ip))]
-            no_of_ips = IPv4Network(to_text(ip)).num_addresses
-        if ip_network(ip).version == 6:
-            ips = [to_text(usable_ips) for usable_ips in IPv6Network(to_text(ip))]
-            no_of_ips = IPv6Network(to_text(ip)).num_addresses
+    if params.get("count") is not None and params["count"] < 0:
+        raise AnsibleFilterError(
+            "Error while using plugin 'usable_range': count must not be negative, got {0}".format(
+                params["count"],
+            ),
+        )
 
+    try:
+        network = ip_network(ip)
+        formatter = None
+        if network.version == 6:
+            # keep the ipaddress format, ie. for the IPv4 mapped addresses
+            formatter = partial(_format_address, type(network.network_address))
+        addresses = AddressSequence(
+            int(network.network_address),
+            network.version,
+            network.prefixlen,
+            formatter=formatter,
+            max_items=params.get("max_items"),
+        ).page(params["start"], params["count"])
     except Exception as e:
         raise AnsibleFilterError(
             "Error while using plugin 'usable_range': {msg}".format(msg=to_text(e)),
         )
 
-    return {"usable_ips": ips, "number_of_ips": no_of_ips}
+    result = {"number_of_ips": network.num_addresses}
+    if params["output"] == "range":
+        result["count"] = addresses.size
+        result["first_ip"] = addresses[0] if addresses.size else None
+        result["last_ip"] = addresses[-1] if addresses.size else None
+    elif params["output"] == "lazy":
+        result["usable_ips"] = addresses
+    elif params.get("max_items") is not None and addresses.size > params["max_items"]:
+        raise AnsibleFilterError(
+            "Error while using plugin 'usable_range': {0} has {1} addresses to list, more than "
+            "max_items {2}; use start and count to list fewer addresses, or output=range or "
+            "output=lazy".format(to_text(ip), addresses.size, params["max_items"]),
+        )
+    else:
+        result["usable_ips"] = list(addresses)
+    return result
 
 
 class FilterModule(object):
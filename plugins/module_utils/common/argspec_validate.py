@@ -85,6 +85,164 @@ VALID_ANSIBLEMODULE_ARGS = (
 
 BASE_ARG_AVAIL = 2.11
 
+# Process wide cache of compiled schemas, keyed by the schema (the
+# DOCUMENTATION string for doc format schemas) and its conditionals.
+# Filters and tests validate their arguments on every call, without the
+# cache each of those calls would parse the DOCUMENTATION yaml again.
+_SCHEMA_CACHE = {}
+_SCHEMA_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+# Option types which can be checked with isinstance alone, the validated
+# value is the same as the one passed in so no coercion is needed
+_FAST_SCALARS = (str, int, float, bool)
+_FAST_TYPES = {
+    "bool": (bool,),
+    "float": (float,),
+    "int": (int,),
+    "list": (list,),
+    "raw": _FAST_SCALARS,
+    "str": (str,),
+}
+_FAST_OPTION_KEYS = frozenset(("type", "required", "default", "elements", "choices"))
+
+
+def _freeze(obj):
+    """Convert a nested dict/list structure into a hashable one
+    :param obj: The object to freeze
+    :type obj: any
+    :return: A hashable representation of obj
+    :rtype: any
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(value) for value in obj)
+    if isinstance(obj, set):
+        return frozenset(_freeze(value) for value in obj)
+    return obj
+
+
+def schema_cache_info():
+    """Return statistics about the compiled schema cache
+    :return: hits, misses and the number of cached schemas
+    :rtype: dict
+    """
+    info = dict(_SCHEMA_CACHE_STATS)
+    info["size"] = len(_SCHEMA_CACHE)
+    return info
+
+
+def clear_schema_cache():
+    """Empty the compiled schema cache and reset its statistics"""
+    _SCHEMA_CACHE.clear()
+    _SCHEMA_CACHE_STATS["hits"] = 0
+    _SCHEMA_CACHE_STATS["misses"] = 0
+
+
+def _fast_check(value, types, elements, choices):
+    """Check a value against an option using isinstance only
+    :param value: The value to check
+    :param types: The acceptable types for the value
+    :type types: tuple
+    :param elements: The acceptable types for list elements
+    :type elements: tuple
+    :param choices: The acceptable values
+    :type choices: list
+    :return: True if the value would pass validation unchanged
+    :rtype: bool
+    """
+    if not isinstance(value, types):
+        return False
+    if isinstance(value, list):
+        if not all(isinstance(element, elements or _FAST_SCALARS) for element in value):
+            return False
+        if choices is not None:
+            return all(element in choices for element in value)
+    elif choices is not None:
+        return value in choices
+    return True
+
+
+def _build_fast_spec(schema):
+    """Build the spec used by the fast path, only simple and
+    flat argspecs are supported, anything else (suboptions, aliases,
+    conditionals, fallbacks, etc) uses the ArgumentSpecValidator
+    :param schema: The schema in ansible argspec format
+    :type schema: dict
+    :return: option name to (types, required, default, elements, choices) or None
+    :rtype: dict
+    """
+    if list(schema) != ["argument_spec"]:
+        return None
+    fast_spec = {}
+    for name, option in schema["argument_spec"].items():
+        if not _FAST_OPTION_KEYS.issuperset(option):
+            return None
+        types = _FAST_TYPES.get(option.get("type", "str"))
+        elements = None
+        if "elements" in option:
+            if option.get("type") != "list":
+                return None
+            elements = _FAST_TYPES.get(option["elements"])
+            if elements is None or list in elements:
+                return None
+        if types is None:
+            return None
+        default = option.get("default")
+        choices = option.get("choices")
+        if default is not None and not _fast_check(default, types, elements, choices):
+            return None
+        fast_spec[name] = (types, option.get("required", False), default, elements, choices)
+    return fast_spec
+
+
+class CompiledSchema:
+    """A schema converted to argspec format, ready to validate data"""
+
+    def __init__(self, schema, invalid_keys):
+        """
+        :param schema: The schema in ansible argspec format
+        :type schema: dict
+        :param invalid_keys: Keys in the schema which are not valid argspec keys
+        :type invalid_keys: list
+        """
+        self.schema = schema
+        self.invalid_keys = invalid_keys
+        self._validator = None
+        self._fast_spec = None if invalid_keys else _build_fast_spec(schema)
+
+    @property
+    def validator(self):
+        """The ArgumentSpecValidator for the schema, built on first use"""
+        if self._validator is None:
+            self._validator = ArgumentSpecValidator(**self.schema)
+        return self._validator
+
+    def fast_validate(self, data):
+        """Validate the data with plain isinstance checks
+
+        :param data: The data to validate
+        :type data: dict
+        :return: The data updated with defaults, None if the full
+            validator is needed to coerce the data or report an error
+        :rtype: dict
+        """
+        if self._fast_spec is None or not isinstance(data, dict):
+            return None
+        params = {}
+        for key, value in data.items():
+            option = self._fast_spec.get(key)
+            if option is None or not _fast_check(value, option[0], option[3], option[4]):
+                return None
+            params[key] = list(value) if isinstance(value, list) else value
+        for key, option in self._fast_spec.items():
+            if key not in params:
+                if option[1]:
+                    return None
+                params[key] = option[2]
+        return params
+
 
 class MonkeyModule(AnsibleModule):
     """A derivative of the AnsibleModule used
@@ -194,6 +352,44 @@ class AnsibleArgSpecValidator:
         self._extract_schema_from_doc(doc_obj, temp_schema)
         self._schema = {"argument_spec": temp_schema}
 
+    def _compile_schema(self):
+        """Convert the schema to argspec format and
+        add the schema conditionals
+
+        :return: The compiled schema
+        :rtype: CompiledSchema
+        """
+        if self._schema_format == "doc":
+            self._convert_doc_to_schema()
+        if self._schema_conditionals is not None:
+            self._schema = dict_merge(self._schema, self._schema_conditionals)
+        invalid_keys = [k for k in self._schema.keys() if k not in VALID_ANSIBLEMODULE_ARGS]
+        return CompiledSchema(schema=self._schema, invalid_keys=invalid_keys)
+
+    def _get_compiled_schema(self):
+        """Return the compiled schema, from the cache when possible
+        only doc format schemas are cached, argspec schemas are not
+        parsed so there is little to gain
+
+        :return: The compiled schema
+        :rtype: CompiledSchema
+        """
+        if self._schema_format != "doc":
+            return self._compile_schema()
+        try:
+            key = (self._schema, _freeze(self._schema_conditionals))
+            compiled = _SCHEMA_CACHE.get(key)
+        except TypeError:
+            # unhashable conditionals, skip the cache
+            return self._compile_schema()
+        if compiled is None:
+            _SCHEMA_CACHE_STATS["misses"] += 1
+            compiled = self._compile_schema()
+            _SCHEMA_CACHE[key] = compiled
+        else:
+            _SCHEMA_CACHE_STATS["hits"] += 1
+        return compiled
+
     def _validate(self):
         """Validate the data gainst the schema
         convert doc string in argspec if necessary
@@ -229,23 +425,22 @@ class AnsibleArgSpecValidator:
         that is coming in 2.11, change the check according above
         """
         if HAS_ANSIBLE_ARG_SPEC_VALIDATOR:
-            if self._schema_format == "doc":
-                self._convert_doc_to_schema()
-            if self._schema_conditionals is not None:
-                self._schema = dict_merge(self._schema, self._schema_conditionals)
-            invalid_keys = [k for k in self._schema.keys() if k not in VALID_ANSIBLEMODULE_ARGS]
-            if invalid_keys:
+            compiled = self._get_compiled_schema()
+            self._schema = compiled.schema
+            if compiled.invalid_keys:
                 valid = False
                 errors = [
                     "Invalid schema. Invalid keys found: {ikeys}".format(
-                        ikeys=",".join(invalid_keys),
+                        ikeys=",".join(compiled.invalid_keys),
                     ),
                 ]
                 updated_data = {}
                 return valid, errors, updated_data
             else:
-                validator = ArgumentSpecValidator(**self._schema)
-                result = validator.validate(self._data)
+                updated_data = compiled.fast_validate(self._data)
+                if updated_data is not None:
+                    return True, [], updated_data
+                result = compiled.validator.validate(self._data)
                 valid = not bool(result.error_messages)
                 return (
                     valid,
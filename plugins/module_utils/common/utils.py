@@ -10,6 +10,7 @@ __metaclass__ = type
 
 from collections.abc import Mapping
 from copy import deepcopy
+from operator import is_
 
 
 def sort_list(val):
@@ -107,3 +108,157 @@ def to_list(val):
         return [val]
     else:
         return list()
+
+
+# The types a JSON round trip returns unchanged
+_NATIVE_SCALARS = frozenset((str, int, float, bool, type(None)))
+_STR = frozenset((str,))
+
+
+def _native_scalar(obj):
+    """Convert a scalar to its native type, as json would"""
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        # int subclasses, ie. IntEnum, are encoded as a plain int
+        return int.__int__(obj)
+    if isinstance(obj, float):
+        return float.__float__(obj)
+    raise TypeError("Object of type {0} is not JSON serializable".format(type(obj).__name__))
+
+
+def _native_key(key):
+    """Convert a dict key to a str, as json would"""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, bool):
+        return {None: "null", True: "true", False: "false"}[key]
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (float("inf"), float("-inf")):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    raise TypeError(
+        "keys must be str, int, float, bool or None, not {0}".format(type(key).__name__),
+    )
+
+
+def _is_native(obj):
+    """Check if a structure is made of native types only, without
+    copying it, a structure with a container found twice is not"""
+    stack = [obj]
+    seen = set()
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        cls = type(value)
+        if cls in _NATIVE_SCALARS:
+            continue
+        if cls is dict:
+            if not _STR.issuperset(map(type, value)):
+                return False
+            values = value.values()
+        elif cls is list:
+            values = value
+        else:
+            return False
+        if not _NATIVE_SCALARS.issuperset(map(type, values)):
+            # a shared or circular container is left to the conversion
+            if id(value) in seen:
+                return False
+            seen.add(id(value))
+            extend(values)
+    return True
+
+
+def to_native_types(obj):
+    """Convert a structure to the native types a JSON round trip,
+    json.loads(json.dumps(obj)), would return, without serializing it
+
+    Dicts, including OrderedDicts and other subclasses, become dicts
+    with str keys, lists and tuples become lists, and str, int and float
+    subclasses, ie. AnsibleUnicode, become str, int and float. A structure
+    already made of native types, as most parsers return, is checked and
+    returned as is, else only the dicts and lists which are not native
+    are copied. The structure is walked without recursion, so there is
+    no limit to its depth.
+
+    :param obj: The structure to convert
+    :return: The structure made of native types only
+    :raises TypeError: If a value is not JSON serializable
+    :raises ValueError: If the structure contains itself
+    """
+    if type(obj) in _NATIVE_SCALARS:
+        return obj
+    if not isinstance(obj, (dict, list, tuple)):
+        return _native_scalar(obj)
+    if _is_native(obj):
+        return obj
+
+    # the containers being converted, as (container, keys, values,
+    # iterator over the values, converted values), under the root
+    # list holding the result
+    result = []
+    stack = [(None, None, (obj,), iter((obj,)), result)]
+    active = set()
+    while stack:
+        container, keys, values, values_iter, converted = stack[-1]
+        append = converted.append
+        for value in values_iter:
+            cls = type(value)
+            if cls in _NATIVE_SCALARS:
+                append(value)
+                continue
+            if cls is dict:
+                child_keys = None if _STR.issuperset(map(type, value)) else _native_keys(value)
+                child_values = list(value.values())
+            elif cls is list:
+                child_keys = None
+                child_values = value
+            elif isinstance(value, dict):
+                child_keys = _native_keys(value)
+                child_values = list(value.values())
+            elif isinstance(value, (list, tuple)):
+                child_keys = ()
+                child_values = value
+            else:
+                append(_native_scalar(value))
+                continue
+            if _NATIVE_SCALARS.issuperset(map(type, child_values)):
+                # a leaf, converted at once
+                append(_build(value, child_keys, child_values, child_values))
+                continue
+            if id(value) in active:
+                raise ValueError("Circular reference detected")
+            active.add(id(value))
+            stack.append((value, child_keys, child_values, iter(child_values), []))
+            # the child is converted first
+            break
+        else:
+            stack.pop()
+            if stack:
+                active.discard(id(container))
+                stack[-1][4].append(_build(container, keys, values, converted))
+    return result[0]
+
+
+def _native_keys(container):
+    """The keys of a dict converted to str, as json would"""
+    return [_native_key(key) for key in container]
+
+
+def _build(container, keys, values, converted):
+    """Return the native dict or list of a container from its converted
+    values, the container itself if nothing was converted
+    :param keys: The converted keys of a dict, None if the container is
+        an exact dict with str keys or an exact list, () if a tuple or a
+        list subclass
+    """
+    if keys is None and all(map(is_, converted, values)):
+        return container
+    if isinstance(container, dict):
+        return dict(zip(container if keys is None else keys, converted))
+    return list(converted)
@@ -30,7 +30,7 @@ options:
         type: dict
         description:
         - Parser specific parameters
-        required: True
+        - Required unless every entry of I(commands) has its own parser
         suboptions:
             name:
                 type: str
@@ -58,6 +58,80 @@ options:
                 - Additional parser specific parameters
                 - See the cli_parse user guide for examples of parser specific variables
                 - U(https://docs.ansible.com/ansible/latest/network/user_guide/cli_parsing.html)
+    commands:
+        type: list
+        elements: dict
+        description:
+        - A list of commands to run on the host and parse in a single task
+        - The commands are sent to a network device in a single request over its persistent connection
+        - A textfsm template used by several commands of the task is compiled once
+        - I(parsed) is then a dict of the structured data of every command, keyed by command,
+          and I(stdout) a dict of their output, a command can only be listed once
+        - The output a network device returns as JSON is given to the parser as JSON text
+        - Mutually exclusive with I(command) and I(text)
+        version_added: "6.1.0"
+        suboptions:
+            command:
+                type: str
+                description:
+                - The command to run on the host
+                required: True
+            parser:
+                type: dict
+                description:
+                - The parser of this command, defaults to I(parser)
+                suboptions:
+                    name:
+                        type: str
+                        description:
+                        - The name of the parser to use
+                        required: True
+                    command:
+                        type: str
+                        description:
+                        - The command used to locate the parser's template
+                    os:
+                        type: str
+                        description:
+                        - Provide an operating system value to the parser
+                        - For `ntc_templates` parser, this should be in the supported
+                          `<vendor>_<os>` format.
+                    template_path:
+                        type: str
+                        description:
+                        - Path of the parser template on the Ansible controller
+                        - This can be a relative or an absolute path
+                    vars:
+                        type: dict
+                        description:
+                        - Additional parser specific parameters
+                        - See the cli_parse user guide for examples of parser specific variables
+                        - U(https://docs.ansible.com/ansible/latest/network/user_guide/cli_parsing.html)
+    cache:
+        type: dict
+        description:
+        - Cache the parsed data on the Ansible controller
+        - The parsed data is stored under a hash of the text, the parser name, command and vars,
+          the version of the parser library, the OS of the parser or of the host and the contents
+          of the parser template, an unchanged output parsed with an unchanged template is read back
+          without running the parser
+        - The cache is shared by every host and every run using the same I(path)
+        - Only successful parses with a parser using a template, such as C(ansible.utils.textfsm) or
+          C(ansible.utils.ttp), are cached
+        version_added: "6.1.0"
+        suboptions:
+            path:
+                type: path
+                description:
+                - The SQLite database of the cache on the Ansible controller, created if needed
+                - If a directory, the database is C(cli_parse_cache.sqlite) in this directory
+                required: True
+            max_size:
+                type: int
+                description:
+                - The maximum total size of the cached data, in megabytes
+                - The least recently used data is evicted first
+                default: 100
     set_fact:
         description:
         - Set the resulting parsed data as a fact
@@ -260,18 +334,58 @@ EXAMPLES = r"""
     parser:
       name: ansible.utils.xml
   register: parser_output
+
+# Running several commands in one task
+
+# -------------
+- name: Run and parse several commands in one task
+  ansible.utils.cli_parse:
+    commands:
+      - command: show version
+      - command: show interface
+      - command: show lldp neighbors
+        parser:
+          name: ansible.utils.ttp
+    parser:
+      name: ansible.utils.textfsm
+    set_fact: device_state
+
+# device_state:
+#   show version: [...]
+#   show interface: [...]
+#   show lldp neighbors: [...]
+
+# Caching the parsed data
+
+# -------------
+- name: Parse the configuration, unless it was already parsed by an earlier run
+  ansible.utils.cli_parse:
+    command: show running-config
+    parser:
+      name: ansible.utils.ttp
+    cache:
+      path: "{{ playbook_dir }}/cli_parse_cache.sqlite"
+  register: running_config
+
+# running_config:
+#   cache_hit: true
+#   parsed: [...]
 """
 
 RETURN = r"""
 parsed:
-  description: The structured data resulting from the parsing of the text
+  description:
+  - The structured data resulting from the parsing of the text
+  - A dict of the structured data of every command, keyed by command, when provided commands
   returned: always
   type: dict
   sample:
 stdout:
-  description: The output from the command run
-  returned: when provided a command
-  type: str
+  description:
+  - The output from the command run
+  - A dict of the output of every command, keyed by command, when provided commands
+  returned: when provided a command or commands
+  type: raw
   sample:
 stdout_lines:
   description: The output of the command run split into lines
@@ -279,4 +393,11 @@ stdout_lines:
   type: list
   elements: str
   sample:
+cache_hit:
+  description:
+  - Whether the parsed data was read from the cache
+  - A dict of the flag of every command, keyed by command, when provided commands
+  returned: when provided a cache
+  type: raw
+  sample:
 """
@@ -7,6 +7,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import hashlib
+import os
+
+from collections import OrderedDict
+
+from ansible.module_utils.common.text.converters import to_text
+
+
+TEMPLATE_CACHE_SIZE = 128
+
 
 class CliParserBase:
     """The base class for cli parsers
@@ -17,3 +27,78 @@ class CliParserBase:
         self._debug = debug
         self._task_args = task_args
         self._task_vars = task_vars
+
+
+class TemplateCache(object):
+    """Compiled parser templates, per process
+
+    Ansible runs every task of every host in a worker process of its own,
+    so a template is compiled once per task, the commands of a task
+    sharing a template reuse it.
+
+    A template is keyed by its path, checked against the modification
+    time and size of the file and, when they changed, against a hash of
+    its content, so a template touched but not modified is not compiled
+    again.
+    """
+
+    def __init__(self, compile_template, maxsize=TEMPLATE_CACHE_SIZE):
+        """
+        :param compile_template: The function compiling the content of a
+            template, given as text, and any extra key given to get
+        :type compile_template: callable
+        :param maxsize: The maximum number of compiled templates kept
+        :type maxsize: int
+        """
+        self._compile = compile_template
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, path, *extra):
+        """Return the compiled template of a file
+        :param path: The path of the template
+        :type path: str
+        :param extra: Hashable values the template is compiled with, part
+            of the key and given to the compile function
+        :return: The compiled template
+        :raises OSError: If the template can not be read
+        """
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (os.path.abspath(path),) + extra
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != stamp:
+            with open(path, "rb") as file_handler:
+                content = file_handler.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is None or entry[1] != digest:
+                self.misses += 1
+                compiled = self._compile(to_text(content, errors="surrogate_or_strict"), *extra)
+                entry = self._entries[key] = (stamp, digest, compiled)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                return compiled
+            entry = self._entries[key] = (stamp, digest, entry[2])
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def info(self):
+        """Return statistics about the cache
+        :return: hits, misses, maxsize and size of the cache
+        :rtype: dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "size": len(self._entries),
+        }
+
+    def clear(self):
+        """Empty the cache"""
+        self._entries.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Sets of IP addresses as sorted integer intervals
+
+An IPIntervalSet holds, per IP version, the sorted list of the disjoint
+and non adjacent (first, last) address ranges it covers. The IPv4 bounds
+are packed in arrays of unsigned 64 bit words, the IPv6 bounds do not
+fit in a word and are kept in lists. Union, intersection and difference
+walk both operands once in order, so they are linear in the number of
+ranges, and membership is a bisect.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from array import array
+from bisect import bisect_right
+from heapq import merge
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_range_merge import (
+    RangeMerger,
+    range_to_prefixes,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    _WIDTH,
+    IPPrefix,
+    int_to_str,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_prefix_bulk,
+)
+
+
+_VERSIONS = (4, 6)
+
+
+def _bounds(version):
+    """Empty first and last bounds for an IP version"""
+    if version == 4:
+        return array("Q"), array("Q")
+    return [], []
+
+
+def _coalesce(ranges):
+    """Merge sorted ranges which overlap or are adjacent"""
+    current_first = current_last = None
+    for first, last in ranges:
+        if current_first is not None and first <= current_last + 1:
+            if last > current_last:
+                current_last = last
+            continue
+        if current_first is not None:
+            yield current_first, current_last
+        current_first, current_last = first, last
+    if current_first is not None:
+        yield current_first, current_last
+
+
+def _intersect(left, right):
+    """Intersect two sorted lists of disjoint ranges"""
+    left, right = iter(left), iter(right)
+    a, b = next(left, None), next(right, None)
+    while a is not None and b is not None:
+        first, last = max(a[0], b[0]), min(a[1], b[1])
+        if first <= last:
+            yield first, last
+        # move past the range ending first
+        if a[1] < b[1]:
+            a = next(left, None)
+        else:
+            b = next(right, None)
+
+
+def _subtract(left, right):
+    """Remove a sorted list of disjoint ranges from another"""
+    right = iter(right)
+    b = next(right, None)
+    for first, last in left:
+        while b is not None and b[1] < first:
+            b = next(right, None)
+        while b is not None and b[0] <= last:
+            if b[0] > first:
+                yield first, b[0] - 1
+            if b[1] >= last:
+                break
+            first = b[1] + 1
+            b = next(right, None)
+        else:
+            yield first, last
+
+
+class IPIntervalSet(object):
+    """An immutable set of IPv4 and IPv6 addresses"""
+
+    def __init__(self, ranges=None):
+        """
+        :param ranges: The sorted, disjoint and non adjacent (first, last)
+            ranges of each IP version, as a dict of version: iterable
+        :type ranges: dict
+        """
+        self._bounds = {}
+        for version in _VERSIONS:
+            firsts, lasts = _bounds(version)
+            for first, last in (ranges or {}).get(version, ()):
+                firsts.append(first)
+                lasts.append(last)
+            self._bounds[version] = firsts, lasts
+
+    @classmethod
+    def from_prefixes(cls, values, parse):
+        """Build a set from IP addresses and networks, the host bits of
+        the networks are ignored
+        :param values: The addresses and networks, any iterable
+        :param parse: A function parsing a value into an IPPrefix
+        :rtype: IPIntervalSet
+        """
+        mergers = dict((version, RangeMerger(version)) for version in _VERSIONS)
+        for value in values:
+            p = parse(value)
+            mergers[p.version].add(p.network, p.broadcast)
+        return cls(dict((version, merger.ranges()) for version, merger in mergers.items()))
+
+    def ranges(self, version):
+        """Iterate over the ranges of an IP version
+        :param version: The IP version
+        :type version: int
+        :return: The (first, last) ranges, in ascending order
+        :rtype: iterator
+        """
+        firsts, lasts = self._bounds[version]
+        return zip(firsts, lasts)
+
+    def _combine(self, other, operation):
+        return type(self)(
+            dict(
+                (version, operation(self.ranges(version), other.ranges(version)))
+                for version in _VERSIONS
+            ),
+        )
+
+    def union(self, other):
+        """:rtype: IPIntervalSet"""
+        return self._combine(other, lambda left, right: _coalesce(merge(left, right)))
+
+    def intersection(self, other):
+        """:rtype: IPIntervalSet"""
+        return self._combine(other, _intersect)
+
+    def difference(self, other):
+        """:rtype: IPIntervalSet"""
+        return self._combine(other, _subtract)
+
+    def contains_range(self, first, last, version):
+        """Check if a range of addresses is in the set
+        :param first: The first address of the range
+        :type first: int
+        :param last: The last address of the range
+        :type last: int
+        :param version: The IP version
+        :type version: int
+        :rtype: bool
+        """
+        firsts, lasts = self._bounds[version]
+        index = bisect_right(firsts, first) - 1
+        return index >= 0 and last <= lasts[index]
+
+    def issuperset(self, other):
+        """Check if all the addresses of another set are in this set
+        :rtype: bool
+        """
+        for version in _VERSIONS:
+            for first, last in other.ranges(version):
+                if not self.contains_range(first, last, version):
+                    return False
+        return True
+
+    def subnets(self, version, prefixlen, align=None):
+        """Iterate over the subnets of a given size lying entirely in the set
+        :param version: The IP version
+        :type version: int
+        :param prefixlen: The prefix length of the subnets
+        :type prefixlen: int
+        :param align: The prefix length the subnets start on a boundary
+            of, defaults to prefixlen
+        :type align: int
+        :return: The network address of the subnets, in ascending order
+        :rtype: generator
+        """
+        width = _WIDTH[version]
+        size = 1 << (width - prefixlen)
+        step = 1 << (width - (prefixlen if align is None else min(align, prefixlen)))
+        for first, last in self.ranges(version):
+            # the first boundary at or after the start of the range
+            network = (first + step - 1) & -step
+            while network + size - 1 <= last:
+                yield network
+                network += step
+
+    def size(self, version=None):
+        """The number of addresses in the set
+        :param version: Only count the addresses of this IP version
+        :type version: int
+        :rtype: int
+        """
+        return sum(
+            last - first + 1
+            for v in (_VERSIONS if version is None else (version,))
+            for first, last in self.ranges(v)
+        )
+
+    def prefixes(self):
+        """Iterate over the minimal list of networks covering the set
+        :return: The networks, IPv4 first, in ascending order
+        :rtype: generator
+        """
+        for version in _VERSIONS:
+            for first, last in self.ranges(version):
+                for network, prefixlen in range_to_prefixes(first, last, version):
+                    yield IPPrefix(network, prefixlen, version)
+
+    def cidrs(self):
+        """Return the minimal list of networks covering the set
+        :return: The networks, ie. 10.0.0.0/8, IPv4 first, in ascending order
+        :rtype: list
+        """
+        return [
+            "{0}/{1}".format(int_to_str(network, version), prefixlen)
+            for version in _VERSIONS
+            for first, last in self.ranges(version)
+            for network, prefixlen in range_to_prefixes(first, last, version)
+        ]
+
+    def __len__(self):
+        """The number of ranges in the set"""
+        return sum(len(self._bounds[version][0]) for version in _VERSIONS)
+
+    def __eq__(self, other):
+        if not isinstance(other, IPIntervalSet):
+            return NotImplemented
+        return all(
+            list(self.ranges(version)) == list(other.ranges(version)) for version in _VERSIONS
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self.cidrs())
+
+
+def ip_interval_set(value, name, backend=None):
+    """Build the set of addresses given to one of the IP set filters
+    :param value: An IP address or network, a list of them or a set
+    :param name: The name of the filter, for the error messages
+    :type name: str
+    :param backend: netaddr or ipaddress, the library used to parse the
+        values IPPrefix can not, see ipaddr_backend
+    :type backend: str
+    :rtype: IPIntervalSet
+    :raises AnsibleFilterError: If a value is not a valid address or network
+    """
+    if isinstance(value, IPIntervalSet):
+        return value
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        value = [value]
+    elif isinstance(value, dict) or not hasattr(value, "__iter__"):
+        raise AnsibleFilterError(
+            "{0}: expected an IP address or network or a list of them, got {1}".format(
+                name,
+                type(value).__name__,
+            ),
+        )
+
+    def _parse(item):
+        p = _ip_prefix_bulk(item, backend)
+        if p is None:
+            raise AnsibleFilterError(
+                "{0}: invalid IP address or network {1!r}".format(name, item),
+            )
+        return p
+
+    return IPIntervalSet.from_prefixes(value, _parse)
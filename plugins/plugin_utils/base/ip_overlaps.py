@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Overlap detection in lists of IP prefixes by sort and sweep
+
+Two networks either do not overlap or one of them contains the other.
+Once the prefixes are sorted on their first address, and the larger one
+first when they start on the same address, the prefixes containing a
+prefix are exactly the ones still open when it is reached. The sweep
+keeps them on a stack, outermost first, each prefix contained in the one
+below it or equal to it, so finding every containment is O(n log n) for
+the sort plus the number of pairs found.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+def _sorted(prefixes):
+    """The indexes of the prefixes in sweep order"""
+    # one integer key per prefix sorts much faster than tuples: the
+    # version, the first address, the prefix length so the larger prefix
+    # comes first, then the index so duplicates keep their order
+    bits = max(len(prefixes) - 1, 0).bit_length()
+    keys = sorted(
+        ((p.version << 128 | p.network) << 8 | p.prefixlen) << bits | index
+        for index, p in enumerate(prefixes)
+    )
+    mask = (1 << bits) - 1
+    return [key & mask for key in keys]
+
+
+def _sweep(prefixes):
+    """Iterate over the prefixes in sweep order with their enclosing prefixes
+    :param prefixes: The IPPrefix of the prefixes
+    :type prefixes: list
+    :return: The index of each prefix and the stack of the (version, last,
+        index) of the prefixes containing it, outermost first. The stack
+        is updated in place by the next iteration, copy it to keep it.
+    :rtype: generator
+    """
+    # the (version, last, index) of the prefixes open at this point
+    stack = []
+    for index in _sorted(prefixes):
+        p = prefixes[index]
+        while stack and (stack[-1][0] != p.version or stack[-1][1] < p.network):
+            stack.pop()
+        yield index, stack
+        stack.append((p.version, p.broadcast, index))
+
+
+def overlapping_pairs(prefixes):
+    """Find every pair of prefixes where one contains the other
+    :param prefixes: The IPPrefix of the prefixes
+    :type prefixes: list
+    :return: The (index, other_index) of each pair, where the prefix at
+        index contains, or is equal to, the prefix at other_index, in the
+        order of the prefixes' addresses
+    :rtype: generator
+    """
+    for index, stack in _sweep(prefixes):
+        # the pairs are yielded while the sweep waits, keep the
+        # enclosing prefixes of this one
+        for entry in list(stack):
+            yield entry[2], index
+
+
+def overlapping_groups(prefixes):
+    """Find the groups of overlapping prefixes, a group is a top-level
+    prefix, one no other prefix contains, with all the prefixes it
+    contains, nested ones included, when there is at least one
+    :param prefixes: The IPPrefix of the prefixes
+    :type prefixes: list
+    :return: The list of the indexes of the prefixes of each group, in
+        the order of their addresses
+    :rtype: generator
+    """
+    group = []
+    for index, stack in _sweep(prefixes):
+        if not stack:
+            if len(group) > 1:
+                yield group
+            group = []
+        group.append(index)
+    if len(group) > 1:
+        yield group
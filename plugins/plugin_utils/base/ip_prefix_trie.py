@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+A longest prefix match index for IP prefixes
+
+PrefixTrie keeps one path compressed binary (Patricia) trie per IP
+version. Every node is a prefix, a node only exists where a prefix
+was added or where two branches split, so a lookup walks at most one
+node per distinct prefix length on the path to the address instead of
+comparing the address to every prefix.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    _WIDTH,
+    IPPrefix,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    _ip_prefix_bulk,
+)
+
+
+class _Node(object):
+    """A node of the trie, entry is None for the nodes only created
+    where two branches split
+    """
+
+    __slots__ = ("network", "prefixlen", "entry", "children")
+
+    def __init__(self, network, prefixlen, entry=None):
+        self.network = network
+        self.prefixlen = prefixlen
+        self.entry = entry
+        self.children = [None, None]
+
+
+class PrefixTrie(object):
+    """Find the most specific prefix containing an address
+
+    The prefixes can carry a payload, which is given back with the
+    prefix on a match. Adding a prefix already in the trie replaces
+    its payload.
+    """
+
+    def __init__(self, prefixes=None, backend=None):
+        """
+        :param prefixes: The prefixes to add, either a list of prefixes
+            or of (prefix, payload) tuples, or a dict of prefix: payload
+        :type prefixes: list or dict
+        :param backend: netaddr or ipaddress, the library used to parse
+            the prefixes and addresses, see ipaddr_backend
+        :type backend: str
+        """
+        self.backend = backend
+        self._roots = {4: _Node(0, 0), 6: _Node(0, 0)}
+        self._size = 0
+        if isinstance(prefixes, dict):
+            prefixes = prefixes.items()
+        for prefix in prefixes or []:
+            if isinstance(prefix, tuple):
+                self.add(*prefix)
+            else:
+                self.add(prefix)
+
+    def __len__(self):
+        return self._size
+
+    def _parse(self, value):
+        if isinstance(value, IPPrefix):
+            return value
+        p = _ip_prefix_bulk(value, self.backend)
+        if p is None:
+            raise ValueError("invalid IP prefix: {0!r}".format(value))
+        return p
+
+    def add(self, prefix, payload=None):
+        """Add a prefix, the host bits of prefix are ignored
+        :param prefix: The prefix, 10.0.0.0/8 or 2001:db8::/32 for example
+        :type prefix: str or IPPrefix
+        :param payload: Any value to return with the prefix on a match
+        :raises ValueError: If prefix is not a valid IP address or network
+        """
+        p = self._parse(prefix)
+        width = _WIDTH[p.version]
+        network, prefixlen = p.network, p.prefixlen
+        entry = (IPPrefix(network, prefixlen, p.version), payload)
+
+        node = self._roots[p.version]
+        while True:
+            if node.prefixlen == prefixlen:
+                if node.entry is None:
+                    self._size += 1
+                node.entry = entry
+                return
+            bit = (network >> (width - 1 - node.prefixlen)) & 1
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = _Node(network, prefixlen, entry)
+                self._size += 1
+                return
+            if child.prefixlen <= prefixlen and not (
+                (network ^ child.network) >> (width - child.prefixlen)
+            ):
+                # the child contains the new prefix
+                node = child
+                continue
+
+            # number of leading bits the child and the new prefix share
+            common = min(
+                child.prefixlen,
+                prefixlen,
+                width - (child.network ^ network).bit_length(),
+            )
+            if common == prefixlen:
+                # the new prefix goes between node and child
+                new = _Node(network, prefixlen, entry)
+            else:
+                # split the branch where the two prefixes diverge
+                new = _Node(network >> (width - common) << (width - common), common)
+                new.children[(network >> (width - 1 - common)) & 1] = _Node(
+                    network,
+                    prefixlen,
+                    entry,
+                )
+            new.children[(child.network >> (width - 1 - common)) & 1] = child
+            node.children[bit] = new
+            self._size += 1
+            return
+
+    def lookup_int(self, value, version, prefixlen=None):
+        """Find the most specific prefix containing an address given as
+        an integer, or containing the whole network value/prefixlen
+        :param value: The address as an integer
+        :type value: int
+        :param version: The IP version
+        :type version: int
+        :param prefixlen: The prefix length of the network to look up,
+            defaults to a single address
+        :type prefixlen: int
+        :return: The matching prefix and its payload or None
+        :rtype: tuple
+        """
+        width = _WIDTH[version]
+        if prefixlen is None:
+            prefixlen = width
+        best = None
+        node = self._roots[version]
+        while node is not None and node.prefixlen <= prefixlen:
+            if (value ^ node.network) >> (width - node.prefixlen):
+                break
+            if node.entry is not None:
+                best = node.entry
+            if node.prefixlen == width:
+                break
+            node = node.children[(value >> (width - 1 - node.prefixlen)) & 1]
+        return best
+
+    def matches_int(self, value, version, prefixlen=None):
+        """Find all the prefixes containing an address given as an
+        integer, or containing the whole network value/prefixlen
+        :param value: The address as an integer
+        :type value: int
+        :param version: The IP version
+        :type version: int
+        :param prefixlen: The prefix length of the network to look up,
+            defaults to a single address
+        :type prefixlen: int
+        :return: The matching prefixes and their payloads, the least
+            specific first
+        :rtype: list
+        """
+        width = _WIDTH[version]
+        if prefixlen is None:
+            prefixlen = width
+        result = []
+        node = self._roots[version]
+        while node is not None and node.prefixlen <= prefixlen:
+            if (value ^ node.network) >> (width - node.prefixlen):
+                break
+            if node.entry is not None:
+                result.append(node.entry)
+            if node.prefixlen == width:
+                break
+            node = node.children[(value >> (width - 1 - node.prefixlen)) & 1]
+        return result
+
+    def lookup(self, value):
+        """Find the most specific prefix containing an address or network
+        :param value: An IP address or network
+        :type value: str or IPPrefix
+        :return: The matching prefix and its payload or None
+        :rtype: tuple
+        :raises ValueError: If value is not a valid IP address or network
+        """
+        p = self._parse(value)
+        return self.lookup_int(p.network, p.version, p.prefixlen)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+A streaming merge of IP prefixes into their minimal list of networks
+
+Every prefix is reduced to the integer (first, last) range it covers
+and packed into an array of unsigned 64 bit words, one word per range
+for IPv4 and four for IPv6, instead of a network object per prefix.
+The ranges are sorted and swept in chunks: every full chunk is merged
+into the disjoint ranges found so far, so memory stays bounded by the
+chunk size and the size of the result, however long the input is.
+The chunks grow with the result so the whole merge stays linear.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from array import array
+from heapq import merge
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import _WIDTH
+
+
+CHUNK_SIZE = 65536
+
+_WORD = 64
+_WORD_MASK = (1 << _WORD) - 1
+_IPV4_MASK = (1 << 32) - 1
+
+
+def _pack(buffer, version, first, last):
+    """Append a range to a packed buffer"""
+    if version == 4:
+        buffer.append(first << 32 | last)
+    else:
+        buffer.extend(
+            (first >> _WORD, first & _WORD_MASK, last >> _WORD, last & _WORD_MASK),
+        )
+
+
+def _unpack(buffer, version):
+    """Iterate over the (first, last) ranges of a packed buffer"""
+    if version == 4:
+        for word in buffer:
+            yield word >> 32, word & _IPV4_MASK
+    else:
+        words = iter(buffer)
+        for first_hi, first_lo, last_hi, last_lo in zip(words, words, words, words):
+            yield first_hi << _WORD | first_lo, last_hi << _WORD | last_lo
+
+
+def range_to_prefixes(first, last, version):
+    """Split an address range into the minimal list of networks
+    :param first: The first address of the range
+    :type first: int
+    :param last: The last address of the range
+    :type last: int
+    :param version: The IP version
+    :type version: int
+    :return: The network address and prefix length of each network
+    :rtype: generator
+    """
+    width = _WIDTH[version]
+    while first <= last:
+        # the largest block aligned on first that does not go past last
+        size = (first & -first).bit_length() - 1 if first else width
+        size = min(size, (last - first + 1).bit_length() - 1)
+        yield first, width - size
+        first += 1 << size
+
+
+class RangeMerger(object):
+    """Merge the address ranges of one IP version into the minimal list
+    of disjoint, non adjacent ranges
+
+    Like netaddr.cidr_merge, a network with host bits set which was not
+    merged with any other range is given back as it was added.
+    """
+
+    def __init__(self, version, chunk_size=CHUNK_SIZE):
+        """
+        :param version: The IP version
+        :type version: int
+        :param chunk_size: The minimum number of ranges buffered before
+            they are merged into the result
+        :type chunk_size: int
+        """
+        self.version = version
+        self.chunk_size = chunk_size
+        self.count = 0
+        self.peak_bytes = 0
+        self._pending = array("Q")
+        self._pending_count = 0
+        self._merged = array("Q")
+        self._merged_count = 0
+        # the ranges added from a network with host bits: (value, prefixlen)
+        self._originals = {}
+
+    def add(self, first, last, original=None):
+        """Add a range of addresses
+        :param first: The first address of the range
+        :type first: int
+        :param last: The last address of the range
+        :type last: int
+        :param original: The (value, prefixlen) of the network with host
+            bits the range was built from, given back as is if the range
+            is not merged
+        :type original: tuple
+        """
+        if self.version == 4:
+            # sorting the packed words sorts on first, then last
+            self._pending.append(first << 32 | last)
+        else:
+            _pack(self._pending, 6, first, last)
+        if original is not None:
+            self._originals[(first, last)] = original
+        self.count += 1
+        self._pending_count += 1
+        # the chunks grow with the result, so the ranges merged so far
+        # are only read again a logarithmic number of times
+        if self._pending_count >= self.chunk_size and self._pending_count >= self._merged_count:
+            self._flush()
+
+    def _sweep(self, ranges):
+        """Merge sorted ranges which overlap or are adjacent"""
+        originals = self._originals
+        current_first = current_last = None
+        for first, last in ranges:
+            if current_first is not None and first <= current_last + 1:
+                if originals:
+                    originals.pop((current_first, current_last), None)
+                    originals.pop((first, last), None)
+                if last > current_last:
+                    current_last = last
+                continue
+            if current_first is not None:
+                yield current_first, current_last
+            current_first, current_last = first, last
+        if current_first is not None:
+            yield current_first, current_last
+
+    def _flush(self):
+        """Sort the pending ranges and merge them into the result"""
+        if not self._pending_count:
+            return
+        if self.version == 4:
+            chunk = _unpack(sorted(self._pending), 4)
+        else:
+            chunk = iter(sorted(_unpack(self._pending, 6)))
+        merged = array("Q")
+        count = 0
+        for first, last in self._sweep(merge(_unpack(self._merged, self.version), chunk)):
+            _pack(merged, self.version, first, last)
+            count += 1
+        # the pending buffer and both results are alive at this point
+        used = (len(self._pending) + len(self._merged) + len(merged)) * merged.itemsize
+        self.peak_bytes = max(self.peak_bytes, used)
+        self._pending = array("Q")
+        self._pending_count = 0
+        self._merged = merged
+        self._merged_count = count
+
+    def ranges(self):
+        """Merge the pending ranges and iterate over the result
+        :return: The (first, last) ranges, in ascending order
+        :rtype: generator
+        """
+        self._flush()
+        return _unpack(self._merged, self.version)
+
+    def prefixes(self):
+        """Merge the pending ranges and iterate over the result as networks
+        :return: The network address and prefix length of the minimal
+            list of networks, in ascending order
+        :rtype: generator
+        """
+        originals = self._originals
+        for first, last in self.ranges():
+            original = originals.get((first, last)) if originals else None
+            if original is not None:
+                yield original
+                continue
+            for network in range_to_prefixes(first, last, self.version):
+                yield network
+
+    def __len__(self):
+        """The number of disjoint ranges, once merged"""
+        self._flush()
+        return self._merged_count
+
+
+def merge_prefixes(values, parse, chunk_size=CHUNK_SIZE, stats=None):
+    """Merge IP addresses and networks into their minimal list of
+    networks, the same result as netaddr.cidr_merge
+    :param values: The addresses and networks, any iterable
+    :param parse: A function parsing a value into an IPPrefix
+    :param chunk_size: The minimum number of ranges buffered before
+        they are merged, per IP version
+    :type chunk_size: int
+    :param stats: A dict updated with the number of prefixes read, the
+        number of networks returned and the peak memory used by the
+        range buffers, once all the networks are returned
+    :type stats: dict
+    :return: The (address, prefixlen, version) of the networks, IPv4
+        first, in ascending order
+    :rtype: generator
+    """
+    mergers = {4: RangeMerger(4, chunk_size), 6: RangeMerger(6, chunk_size)}
+    for value in values:
+        p = parse(value)
+        original = (p.value, p.prefixlen) if p.value != p.network else None
+        mergers[p.version].add(p.network, p.broadcast, original)
+
+    networks = 0
+    for version in (4, 6):
+        for address, prefixlen in mergers[version].prefixes():
+            networks += 1
+            yield address, prefixlen, version
+
+    if stats is not None:
+        stats.update(
+            prefixes=mergers[4].count + mergers[6].count,
+            networks=networks,
+            peak_bytes=mergers[4].peak_bytes + mergers[6].peak_bytes,
+        )
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Lazy sequences of IP subnets and addresses
+
+The subnets or addresses of a network are worked out from their index
+when they are read, so a template can page through or loop over millions
+of them without the filter building a list or parsing the parent network
+again for every item.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import sys
+
+from collections.abc import Sequence
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    _WIDTH,
+    int_to_str,
+)
+
+
+class SubnetSequence(Sequence):
+    """The subnets of a given prefix length in a network, as strings
+
+    The sequence supports len(), indexing, slicing and iteration like a
+    range. The number of subnets is also available as size, which unlike
+    len() is not limited to sys.maxsize, len() fails beyond it.
+
+    Iterating over the whole sequence, as storing it in a variable does,
+    fails when it holds more than max_items subnets, a slice of it can
+    still be iterated over.
+    """
+
+    def __init__(
+        self,
+        network,
+        version,
+        parent_prefixlen,
+        prefixlen,
+        indexes=None,
+        max_items=None,
+    ):
+        """
+        :param network: The network address of the parent network
+        :type network: int
+        :param version: The IP version
+        :type version: int
+        :param parent_prefixlen: The prefix length of the parent network
+        :type parent_prefixlen: int
+        :param prefixlen: The prefix length of the subnets
+        :type prefixlen: int
+        :param indexes: The indexes of the subnets in the sequence,
+            defaults to all the subnets of the parent network
+        :type indexes: range
+        :param max_items: The maximum number of subnets iterated over,
+            no limit by default
+        :type max_items: int
+        """
+        width = _WIDTH[version]
+        if not parent_prefixlen <= prefixlen <= width:
+            raise ValueError(
+                "invalid subnet prefix length {0} for a /{1}".format(prefixlen, parent_prefixlen),
+            )
+        self.network = network
+        self.version = version
+        self.parent_prefixlen = parent_prefixlen
+        self.prefixlen = prefixlen
+        self._shift = width - prefixlen
+        if indexes is None:
+            indexes = range(1 << (prefixlen - parent_prefixlen))
+        self._indexes = indexes
+        self.max_items = max_items
+
+    @property
+    def size(self):
+        """The number of subnets in the sequence"""
+        # len() of a range is limited to sys.maxsize
+        r = self._indexes
+        if r.step > 0:
+            return max(0, (r.stop - r.start + r.step - 1) // r.step)
+        return max(0, (r.start - r.stop - r.step - 1) // -r.step)
+
+    def page(self, offset=0, limit=None, step=1):
+        """Return a page of the subnets
+        :param offset: The index of the first subnet, negative indexes
+            count from the end
+        :type offset: int
+        :param limit: The maximum number of subnets, defaults to all
+        :type limit: int
+        :param step: Return every step-th subnet
+        :type step: int
+        :rtype: SubnetSequence
+        """
+        if step < 1:
+            raise ValueError("step must be a positive integer, got {0}".format(step))
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative, got {0}".format(limit))
+        size = self.size
+        if offset < 0:
+            offset = max(offset + size, 0)
+        indexes = self._indexes[offset::step]
+        if limit is not None:
+            indexes = indexes[:limit]
+        return self._derive(indexes)
+
+    def _derive(self, indexes):
+        return type(self)(
+            self.network,
+            self.version,
+            self.parent_prefixlen,
+            self.prefixlen,
+            indexes,
+            self.max_items,
+        )
+
+    def _subnet(self, index):
+        return "{0}/{1}".format(
+            int_to_str(self.network + (index << self._shift), self.version),
+            self.prefixlen,
+        )
+
+    def __len__(self):
+        size = self.size
+        if size > sys.maxsize:
+            raise AnsibleFilterError(
+                "the sequence holds {0} items, too many for the length filter or len(); "
+                "read its size attribute instead".format(size),
+            )
+        return size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._derive(self._indexes[item])
+        return self._subnet(self._indexes[item])
+
+    def __iter__(self):
+        if self.max_items is not None and self.size > self.max_items:
+            raise ValueError(
+                "{0} items to iterate over, more than max_items {1}; index, slice or "
+                "sample the sequence instead".format(self.size, self.max_items),
+            )
+        return (self._subnet(index) for index in self._indexes)
+
+    def __reversed__(self):
+        return iter(self._derive(self._indexes[::-1]))
+
+    def __eq__(self, other):
+        if isinstance(other, SubnetSequence):
+            size = other.size
+        elif isinstance(other, (list, tuple)):
+            size = len(other)
+        else:
+            return NotImplemented
+        return self.size == size and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{0}('{1}/{2}', {3}, {4!r})".format(
+            type(self).__name__,
+            int_to_str(self.network, self.version),
+            self.parent_prefixlen,
+            self.prefixlen,
+            self._indexes,
+        )
+
+
+class AddressSequence(SubnetSequence):
+    """The addresses of a network, as strings, see SubnetSequence"""
+
+    def __init__(
+        self,
+        network,
+        version,
+        prefixlen,
+        indexes=None,
+        formatter=None,
+        max_items=None,
+    ):
+        """
+        :param network: The network address of the network
+        :type network: int
+        :param version: The IP version
+        :type version: int
+        :param prefixlen: The prefix length of the network
+        :type prefixlen: int
+        :param indexes: The indexes of the addresses in the sequence,
+            defaults to all the addresses of the network
+        :type indexes: range
+        :param formatter: A function formatting an address given as an
+            integer, defaults to the netaddr format
+        :type formatter: callable
+        :param max_items: The maximum number of addresses iterated over,
+            no limit by default
+        :type max_items: int
+        """
+        super(AddressSequence, self).__init__(
+            network,
+            version,
+            prefixlen,
+            _WIDTH[version],
+            indexes,
+            max_items,
+        )
+        self._formatter = formatter
+
+    def _derive(self, indexes):
+        return type(self)(
+            self.network,
+            self.version,
+            self.parent_prefixlen,
+            indexes,
+            self._formatter,
+            self.max_items,
+        )
+
+    def _subnet(self, index):
+        if self._formatter is not None:
+            return self._formatter(self.network + index)
+        return int_to_str(self.network + index, self.version)
+
+    def __repr__(self):
+        return "{0}('{1}/{2}', {3!r})".format(
+            type(self).__name__,
+            int_to_str(self.network, self.version),
+            self.parent_prefixlen,
+            self._indexes,
+        )
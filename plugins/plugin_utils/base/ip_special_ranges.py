@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The IANA special-purpose address registries as an interval table
+
+The registries are compiled once, at import, into a sorted list of
+interval start addresses per IP version and a matching list of flags.
+Every address falls in exactly one interval, so classifying an address
+is a single bisect on its integer value. The ipaddr filters and the
+private, public and reserved tests all use this table, which keeps them
+consistent with each other whatever the netaddr or python version.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ipaddress
+
+from bisect import bisect_right
+
+
+NOT_GLOBAL = 1
+SHARED = 2
+RESERVED = 4
+MULTICAST = 8
+LOOPBACK = 16
+
+# Not globally reachable, from the IANA IPv4 and IPv6 special-purpose
+# address registries, the same tables netaddr >= 1.0 uses for is_global
+_NOT_GLOBALLY_REACHABLE = {
+    4: [
+        "0.0.0.0/8",
+        "10.0.0.0/8",
+        "100.64.0.0/10",
+        "127.0.0.0/8",
+        "169.254.0.0/16",
+        "172.16.0.0/12",
+        "192.0.0.0/24",
+        "192.0.0.170/31",
+        "192.0.2.0/24",
+        "192.168.0.0/16",
+        "198.18.0.0/15",
+        "198.51.100.0/24",
+        "203.0.113.0/24",
+        "240.0.0.0/4",
+        "255.255.255.255/32",
+    ],
+    6: [
+        "::1/128",
+        "::/128",
+        "::ffff:0.0.0.0/96",
+        "64:ff9b:1::/48",
+        "100::/64",
+        "2001::/23",
+        "2001:db8::/32",
+        "2002::/16",
+        "fc00::/7",
+        "fe80::/10",
+    ],
+}
+
+# Globally reachable blocks carved out of the ranges above
+_GLOBALLY_REACHABLE_EXCEPTIONS = {
+    4: ["192.0.0.9/32", "192.0.0.10/32"],
+    6: [
+        "2001:1::1/128",
+        "2001:1::2/128",
+        "2001:3::/32",
+        "2001:4:112::/48",
+        "2001:20::/28",
+        "2001:30::/28",
+    ],
+}
+
+_SPECIAL_RANGES = {
+    SHARED: {4: ["100.64.0.0/10"], 6: []},
+    # Reserved by the IETF, the same ranges as ipaddress is_reserved
+    RESERVED: {
+        4: ["240.0.0.0/4"],
+        6: [
+            "::/8",
+            "100::/8",
+            "200::/7",
+            "400::/6",
+            "800::/5",
+            "1000::/4",
+            "4000::/3",
+            "6000::/3",
+            "8000::/3",
+            "a000::/3",
+            "c000::/3",
+            "e000::/4",
+            "f000::/5",
+            "f800::/6",
+            "fe00::/9",
+        ],
+    },
+    MULTICAST: {4: ["224.0.0.0/4"], 6: ["ff00::/8"]},
+    LOOPBACK: {4: ["127.0.0.0/8"], 6: ["::1/128"]},
+}
+
+
+def _ranges(networks):
+    """Convert a list of networks to a list of (first, last) integers"""
+    result = []
+    for network in networks:
+        network = ipaddress.ip_network(network)
+        result.append((int(network.network_address), int(network.broadcast_address)))
+    return result
+
+
+def _build_table(version):
+    """Build the interval table for an IP version
+    :param version: The IP version
+    :type version: int
+    :return: The sorted interval starts and the flags of each interval
+    :rtype: tuple
+    """
+    flagged = [(NOT_GLOBAL, _ranges(_NOT_GLOBALLY_REACHABLE[version]))]
+    for flag, networks in _SPECIAL_RANGES.items():
+        flagged.append((flag, _ranges(networks[version])))
+    exceptions = _ranges(_GLOBALLY_REACHABLE_EXCEPTIONS[version])
+
+    boundaries = set([0])
+    for ranges in [exceptions] + [ranges for _flag, ranges in flagged]:
+        for first, last in ranges:
+            boundaries.add(first)
+            boundaries.add(last + 1)
+
+    starts = []
+    flags = []
+    for start in sorted(boundaries):
+        value = 0
+        for flag, ranges in flagged:
+            if any(first <= start <= last for first, last in ranges):
+                value |= flag
+        if any(first <= start <= last for first, last in exceptions):
+            value &= ~NOT_GLOBAL
+        # merge neighbouring intervals with the same flags
+        if flags and flags[-1] == value:
+            continue
+        starts.append(start)
+        flags.append(value)
+    return starts, flags
+
+
+_TABLES = {4: _build_table(4), 6: _build_table(6)}
+
+
+def special_flags(value, version):
+    """Look up the special-purpose flags of an address
+    :param value: The address as an integer
+    :type value: int
+    :param version: The IP version
+    :type version: int
+    :return: The flags of the interval the address is in
+    :rtype: int
+    """
+    starts, flags = _TABLES[version]
+    return flags[bisect_right(starts, value) - 1]
+
+
+def is_global(value, version):
+    """Check if an address is globally reachable"""
+    return not special_flags(value, version) & NOT_GLOBAL
+
+
+def is_private(value, version):
+    """Check if an address is not globally reachable, the shared address
+    space 100.64.0.0/10 is neither private nor public
+    """
+    return special_flags(value, version) & (NOT_GLOBAL | SHARED) == NOT_GLOBAL
+
+
+def is_reserved(value, version):
+    """Check if an address is reserved by the IETF"""
+    return bool(special_flags(value, version) & RESERVED)
+
+
+def is_loopback(value, version):
+    """Check if an address is a loopback address"""
+    return bool(special_flags(value, version) & LOOPBACK)
+
+
+def is_multicast(value, version):
+    """Check if an address is a multicast address"""
+    return bool(special_flags(value, version) & MULTICAST)
@@ -0,0 +1,704 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+The stdlib (ipaddress) backend for the ipaddr filters
+
+The classes here implement the parts of the netaddr IPAddress, IPNetwork
+and IPSet API used by the ipaddr filters, on top of plain integers.
+IPPrefix is the compact value type both backends share for the queries
+and filters that only need integer math on an address and its prefix.
+Parsing and formatting go through socket.inet_pton and socket.inet_ntop,
+the same functions netaddr uses, so both backends accept and return
+addresses in the same format.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ipaddress
+import re
+import socket
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ip_special_ranges
+
+
+IPV4_WIDTH = 32
+IPV6_WIDTH = 128
+IPV4_MAX = (1 << IPV4_WIDTH) - 1
+IPV6_MAX = (1 << IPV6_WIDTH) - 1
+
+_WIDTH = {4: IPV4_WIDTH, 6: IPV6_WIDTH}
+_MAX = {4: IPV4_MAX, 6: IPV6_MAX}
+
+_IPV4_MAPPED = 0xFFFF00000000
+
+
+_MAC_RE = re.compile(
+    r"^(?:"
+    r"(?P<six>[0-9a-f]{1,2}(?P<sep>[:-])[0-9a-f]{1,2}(?:(?P=sep)[0-9a-f]{1,2}){4})"
+    r"|(?P<three>[0-9a-f]{4}(?P<sep3>[.:-])[0-9a-f]{4}(?P=sep3)[0-9a-f]{4})"
+    r"|(?P<bare>[0-9a-f]{12})"
+    r")$",
+    re.IGNORECASE,
+)
+
+
+def int_to_str(value, version):
+    """Format an integer as an IP address string
+    :param value: The address as an integer
+    :type value: int
+    :param version: The IP version
+    :type version: int
+    :return: The address in its compact text form
+    :rtype: str
+    """
+    if version == 4:
+        return socket.inet_ntop(socket.AF_INET, value.to_bytes(4, "big"))
+    return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, "big"))
+
+
+def str_to_int(value):
+    """Parse an IP address string
+    :param value: The address
+    :type value: str
+    :return: The address as an integer and its IP version
+    :rtype: tuple
+    :raises ValueError: If value is not a valid address
+    """
+    for family, version in ((socket.AF_INET, 4), (socket.AF_INET6, 6)):
+        try:
+            return int.from_bytes(socket.inet_pton(family, value), "big"), version
+        except (OSError, ValueError, TypeError):
+            continue
+    raise ValueError("invalid IP address: {0!r}".format(value))
+
+
+def _is_netmask(value, version):
+    """Check if an integer is a netmask, ie. 255.255.255.0"""
+    value = (value ^ _MAX[version]) + 1
+    return value & (value - 1) == 0
+
+
+def _is_hostmask(value):
+    """Check if an integer is a hostmask, ie. 0.0.0.255"""
+    value = value + 1
+    return value & (value - 1) == 0
+
+
+class StdlibIPAddress(object):
+    """An IP address, compatible with the parts of netaddr.IPAddress
+    used by the ipaddr filters
+    """
+
+    __slots__ = ("value", "version")
+
+    def __init__(self, value, version):
+        """
+        :param value: The address as an integer
+        :type value: int
+        :param version: The IP version
+        :type version: int
+        """
+        if version not in _MAX:
+            raise ValueError("invalid IP version: {0!r}".format(version))
+        if not 0 <= value <= _MAX[version]:
+            raise ValueError("invalid IPv{0} address: {1!r}".format(version, value))
+        self.value = value
+        self.version = version
+
+    @classmethod
+    def parse(cls, value):
+        """Build an address from its string representation
+        :param value: The address
+        :type value: str
+        :rtype: StdlibIPAddress
+        """
+        if isinstance(value, cls):
+            return cls(value.value, value.version)
+        try:
+            return cls(*str_to_int(value))
+        except ValueError:
+            raise ValueError("failed to detect a valid IP address from {0!r}".format(value))
+
+    def __int__(self):
+        return self.value
+
+    def __index__(self):
+        return self.value
+
+    def __str__(self):
+        return int_to_str(self.value, self.version)
+
+    def __repr__(self):
+        return "{0}('{1}')".format(type(self).__name__, self)
+
+    def _key(self):
+        return self.version, self.value
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __eq__(self, other):
+        try:
+            return self._key() == other._key()
+        except AttributeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        return self._key() < other._key()
+
+    def __add__(self, amount):
+        value = self.value + amount
+        if not 0 <= value <= _MAX[self.version]:
+            raise IndexError("result outside valid IP address boundary!")
+        return type(self)(value, self.version)
+
+    def __sub__(self, amount):
+        return self.__add__(-amount)
+
+    def _ip_address(self):
+        if self.version == 4:
+            return ipaddress.IPv4Address(self.value)
+        return ipaddress.IPv6Address(self.value)
+
+    def is_global(self):
+        return ip_special_ranges.is_global(self.value, self.version)
+
+    def is_loopback(self):
+        return ip_special_ranges.is_loopback(self.value, self.version)
+
+    def is_multicast(self):
+        return ip_special_ranges.is_multicast(self.value, self.version)
+
+    def is_unicast(self):
+        return not self.is_multicast()
+
+    def is_netmask(self):
+        return _is_netmask(self.value, self.version)
+
+    def is_hostmask(self):
+        return _is_hostmask(self.value)
+
+    @property
+    def reverse_dns(self):
+        return self._ip_address().reverse_pointer + "."
+
+
+class StdlibIPNetwork(object):
+    """An IP address with a prefix length, compatible with the parts
+    of netaddr.IPNetwork used by the ipaddr filters
+    """
+
+    __slots__ = ("value", "prefixlen", "version")
+
+    def __init__(self, value, prefixlen, version):
+        """
+        :param value: The address as an integer, host bits are kept
+        :type value: int
+        :param prefixlen: The prefix length
+        :type prefixlen: int
+        :param version: The IP version
+        :type version: int
+        """
+        if version not in _MAX:
+            raise ValueError("invalid IP version: {0!r}".format(version))
+        if not 0 <= value <= _MAX[version]:
+            raise ValueError("invalid IPv{0} address: {1!r}".format(version, value))
+        if not 0 <= prefixlen <= _WIDTH[version]:
+            raise ValueError("invalid IPv{0} prefix length: {1!r}".format(version, prefixlen))
+        self.value = value
+        self.prefixlen = prefixlen
+        self.version = version
+
+    @classmethod
+    def parse(cls, value):
+        """Build a network from its string representation, the
+        address can be followed by a prefix length, a netmask or
+        a hostmask, the same formats netaddr.IPNetwork accepts
+        :param value: The network
+        :type value: str
+        :rtype: StdlibIPNetwork
+        :raises ValueError: If value is not a valid network
+        """
+        if isinstance(value, cls):
+            return cls(value.value, value.prefixlen, value.version)
+        if not isinstance(value, str):
+            raise ValueError("invalid IPNetwork {0}".format(value))
+        try:
+            return cls(*cls._parse(value))
+        except ValueError:
+            raise ValueError("invalid IPNetwork {0}".format(value))
+
+    @staticmethod
+    def _parse(value):
+        if "/" in value:
+            address, prefix = value.split("/", 1)
+        else:
+            address, prefix = value, None
+        ip, version = str_to_int(address)
+        if prefix is None:
+            prefixlen = _WIDTH[version]
+        else:
+            try:
+                prefixlen = int(prefix)
+            except ValueError:
+                mask, mask_version = str_to_int(prefix)
+                if mask_version != version:
+                    raise ValueError(value)
+                if _is_netmask(mask, version):
+                    prefixlen = _WIDTH[version] - (mask ^ _MAX[version]).bit_length()
+                elif _is_hostmask(mask):
+                    prefixlen = _WIDTH[version] - mask.bit_length()
+                else:
+                    raise ValueError(value)
+        return ip, prefixlen, version
+
+    def __str__(self):
+        return "{0}/{1}".format(int_to_str(self.value, self.version), self.prefixlen)
+
+    def __repr__(self):
+        return "{0}('{1}')".format(type(self).__name__, self)
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def _key(self):
+        return self.version, self.first, self.last
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __eq__(self, other):
+        try:
+            return self._key() == other._key()
+        except AttributeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def _sort_key(self):
+        # the netaddr sort order, smaller networks after larger ones
+        first = self.first
+        return self.version, first, self.prefixlen, self.value - first
+
+    def __lt__(self, other):
+        return self._sort_key() < other._sort_key()
+
+    @property
+    def _hostmask_int(self):
+        return (1 << (_WIDTH[self.version] - self.prefixlen)) - 1
+
+    @property
+    def _netmask_int(self):
+        return _MAX[self.version] ^ self._hostmask_int
+
+    @property
+    def ip(self):
+        return StdlibIPAddress(self.value, self.version)
+
+    @property
+    def first(self):
+        return self.value & self._netmask_int
+
+    @property
+    def last(self):
+        return self.value | self._hostmask_int
+
+    @property
+    def size(self):
+        return self._hostmask_int + 1
+
+    @property
+    def network(self):
+        return StdlibIPAddress(self.first, self.version)
+
+    @property
+    def broadcast(self):
+        # like netaddr, /31 and /32 (or /127 and /128) have no broadcast address
+        if _WIDTH[self.version] - self.prefixlen <= 1:
+            return None
+        return StdlibIPAddress(self.last, self.version)
+
+    @property
+    def netmask(self):
+        return StdlibIPAddress(self._netmask_int, self.version)
+
+    @property
+    def hostmask(self):
+        return StdlibIPAddress(self._hostmask_int, self.version)
+
+    @property
+    def cidr(self):
+        return type(self)(self.first, self.prefixlen, self.version)
+
+    def __getitem__(self, index):
+        index = int(index)
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("index out range for address range size!")
+        return StdlibIPAddress(self.first + index, self.version)
+
+    def __contains__(self, other):
+        if isinstance(other, StdlibIPAddress):
+            return other.version == self.version and self.first <= other.value <= self.last
+        return (
+            other.version == self.version and self.first <= other.first and other.last <= self.last
+        )
+
+    def supernet(self, prefixlen=0):
+        """Return the supernets of this network, from the given prefix
+        length up to, not including, the prefix length of the network
+        :param prefixlen: The prefix length of the largest supernet
+        :type prefixlen: int
+        :rtype: list
+        """
+        if not 0 <= prefixlen <= _WIDTH[self.version]:
+            raise ValueError("CIDR prefix /{0} invalid for IPv{1}!".format(prefixlen, self.version))
+        return [
+            type(self)(self.first, length, self.version).cidr
+            for length in range(prefixlen, self.prefixlen)
+        ]
+
+    def ipv4(self):
+        """Convert an IPv4-mapped or IPv4-compatible IPv6 network to IPv4"""
+        if self.version == 4:
+            return type(self)(self.value, self.prefixlen, 4)
+        if 0 <= self.value <= IPV4_MAX:
+            value = self.value
+        elif _IPV4_MAPPED <= self.value <= _IPV4_MAPPED | IPV4_MAX:
+            value = self.value - _IPV4_MAPPED
+        else:
+            raise ValueError("IPv6 address {0} unsuitable for conversion to IPv4!".format(self))
+        return type(self)(value, self.prefixlen - 96, 4)
+
+    def ipv6(self):
+        """Convert an IPv4 network to an IPv4-mapped IPv6 network"""
+        if self.version == 6:
+            return type(self)(self.value, self.prefixlen, 6)
+        return type(self)(_IPV4_MAPPED + self.value, self.prefixlen + 96, 6)
+
+    def is_multicast(self):
+        return self.ip.is_multicast()
+
+    def is_unicast(self):
+        return self.ip.is_unicast()
+
+
+# IPPrefix is immutable, its own __setattr__ always raises
+_setattr = object.__setattr__
+
+
+class IPPrefix(object):
+    """An immutable IP address with a prefix length, the network,
+    broadcast and size are worked out once, when it is created
+
+    broadcast is the last address of the prefix, for a /31 or a /32
+    (/127 or /128) as well
+    """
+
+    __slots__ = ("version", "value", "prefixlen", "network", "broadcast", "size")
+
+    def __init__(self, value, prefixlen, version):
+        """
+        :param value: The address as an integer, host bits are kept
+        :type value: int
+        :param prefixlen: The prefix length
+        :type prefixlen: int
+        :param version: The IP version
+        :type version: int
+        """
+        width = _WIDTH.get(version)
+        if width is None:
+            raise ValueError("invalid IP version: {0!r}".format(version))
+        if not 0 <= value <= _MAX[version]:
+            raise ValueError("invalid IPv{0} address: {1!r}".format(version, value))
+        if not 0 <= prefixlen <= width:
+            raise ValueError("invalid IPv{0} prefix length: {1!r}".format(version, prefixlen))
+        hostmask = (1 << (width - prefixlen)) - 1
+        _setattr(self, "version", version)
+        _setattr(self, "value", value)
+        _setattr(self, "prefixlen", prefixlen)
+        _setattr(self, "network", value & ~hostmask)
+        _setattr(self, "broadcast", value | hostmask)
+        _setattr(self, "size", hostmask + 1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("IPPrefix is immutable")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return type(self), (self.value, self.prefixlen, self.version)
+
+    @classmethod
+    def parse(cls, value):
+        """Build a prefix from an address or network string, in
+        the formats netaddr.IPNetwork accepts
+        :param value: The address or network
+        :type value: str
+        :rtype: IPPrefix
+        :raises ValueError: If value is not a valid address or network
+        """
+        if not isinstance(value, str):
+            raise ValueError("invalid IPNetwork {0}".format(value))
+        try:
+            return cls(*StdlibIPNetwork._parse(value))
+        except ValueError:
+            raise ValueError("invalid IPNetwork {0}".format(value))
+
+    @classmethod
+    def from_network(cls, network):
+        """Build a prefix from a netaddr or stdlib network
+        :param network: The network
+        :type network: netaddr.IPNetwork or StdlibIPNetwork
+        :rtype: IPPrefix
+        """
+        return cls(int(network.value), network.prefixlen, network.version)
+
+    def __str__(self):
+        return "{0}/{1}".format(int_to_str(self.value, self.version), self.prefixlen)
+
+    def __repr__(self):
+        return "{0}('{1}')".format(type(self).__name__, self)
+
+    def _key(self):
+        return self.version, self.value, self.prefixlen
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __eq__(self, other):
+        if not isinstance(other, IPPrefix):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def format(self, value):
+        """Format an address of the same IP version
+        :param value: The address as an integer
+        :type value: int
+        :rtype: str
+        """
+        return int_to_str(value, self.version)
+
+    def offset(self, amount):
+        """Return the address amount after (or before) this one
+        :param amount: The number of addresses to move by
+        :type amount: int
+        :rtype: int
+        :raises IndexError: If the result is not a valid address
+        """
+        value = self.value + amount
+        if not 0 <= value <= _MAX[self.version]:
+            raise IndexError("result outside valid IP address boundary!")
+        return value
+
+    def usable_range(self):
+        """Return the first and last usable address, a /31 (/127) has
+        two usable addresses and a single address has none
+        :return: The first and last usable address as integers or None
+        :rtype: tuple
+        """
+        if self.size == 2:
+            return self.network, self.broadcast
+        if self.size > 2:
+            return self.network + 1, self.broadcast - 1
+        return None
+
+
+class StdlibIPSet(object):
+    """A set of networks, only supports membership tests"""
+
+    def __init__(self, networks):
+        """
+        :param networks: The networks in the set
+        :type networks: list
+        """
+        self._ranges = [(n.version, n.first, n.last) for n in networks]
+
+    def __contains__(self, other):
+        if isinstance(other, StdlibIPAddress):
+            version, first, last = other.version, other.value, other.value
+        else:
+            version, first, last = other.version, other.first, other.last
+        return any(
+            version == r_version and r_first <= first and last <= r_last
+            for r_version, r_first, r_last in self._ranges
+        )
+
+
+def parse_ipaddr(value, version):
+    """Parse a value given to ipaddr, the stdlib equivalent of the
+    netaddr parsing done in ipaddr_utils._parse_ipaddr
+    :param value: An IP address or network, as a string or integer
+    :param version: The IP version to assume for integers
+    :return: The network, the value rewritten in the correct format
+        (None if unchanged) and the type of value or None if value is not valid
+    :rtype: tuple
+    """
+    # Check if value is a number and convert it to an IP address
+    if str(value).isdigit():
+        value = int(value)
+        try:
+            if (not version) or version == 4:
+                v = StdlibIPNetwork(value, IPV4_WIDTH, 4)
+            else:
+                v = StdlibIPNetwork(value, IPV6_WIDTH, 6)
+        except ValueError:
+            try:
+                v = StdlibIPNetwork(value, IPV6_WIDTH, 6)
+            except ValueError:
+                return None
+        return v, str(v), "address"
+
+    # value has not been recognized, check if it's a valid IP string
+    try:
+        v = StdlibIPNetwork.parse(value)
+    except ValueError:
+        pass
+    else:
+        if isinstance(value, str) and "/" in value:
+            return v, None, "network"
+        return v, None, "address"
+
+    # value hasn't been recognized, maybe it's a numerical CIDR?
+    try:
+        address, prefix = value.split("/")
+        address = int(address)
+        prefix = int(prefix)
+    except Exception:
+        return None
+
+    for v_version in (4, 6):
+        try:
+            v = StdlibIPNetwork(address, prefix, v_version)
+        except ValueError:
+            continue
+        return v, str(v), "network"
+    return None
+
+
+def spanning_cidr(networks):
+    """Return the smallest network spanning all the networks,
+    the same result as netaddr.spanning_cidr
+    :param networks: The networks
+    :type networks: list
+    :rtype: StdlibIPNetwork
+    """
+    networks = sorted(StdlibIPNetwork.parse(network) for network in networks)
+    if len(networks) < 2:
+        raise ValueError("IP sequence must contain at least 2 elements!")
+    lowest, highest = networks[0], networks[-1]
+    if lowest.version != highest.version:
+        raise TypeError("IP sequence cannot contain both IPv4 and IPv6!")
+    value = highest.last
+    prefixlen = highest.prefixlen
+    width = _WIDTH[highest.version]
+    while prefixlen > 0 and value > lowest.first:
+        prefixlen -= 1
+        value &= -(1 << (width - prefixlen))
+    return StdlibIPNetwork(value, prefixlen, highest.version)
+
+
+def mac_to_int(value):
+    """Parse an EUI-48 (MAC) address
+    :param value: The MAC address, ie. 00:50:b6:aa:99:e2, 0050.b6aa.99e2 or 0050b6aa99e2
+    :type value: str
+    :return: The MAC address as an integer
+    :rtype: int
+    :raises ValueError: If value is not a valid MAC address
+    """
+    match = _MAC_RE.match(value) if isinstance(value, str) else None
+    if not match:
+        raise ValueError("invalid MAC address: {0!r}".format(value))
+    six = match.group("six")
+    if six:
+        if len(six) == 17:
+            # the usual 01:23:45:67:89:ab, no group to pad
+            return int(six.replace(match.group("sep"), ""), 16)
+        return int("".join(p.zfill(2) for p in re.split("[:-]", six)), 16)
+    three = match.group("three")
+    if three:
+        return int(three.replace(match.group("sep3"), ""), 16)
+    return int(match.group("bare"), 16)
+
+
+def _mac_bare(mac):
+    return "%012X" % mac
+
+
+def _mac_cisco(mac):
+    h = "%012x" % mac
+    return "%s.%s.%s" % (h[:4], h[4:8], h[8:])
+
+
+def _mac_eui48(mac):
+    h = "%012X" % mac
+    return "-".join((h[:2], h[2:4], h[4:6], h[6:8], h[8:10], h[10:]))
+
+
+def _mac_linux(mac):
+    h = "%012x" % mac
+    return ":".join((h[:2], h[2:4], h[4:6], h[6:8], h[8:10], h[10:]))
+
+
+def _mac_pgsql(mac):
+    h = "%012x" % mac
+    return "%s:%s" % (h[:6], h[6:])
+
+
+def _mac_unix(mac):
+    return ":".join(["%x" % byte for byte in mac.to_bytes(6, "big")])
+
+
+# The formatters of the netaddr MAC address dialects used by the hwaddr
+# filter, working on the MAC address as an integer
+MAC_DIALECTS = {
+    "bare": _mac_bare,
+    "cisco": _mac_cisco,
+    "eui48": _mac_eui48,
+    "linux": _mac_linux,
+    "pgsql": _mac_pgsql,
+    "unix": _mac_unix,
+}
+
+
+def format_mac(mac, dialect):
+    """Format an EUI-48 (MAC) address
+    :param mac: The MAC address as an integer
+    :type mac: int
+    :param dialect: The netaddr dialect, bare, cisco, eui48, linux, pgsql or unix
+    :type dialect: str
+    :rtype: str
+    """
+    return MAC_DIALECTS[dialect](mac)
+
+
+def eui64_ipv6(mac, network):
+    """Build the SLAAC (modified EUI-64) address for a MAC address
+    in a network, the same result as netaddr.EUI(mac).ipv6(network)
+    :param mac: The MAC address as an integer
+    :type mac: int
+    :param network: The IPv6 network
+    :type network: StdlibIPNetwork
+    :rtype: StdlibIPAddress
+    """
+    eui64 = ((mac >> 24) << 40) | (0xFFFE << 24) | (mac & 0xFFFFFF)
+    return StdlibIPAddress(network.first + (eui64 ^ (0x02 << 56)), 6)
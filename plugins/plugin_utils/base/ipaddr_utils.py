@@ -13,12 +13,27 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import os
 import types
 
+from functools import lru_cache
+
 from ansible.errors import AnsibleFilterError
 from ansible.module_utils.basic import missing_required_lib
+from ansible.module_utils.common.validation import check_type_str
 from ansible.utils.display import Display
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import (
+    ip_special_ranges,
+    ipaddr_stdlib,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    IPPrefix,
+    StdlibIPAddress,
+    StdlibIPNetwork,
+    StdlibIPSet,
+)
+
 
 try:
     import netaddr
@@ -34,6 +49,89 @@ else:
 
 display = Display()
 
+# The ipaddr filters can use netaddr (the default) or the python stdlib,
+# the backend is selected per call or with an environment variable
+IPADDR_BACKEND_ENV = "ANSIBLE_UTILS_IPADDR_BACKEND"
+IPADDR_BACKENDS = ("netaddr", "ipaddress")
+
+
+def ipaddr_backend(backend=None):
+    """Return the backend to use for the ipaddr filters
+    :param backend: The backend requested for the call, if any
+    :type backend: str
+    :return: netaddr or ipaddress
+    :rtype: str
+    """
+    if not backend:
+        backend = os.environ.get(IPADDR_BACKEND_ENV) or "netaddr"
+    if backend not in IPADDR_BACKENDS:
+        raise AnsibleFilterError(
+            "Unknown ipaddr backend '{0}', expected one of: {1}".format(
+                backend,
+                ", ".join(IPADDR_BACKENDS),
+            ),
+        )
+    if backend == "netaddr" and netaddr is None:
+        raise AnsibleFilterError(missing_required_lib("netaddr"))
+    return backend
+
+
+def _ipaddress_backend_selected():
+    """Return True if the ipaddress backend is selected with the
+    environment variable, the filters then work without netaddr
+    """
+    return os.environ.get(IPADDR_BACKEND_ENV) == "ipaddress"
+
+
+def _backend_of(v):
+    """Return the backend an address or network was built with"""
+    if isinstance(v, (StdlibIPNetwork, StdlibIPAddress)):
+        return "ipaddress"
+    return "netaddr"
+
+
+def _ip_network(value, backend=None):
+    """Build a network with the selected backend
+    :param value: The network, ie. 192.168.1.0/24
+    :type value: str
+    :param backend: netaddr or ipaddress
+    :type backend: str
+    :raises ValueError: If value is not a valid network
+    """
+    if ipaddr_backend(backend) == "ipaddress":
+        return StdlibIPNetwork.parse(value)
+    try:
+        return netaddr.IPNetwork(value)
+    except netaddr.AddrFormatError as exc:
+        raise ValueError(str(exc))
+
+
+def _ip_address(value, backend=None):
+    """Build an address with the selected backend
+    :param value: The address, ie. 192.168.1.1
+    :type value: str
+    :param backend: netaddr or ipaddress
+    :type backend: str
+    :raises ValueError: If value is not a valid address
+    """
+    if ipaddr_backend(backend) == "ipaddress":
+        return StdlibIPAddress.parse(value)
+    try:
+        return netaddr.IPAddress(value)
+    except netaddr.AddrFormatError as exc:
+        raise ValueError(str(exc))
+
+
+def _v_address(v, value):
+    """Build an address from an integer, with the backend of v
+    :param v: The network the address belongs to
+    :param value: The address as an integer
+    :type value: int
+    """
+    if isinstance(v, StdlibIPNetwork):
+        return StdlibIPAddress(value, v.version)
+    return netaddr.IPAddress(value)
+
 
 # ---- IP address and network query helpers ----
 def _empty_ipaddr_query(v, vtype):
@@ -46,17 +144,6 @@ def _empty_ipaddr_query(v, vtype):
             return str(v)
 
 
-def _first_last(v):
-    if v.size == 2:
-        first_usable = int(netaddr.IPAddress(v.first))
-        last_usable = int(netaddr.IPAddress(v.last))
-        return first_usable, last_usable
-    elif v.size > 1:
-        first_usable = int(netaddr.IPAddress(v.first + 1))
-        last_usable = int(netaddr.IPAddress(v.last - 1))
-        return first_usable, last_usable
-
-
 def _6to4_query(v, vtype, value):
     if v.version == 4:
         if v.size == 1:
@@ -67,7 +154,12 @@ def _6to4_query(v, vtype, value):
             else:
                 return False
 
-        if ipaddr(ipconv, "public") or ipaddr(ipconv, "private"):
+        backend = _backend_of(v)
+        if ipaddr(ipconv, "public", backend=backend) or ipaddr(
+            ipconv,
+            "private",
+            backend=backend,
+        ):
             numbers = list(map(int, ipconv.split(".")))
 
         try:
@@ -77,11 +169,11 @@ def _6to4_query(v, vtype, value):
 
     elif v.version == 6:
         if vtype == "address":
-            if ipaddr(str(v), "2002::/16"):
+            if ipaddr(str(v), "2002::/16", backend=_backend_of(v)):
                 return value
         elif vtype == "network":
             if v.ip != v.network:
-                if ipaddr(str(v.ip), "2002::/16"):
+                if ipaddr(str(v.ip), "2002::/16", backend=_backend_of(v)):
                     return value
 
     return False
@@ -110,9 +202,9 @@ def _bool_ipaddr_query(v):
         return True
 
 
-def _broadcast_query(v):
-    if v.size > 2:
-        return str(v.broadcast)
+def _broadcast_query(p):
+    if p.size > 2:
+        return p.format(p.broadcast)
 
 
 def _cidr_query(v):
@@ -127,15 +219,13 @@ def _cidr_lookup_query(v, iplist, value):
         return False
 
 
-def _first_usable_query(v, vtype):
+def _first_usable_query(p, vtype):
     if vtype == "address":
         # Does it make sense to raise an error
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size == 2:
-            return str(netaddr.IPAddress(int(v.network)))
-        elif v.size > 1:
-            return str(netaddr.IPAddress(int(v.network) + 1))
+        if p.size > 1:
+            return p.format(p.usable_range()[0])
 
 
 def _host_query(v):
@@ -150,11 +240,11 @@ def _hostmask_query(v):
     return str(v.hostmask)
 
 
-def _int_query(v, vtype):
+def _int_query(p, vtype):
     if vtype == "address":
-        return int(v.ip)
+        return p.value
     elif vtype == "network":
-        return str(int(v.ip)) + "/" + str(int(v.prefixlen))
+        return str(p.value) + "/" + str(p.prefixlen)
 
 
 def _ip_prefix_query(v):
@@ -190,35 +280,36 @@ def _ipv6_query(v, value):
         return value
 
 
-def _last_usable_query(v, vtype):
+def _last_usable_query(p, vtype):
     if vtype == "address":
         # Does it make sense to raise an error
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size > 1:
-            first_usable, last_usable = _first_last(v)
-            return str(netaddr.IPAddress(last_usable))
+        if p.size > 1:
+            return p.format(p.usable_range()[1])
 
 
 def _link_local_query(v, value):
-    v_ip = netaddr.IPAddress(str(v.ip))
+    v_ip = str(v.ip)
     if v.version == 4:
-        if ipaddr(str(v_ip), "169.254.0.0/16"):
+        if ipaddr(v_ip, "169.254.0.0/16", backend=_backend_of(v)):
             return value
 
     elif v.version == 6:
-        if ipaddr(str(v_ip), "fe80::/10"):
+        if ipaddr(v_ip, "fe80::/10", backend=_backend_of(v)):
             return value
 
 
-def _loopback_query(v, value):
-    v_ip = netaddr.IPAddress(str(v.ip))
-    if v_ip.is_loopback():
+def _loopback_query(p, value):
+    if ip_special_ranges.is_loopback(p.value, p.version):
         return value
 
 
-def _multicast_query(v, value):
-    if v.is_multicast():
+def _multicast_query(p, value):
+    # the whole network has to be multicast, the multicast ranges are
+    # contiguous so checking both ends is enough
+    is_multicast = ip_special_ranges.is_multicast
+    if is_multicast(p.network, p.version) and is_multicast(p.broadcast, p.version):
         return value
 
 
@@ -232,9 +323,9 @@ def _netmask_query(v):
     return str(v.netmask)
 
 
-def _network_query(v):
+def _network_query(p):
     """Return the network of a given IP or subnet"""
-    return str(v.network)
+    return p.format(p.network)
 
 
 def _network_netmask_query(v):
@@ -245,129 +336,92 @@ def _network_wildcard_query(v):
     return str(v.network) + " " + str(v.hostmask)
 
 
-def _next_usable_query(v, vtype):
+def _next_usable_query(p, vtype):
     if vtype == "address":
         # Does it make sense to raise an error
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size > 1:
-            first_usable, last_usable = _first_last(v)
-            next_ip = int(netaddr.IPAddress(int(v.ip) + 1))
-            if next_ip >= first_usable and next_ip <= last_usable:
-                return str(netaddr.IPAddress(int(v.ip) + 1))
+        if p.size > 1:
+            first_usable, last_usable = p.usable_range()
+            next_ip = p.value + 1
+            if first_usable <= next_ip <= last_usable:
+                return p.format(next_ip)
 
 
-def _peer_query(v, vtype):
+def _peer_query(p, vtype):
     if vtype == "address":
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size == 2:
-            return str(netaddr.IPAddress(int(v.ip) ^ 1))
-        if v.size == 4:
-            if int(v.ip) % 4 == 0:
+        if p.size == 2:
+            return p.format(p.value ^ 1)
+        if p.size == 4:
+            if p.value % 4 == 0:
                 raise AnsibleFilterError("Network address of /30 has no peer")
-            if int(v.ip) % 4 == 3:
+            if p.value % 4 == 3:
                 raise AnsibleFilterError("Broadcast address of /30 has no peer")
-            return str(netaddr.IPAddress(int(v.ip) ^ 3))
+            return p.format(p.value ^ 3)
         raise AnsibleFilterError("Not a point-to-point network")
 
 
-def _prefix_query(v):
-    return int(v.prefixlen)
+def _prefix_query(p):
+    return p.prefixlen
 
 
-def _previous_usable_query(v, vtype):
+def _previous_usable_query(p, vtype):
     if vtype == "address":
         # Does it make sense to raise an error
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size > 1:
-            first_usable, last_usable = _first_last(v)
-            previous_ip = int(netaddr.IPAddress(int(v.ip) - 1))
-            if previous_ip >= first_usable and previous_ip <= last_usable:
-                return str(netaddr.IPAddress(int(v.ip) - 1))
-
-
-def _ip_is_global(ip):
-    # fallback to support netaddr < 1.0.0
-    # attempt to emulate IPAddress.is_global() if it's not available
-    # note that there still might be some behavior differences (e.g. exceptions)
-    has_is_global = callable(getattr(ip, "is_global", None))
-    return (
-        ip.is_global()
-        if has_is_global
-        else (
-            not (ip.is_private() or ip.is_link_local() or ip.is_reserved())
-            and all(
-                ip not in netaddr.IPNetwork(ipv6net)
-                for ipv6net in [
-                    "::1/128",
-                    "::/128",
-                    "::ffff:0:0/96",
-                    "64:ff9b:1::/48",
-                    "100::/64",
-                    "2001::/23",
-                    "2001:db8::/32",
-                    "2002::/16",
-                ]
-            )
-            or ip in netaddr.IPRange("239.0.0.0", "239.255.255.255")  # Administrative Multicast
-            or ip in netaddr.IPNetwork("233.252.0.0/24")  # Multicast test network
-            or ip in netaddr.IPRange("234.0.0.0", "238.255.255.255")
-            or ip in netaddr.IPRange("225.0.0.0", "231.255.255.255")
-            or ip in netaddr.IPNetwork("192.88.99.0/24")  # 6to4 anycast relays (RFC 3068)
-            or ip in netaddr.IPNetwork("192.0.0.9/32")
-            or ip in netaddr.IPNetwork("192.0.0.10/32")
-        )
-    )
+        if p.size > 1:
+            first_usable, last_usable = p.usable_range()
+            previous_ip = p.value - 1
+            if first_usable <= previous_ip <= last_usable:
+                return p.format(previous_ip)
 
 
-def _private_query(v, value):
-    if not _ip_is_global(v.ip):
-        return value
+_NOT_PUBLIC = (
+    ip_special_ranges.NOT_GLOBAL | ip_special_ranges.MULTICAST | ip_special_ranges.LOOPBACK
+)
 
 
-def _public_query(v, value):
-    v_ip = netaddr.IPAddress(str(v.ip))
-    if all(
-        [
-            v_ip.is_unicast(),
-            _ip_is_global(v_ip),
-            not v_ip.is_loopback(),
-            not v_ip.is_netmask(),
-            not v_ip.is_hostmask(),
-        ],
-    ):
+def _private_query(p, value):
+    if not ip_special_ranges.is_global(p.value, p.version):
         return value
 
 
-def _range_usable_query(v, vtype):
+def _public_query(p, value):
+    # unicast, globally reachable and not loopback
+    if ip_special_ranges.special_flags(p.value, p.version) & _NOT_PUBLIC:
+        return None
+    if ipaddr_stdlib._is_netmask(p.value, p.version) or ipaddr_stdlib._is_hostmask(p.value):
+        return None
+    return value
+
+
+def _range_usable_query(p, vtype):
     if vtype == "address":
         # Does it make sense to raise an error
         raise AnsibleFilterError("Not a network address")
     elif vtype == "network":
-        if v.size > 1:
-            first_usable, last_usable = _first_last(v)
-            first_usable = str(netaddr.IPAddress(first_usable))
-            last_usable = str(netaddr.IPAddress(last_usable))
-            return "{0}-{1}".format(first_usable, last_usable)
+        if p.size > 1:
+            first_usable, last_usable = p.usable_range()
+            return "{0}-{1}".format(p.format(first_usable), p.format(last_usable))
 
 
 def _revdns_query(v):
-    v_ip = netaddr.IPAddress(str(v.ip))
-    return v_ip.reverse_dns
+    return v.ip.reverse_dns
 
 
-def _size_query(v):
-    return v.size
+def _size_query(p):
+    return p.size
 
 
-def _size_usable_query(v):
-    if v.size == 1:
+def _size_usable_query(p):
+    if p.size == 1:
         return 0
-    elif v.size == 2:
+    elif p.size == 2:
         return 2
-    return v.size - 2
+    return p.size - 2
 
 
 def _subnet_query(v):
@@ -384,13 +438,13 @@ def _type_query(v):
             return "network"
 
 
-def _unicast_query(v, value):
-    if v.is_unicast():
+def _unicast_query(p, value):
+    if _multicast_query(p, value) is None:
         return value
 
 
-def _version_query(v):
-    return v.version
+def _version_query(p):
+    return p.version
 
 
 def _wrap_query(v, vtype, value):
@@ -403,100 +457,24 @@ def _wrap_query(v, vtype, value):
         return value
 
 
-def ipaddr(value, query="", version=False, alias="ipaddr"):
-    """Check if string is an IP address or network and filter it"""
-
-    query_func_extra_args = {
-        "": ("vtype",),
-        "6to4": ("vtype", "value"),
-        "cidr_lookup": ("iplist", "value"),
-        "first_usable": ("vtype",),
-        "int": ("vtype",),
-        "ipv4": ("value",),
-        "ipv6": ("value",),
-        "last_usable": ("vtype",),
-        "link-local": ("value",),
-        "loopback": ("value",),
-        "lo": ("value",),
-        "multicast": ("value",),
-        "next_usable": ("vtype",),
-        "peer": ("vtype",),
-        "previous_usable": ("vtype",),
-        "private": ("value",),
-        "public": ("value",),
-        "unicast": ("value",),
-        "range_usable": ("vtype",),
-        "wrap": ("vtype", "value"),
-    }
-
-    query_func_map = {
-        "": _empty_ipaddr_query,
-        "6to4": _6to4_query,
-        "address": _ip_query,
-        "address/prefix": _address_prefix_query,  # deprecate
-        "bool": _bool_ipaddr_query,
-        "broadcast": _broadcast_query,
-        "cidr": _cidr_query,
-        "cidr_lookup": _cidr_lookup_query,
-        "first_usable": _first_usable_query,
-        "gateway": _address_prefix_query,  # deprecate
-        "gw": _address_prefix_query,  # deprecate
-        "host": _host_query,
-        "host/prefix": _address_prefix_query,  # deprecate
-        "hostmask": _hostmask_query,
-        "hostnet": _address_prefix_query,  # deprecate
-        "int": _int_query,
-        "ip": _ip_query,
-        "ip/prefix": _ip_prefix_query,
-        "ip_netmask": _ip_netmask_query,
-        # 'ip_wildcard': _ip_wildcard_query, built then could not think of use case
-        "ipv4": _ipv4_query,
-        "ipv6": _ipv6_query,
-        "last_usable": _last_usable_query,
-        "link-local": _link_local_query,
-        "lo": _loopback_query,
-        "loopback": _loopback_query,
-        "multicast": _multicast_query,
-        "net": _net_query,
-        "next_usable": _next_usable_query,
-        "netmask": _netmask_query,
-        "network": _network_query,
-        "network_id": _network_query,
-        "network/prefix": _subnet_query,
-        "network_netmask": _network_netmask_query,
-        "network_wildcard": _network_wildcard_query,
-        "peer": _peer_query,
-        "prefix": _prefix_query,
-        "previous_usable": _previous_usable_query,
-        "private": _private_query,
-        "public": _public_query,
-        "range_usable": _range_usable_query,
-        "revdns": _revdns_query,
-        "router": _address_prefix_query,  # deprecate
-        "size": _size_query,
-        "size_usable": _size_usable_query,
-        "subnet": _subnet_query,
-        "type": _type_query,
-        "unicast": _unicast_query,
-        "v4": _ipv4_query,
-        "v6": _ipv6_query,
-        "version": _version_query,
-        "wildcard": _hostmask_query,
-        "wrap": _wrap_query,
-    }
+def _parse_ipaddr(value, version, backend="netaddr"):
+    """Parse the value given to ipaddr
+    :param value: An IP address or network, as a string or integer
+    :param version: The IP version to assume for integers
+    :param backend: netaddr or ipaddress
+    :type backend: str
+    :return: The network, the value rewritten in the correct format
+        (None if unchanged) and the type of value or None if value is not valid
+    :rtype: tuple
+    """
+    if backend == "ipaddress":
+        return ipaddr_stdlib.parse_ipaddr(value, version)
 
     vtype = None
-
-    # Check if value is a list and parse each element
-    if isinstance(value, (list, tuple, types.GeneratorType)):
-        _ret = [ipaddr(element, str(query), version) for element in value]
-        return [item for item in _ret if item]
-
-    elif not value or value is True:
-        return False
+    normalized = None
 
     # Check if value is a number and convert it to an IP address
-    elif str(value).isdigit():
+    if str(value).isdigit():
         # We don't know what IP version to assume, so let's check IPv4 first,
         # then IPv6
         try:
@@ -518,10 +496,10 @@ def ipaddr(value, query="", version=False, alias="ipaddr"):
 
             # The value is too big for IPv6. Are you a nanobot?
             except Exception:
-                return False
+                return None
 
         # We got an IP address, let's mark it as such
-        value = str(v)
+        normalized = str(v)
         vtype = "address"
 
     # value has not been recognized, check if it's a valid IP string
@@ -549,7 +527,7 @@ def ipaddr(value, query="", version=False, alias="ipaddr"):
 
             # It's not numerical CIDR, give up
             except Exception:
-                return False
+                return None
 
             # It is something, so let's try and build a CIDR from the parts
             try:
@@ -566,40 +544,326 @@ def ipaddr(value, query="", version=False, alias="ipaddr"):
 
                 # It's not a valid IPv6 CIDR. Give up.
                 except Exception:
-                    return False
+                    return None
 
             # We have a valid CIDR, so let's write it in correct format
-            value = str(v)
+            normalized = str(v)
             vtype = "network"
 
-    # We have a query string but it's not in the known query types. Check if
-    # that string is a valid subnet, if so, we can check later if given IP
-    # address/network is inside that specific subnet
-    try:
-        # ?? 6to4 and link-local were True here before.  Should they still?
-        if (
-            query
-            and (query not in query_func_map or query == "cidr_lookup")
-            and not str(query).isdigit()
-            and ipaddr(query, "network")
-        ):
-            iplist = netaddr.IPSet([netaddr.IPNetwork(query)])
-            query = "cidr_lookup"
-    except Exception:
-        pass
+    return v, normalized, vtype
 
-    # This code checks if value maches the IP version the user wants, ie. if
-    # it's any version ("ipaddr()"), IPv4 ("ipv4()") or IPv6 ("ipv6()")
-    # If version does not match, return False
-    if version and v.version != version:
-        return False
 
-    extras = []
-    for arg in query_func_extra_args.get(query, tuple()):
-        extras.append(locals()[arg])
-    try:
-        return query_func_map[query](v, *extras)
-    except KeyError:
+# Parsed values are cached and shared, the query helpers never change
+# the parsed network in place
+IPADDR_CACHE_SIZE = 8192
+
+
+def _parse_ipaddr_prefix(value, version, backend):
+    """_parse_ipaddr, with the network also as an IPPrefix
+    :return: The network, the value rewritten in the correct format
+        (None if unchanged), the type of value and the IPPrefix of the
+        network or None if value is not valid
+    :rtype: tuple
+    """
+    parsed = _parse_ipaddr(value, version, backend)
+    if parsed is None:
+        return None
+    return parsed + (IPPrefix.from_network(parsed[0]),)
+
+
+@lru_cache(maxsize=IPADDR_CACHE_SIZE)
+def _parse_ipaddr_lru(value_type, value, version, backend):
+    """LRU cached _parse_ipaddr_prefix, value_type is only part of the key
+    so that ie. 1 and 1.0 are not treated as the same value
+    """
+    return _parse_ipaddr_prefix(value, version, backend)
+
+
+def _parse_ipaddr_cached(value, version, backend="netaddr"):
+    """Parse the value given to ipaddr using the parsed address cache
+    :param value: An IP address or network, as a string or integer
+    :param version: The IP version to assume for integers
+    :param backend: netaddr or ipaddress
+    :type backend: str
+    :return: The result from _parse_ipaddr_prefix
+    :rtype: tuple
+    """
+    # only strings and integers are cached, network objects compare equal
+    # when their host bits differ, so can not be used as a key
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        return _parse_ipaddr_prefix(value, version, backend)
+    return _parse_ipaddr_lru(type(value), value, version, backend)
+
+
+def _ip_prefix(value, backend=None):
+    """Parse an address or network the way ipaddr does
+    :param value: An IP address or network, as a string or integer
+    :param backend: netaddr or ipaddress, see ipaddr_backend
+    :type backend: str
+    :return: The address or network or None if value is not valid
+    :rtype: IPPrefix
+    """
+    if not value or value is True:
+        return None
+    parsed = _parse_ipaddr_cached(value, False, ipaddr_backend(backend))
+    if parsed is None:
+        return None
+    return parsed[3]
+
+
+def _ip_prefix_bulk(value, backend=None):
+    """_ip_prefix for the filters working on large lists of values,
+    addresses and networks in the formats IPPrefix.parse accepts skip
+    the parsed address cache, which they would only flush
+    :param value: An IP address or network, as a string or integer
+    :param backend: netaddr or ipaddress, see ipaddr_backend
+    :type backend: str
+    :return: The address or network or None if value is not valid
+    :rtype: IPPrefix
+    """
+    if isinstance(value, str):
+        try:
+            return IPPrefix.parse(value)
+        except ValueError:
+            pass
+    return _ip_prefix(value, backend)
+
+
+def _is_ip_list(value):
+    """Check if a filter argument is a list of values, any iterable but a
+    string or a dictionary, rather than a single value"""
+    return not isinstance(value, (str, bytes, dict)) and hasattr(value, "__iter__")
+
+
+def _ip_bulk_pairs(name, value, argument, argument_name):
+    """Pair up the values given to a filter with its argument, for the
+    filters accepting a list of values, a list of arguments or both
+    :param name: The name of the filter, for the error messages
+    :type name: str
+    :param value: The value or list of values
+    :param argument: The argument or list of arguments
+    :param argument_name: The name of the argument, for the error messages
+    :type argument_name: str
+    :return: The (value, argument) pairs, a single value or argument is
+        paired with every item of the other list, or None when neither
+        is a list
+    :rtype: list
+    :raises AnsibleFilterError: If both are lists of different lengths
+    """
+    value_list, argument_list = _is_ip_list(value), _is_ip_list(argument)
+    if not value_list and not argument_list:
+        return None
+    if value_list and argument_list:
+        value, argument = list(value), list(argument)
+        if len(value) != len(argument):
+            raise AnsibleFilterError(
+                "{0}: value and {1} must be lists of the same length, got {2} and {3}".format(
+                    name,
+                    argument_name,
+                    len(value),
+                    len(argument),
+                ),
+            )
+        return list(zip(value, argument))
+    if value_list:
+        return [(item, argument) for item in value]
+    return [(value, item) for item in argument]
+
+
+def ipaddr_cache_info():
+    """Return statistics about the parsed address cache
+    :return: hits, misses, maxsize, size and hit_rate of the cache
+    :rtype: dict
+    """
+    info = _parse_ipaddr_lru.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "size": info.currsize,
+        "hit_rate": float(info.hits) / lookups if lookups else 0.0,
+    }
+
+
+def ipaddr_cache_clear():
+    """Empty the parsed address cache"""
+    _parse_ipaddr_lru.cache_clear()
+
+
+# ---- ipaddr query dispatch ----
+_IPADDR_QUERY_FUNC_EXTRA_ARGS = {
+    "": ("vtype",),
+    "6to4": ("vtype", "value"),
+    "cidr_lookup": ("iplist", "value"),
+    "first_usable": ("vtype",),
+    "int": ("vtype",),
+    "ipv4": ("value",),
+    "ipv6": ("value",),
+    "last_usable": ("vtype",),
+    "link-local": ("value",),
+    "loopback": ("value",),
+    "lo": ("value",),
+    "multicast": ("value",),
+    "next_usable": ("vtype",),
+    "peer": ("vtype",),
+    "previous_usable": ("vtype",),
+    "private": ("value",),
+    "public": ("value",),
+    "unicast": ("value",),
+    "range_usable": ("vtype",),
+    "wrap": ("vtype", "value"),
+}
+
+_IPADDR_QUERY_FUNC_MAP = {
+    "": _empty_ipaddr_query,
+    "6to4": _6to4_query,
+    "address": _ip_query,
+    "address/prefix": _address_prefix_query,  # deprecate
+    "bool": _bool_ipaddr_query,
+    "broadcast": _broadcast_query,
+    "cidr": _cidr_query,
+    "cidr_lookup": _cidr_lookup_query,
+    "first_usable": _first_usable_query,
+    "gateway": _address_prefix_query,  # deprecate
+    "gw": _address_prefix_query,  # deprecate
+    "host": _host_query,
+    "host/prefix": _address_prefix_query,  # deprecate
+    "hostmask": _hostmask_query,
+    "hostnet": _address_prefix_query,  # deprecate
+    "int": _int_query,
+    "ip": _ip_query,
+    "ip/prefix": _ip_prefix_query,
+    "ip_netmask": _ip_netmask_query,
+    # 'ip_wildcard': _ip_wildcard_query, built then could not think of use case
+    "ipv4": _ipv4_query,
+    "ipv6": _ipv6_query,
+    "last_usable": _last_usable_query,
+    "link-local": _link_local_query,
+    "lo": _loopback_query,
+    "loopback": _loopback_query,
+    "multicast": _multicast_query,
+    "net": _net_query,
+    "next_usable": _next_usable_query,
+    "netmask": _netmask_query,
+    "network": _network_query,
+    "network_id": _network_query,
+    "network/prefix": _subnet_query,
+    "network_netmask": _network_netmask_query,
+    "network_wildcard": _network_wildcard_query,
+    "peer": _peer_query,
+    "prefix": _prefix_query,
+    "previous_usable": _previous_usable_query,
+    "private": _private_query,
+    "public": _public_query,
+    "range_usable": _range_usable_query,
+    "revdns": _revdns_query,
+    "router": _address_prefix_query,  # deprecate
+    "size": _size_query,
+    "size_usable": _size_usable_query,
+    "subnet": _subnet_query,
+    "type": _type_query,
+    "unicast": _unicast_query,
+    "v4": _ipv4_query,
+    "v6": _ipv6_query,
+    "version": _version_query,
+    "wildcard": _hostmask_query,
+    "wrap": _wrap_query,
+}
+
+# Queries only doing integer math, they are given the IPPrefix of the
+# value instead of the netaddr or stdlib network
+_IPADDR_PREFIX_QUERIES = frozenset(
+    [
+        "broadcast",
+        "first_usable",
+        "int",
+        "last_usable",
+        "lo",
+        "loopback",
+        "multicast",
+        "network",
+        "network_id",
+        "next_usable",
+        "peer",
+        "prefix",
+        "previous_usable",
+        "private",
+        "public",
+        "range_usable",
+        "size",
+        "size_usable",
+        "unicast",
+        "version",
+    ],
+)
+
+
+class _IpaddrQueryStep(object):
+    """A single ipaddr query, resolved once to the function handling it"""
+
+    def __init__(self, query, alias, backend):
+        """
+        :param query: The ipaddr query
+        :param alias: The name of the filter, used in error messages
+        :type alias: str
+        :param backend: netaddr or ipaddress
+        :type backend: str
+        """
+        self.query = query
+        self.alias = alias
+        self.func = None
+        self.extra_args = ()
+        self.iplist = None
+        self.use_prefix = False
+
+        # If the query string is not in the known query types, check if that
+        # string is a valid subnet, if so, we can check later if given IP
+        # address/network is inside that specific subnet
+        try:
+            # ?? 6to4 and link-local were True here before.  Should they still?
+            if (
+                query
+                and query not in _IPADDR_QUERY_FUNC_MAP
+                and not str(query).isdigit()
+                and ipaddr(query, "network", backend=backend)
+            ):
+                if backend == "ipaddress":
+                    self.iplist = StdlibIPSet([StdlibIPNetwork.parse(query)])
+                else:
+                    self.iplist = netaddr.IPSet([netaddr.IPNetwork(query)])
+                query = "cidr_lookup"
+        except Exception:
+            pass
+
+        # cidr_lookup can only be used with a subnet as query
+        if query != "cidr_lookup" or self.iplist is not None:
+            try:
+                self.func = _IPADDR_QUERY_FUNC_MAP[query]
+                self.extra_args = _IPADDR_QUERY_FUNC_EXTRA_ARGS.get(query, tuple())
+                self.use_prefix = query in _IPADDR_PREFIX_QUERIES
+            except (KeyError, TypeError):
+                pass
+
+    def run(self, v, vtype, value, prefix):
+        """Run the query against a parsed value
+        :param v: The parsed address or network
+        :type v: netaddr.IPNetwork or StdlibIPNetwork
+        :param vtype: address or network
+        :type vtype: str
+        :param value: The value in its original format
+        :param prefix: The parsed address or network as an IPPrefix
+        :type prefix: IPPrefix
+        :return: The result of the query
+        """
+        if self.func is not None:
+            extras = {"vtype": vtype, "value": value, "iplist": self.iplist}
+            return self.func(
+                prefix if self.use_prefix else v,
+                *[extras[arg] for arg in self.extra_args],
+            )
+
+        query = self.query
         try:
             float(query)
             if v.size == 1:
@@ -618,9 +882,96 @@ def ipaddr(value, query="", version=False, alias="ipaddr"):
                 return value
 
         except Exception:
-            raise AnsibleFilterError(alias + ": unknown filter type: %s" % query)
+            raise AnsibleFilterError(self.alias + ": unknown filter type: %s" % query)
 
-    return False
+
+class _IpaddrQueryPlan(object):
+    """A compiled ipaddr query, multiple queries can be chained
+    with a pipe, ie. 'private|network/prefix', and are evaluated
+    in order against the result of the previous one
+    """
+
+    def __init__(self, query, alias, backend):
+        """
+        :param query: The ipaddr query
+        :param alias: The name of the filter, used in error messages
+        :type alias: str
+        :param backend: netaddr or ipaddress
+        :type backend: str
+        """
+        self.backend = backend
+        if isinstance(query, str) and "|" in query:
+            queries = query.split("|")
+        else:
+            queries = [query]
+        self.steps = [_IpaddrQueryStep(step, alias, backend) for step in queries]
+
+    def evaluate(self, value, version=False):
+        """Evaluate the query against a value or a list of values
+        :param value: An IP address or network, or a list of them
+        :param version: The IP version the value has to match
+        :return: The result of the query
+        """
+        # Check if value is a list and parse each element
+        if isinstance(value, (list, tuple, types.GeneratorType)):
+            _ret = [self.evaluate(element, version) for element in value]
+            return [item for item in _ret if item]
+
+        parsed = None
+        for step in self.steps:
+            if parsed is None:
+                if not value or value is True:
+                    return False
+
+                parsed = _parse_ipaddr_cached(value, version, self.backend)
+                if parsed is None:
+                    return False
+                v, normalized, vtype, prefix = parsed
+                if normalized is not None:
+                    value = normalized
+
+                # This code checks if value maches the IP version the user wants, ie. if
+                # it's any version ("ipaddr()"), IPv4 ("ipv4()") or IPv6 ("ipv6()")
+                # If version does not match, return False
+                if version and v.version != version:
+                    return False
+
+            result = step.run(v, vtype, value, prefix)
+            # filter type queries return the value itself, the next query in
+            # the chain can use the parsed value, anything else is parsed again
+            if result is not value:
+                parsed = None
+            value = result
+        return value
+
+
+@lru_cache(maxsize=256)
+def _compile_ipaddr_query_lru(query_type, query, alias, backend):
+    """LRU cached _IpaddrQueryPlan, query_type is only part of the key"""
+    return _IpaddrQueryPlan(query, alias, backend)
+
+
+def compile_ipaddr_query(query="", alias="ipaddr", backend=None):
+    """Compile an ipaddr query into a reusable plan
+    :param query: The ipaddr query, queries can be chained with a pipe
+    :param alias: The name of the filter, used in error messages
+    :type alias: str
+    :param backend: netaddr or ipaddress, see ipaddr_backend
+    :type backend: str
+    :return: The compiled query
+    :rtype: _IpaddrQueryPlan
+    """
+    backend = ipaddr_backend(backend)
+    try:
+        return _compile_ipaddr_query_lru(type(query), query, alias, backend)
+    except TypeError:
+        return _IpaddrQueryPlan(query, alias, backend)
+
+
+def ipaddr(value, query="", version=False, alias="ipaddr", backend=None):
+    """Check if string is an IP address or network and filter it"""
+
+    return compile_ipaddr_query(query, alias, backend).evaluate(value, version)
 
 
 def _need_netaddr(f_name, *args, **kwargs):
@@ -709,8 +1060,55 @@ def _win_query(v):
 
 
 # ---- HWaddr / MAC address filters ----
+# The hwaddr queries formatting a MAC address in one of the MAC_DIALECTS
+_HWADDR_DIALECTS = {
+    "bare": "bare",
+    "cisco": "cisco",
+    "eui48": "eui48",
+    "linux": "linux",
+    "pgsql": "pgsql",
+    "postgresql": "pgsql",
+    "psql": "pgsql",
+    "unix": "unix",
+    "win": "eui48",
+}
+
+
 def hwaddr(value, query="", alias="hwaddr"):
-    """Check if string is a HW/MAC address and filter it"""
+    """Check if string is a HW/MAC address and filter it, a list of
+    addresses returns the list of their results"""
+    # the formatter of the query is looked up once for the whole list
+    formatter = ipaddr_stdlib.MAC_DIALECTS.get(_HWADDR_DIALECTS.get(query))
+    if _is_ip_list(value):
+        return [_hwaddr(_hwaddr_str(item), query, alias, formatter) for item in value]
+    return _hwaddr(_hwaddr_str(value), query, alias, formatter)
+
+
+def _hwaddr_str(value):
+    """Convert a MAC address to a string as the str type of the argspec
+    does, for the single values and the items of a list alike"""
+    if isinstance(value, str):
+        return value
+    return check_type_str(value)
+
+
+def _hwaddr(value, query, alias, formatter):
+    """hwaddr for a single value
+    :param formatter: The MAC_DIALECTS formatter of query, if any
+    """
+    # EUI-48 addresses in the usual formats are parsed and formatted as
+    # integers, the other values are left to netaddr.EUI
+    if isinstance(value, str) and (formatter is not None or query in ("", "bool", "int")):
+        try:
+            mac = ipaddr_stdlib.mac_to_int(value)
+        except ValueError:
+            pass
+        else:
+            if formatter is not None:
+                return formatter(mac)
+            if query == "int":
+                return mac
+            return True if query == "bool" else value
 
     query_func_extra_args = {"": ("value",)}
 
@@ -12,6 +12,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from bisect import bisect_right
+from collections import OrderedDict
 from functools import wraps
 
 from ansible import errors
@@ -86,6 +88,162 @@ def _is_subnet_of(network_a, network_b):
         return False
 
 
+class NetworkIndex(object):
+    """A list of networks compiled to sorted integer intervals
+
+    The address space of each IP version is cut into intervals at the
+    first and after the last address of every network. Networks are
+    either nested or disjoint, so the networks covering an interval
+    form a chain, kept as the sorted tuple of their prefix lengths.
+    A network is in one of the networks of the list if the interval of
+    its first address is covered by a network with a prefix length
+    lower or equal to its own, which takes a single bisect to find.
+    Invalid networks are ignored, the same as in the in_network test.
+    """
+
+    def __init__(self, networks):
+        """
+        :param networks: The networks, as strings
+        :type networks: list
+        """
+        parsed = {4: [], 6: []}
+        for network in networks:
+            try:
+                network = ip_network(network)
+            except Exception:
+                continue
+            parsed[_get_network_version(network)].append(
+                (
+                    int(network.network_address),
+                    network.prefixlen,
+                    int(network.broadcast_address),
+                ),
+            )
+        self._tables = dict(
+            (version, self._build(sorted(ranges))) for version, ranges in parsed.items()
+        )
+
+    @staticmethod
+    def _build(ranges):
+        """Build the interval table from (first, prefixlen, last) tuples,
+        sorted so that outer networks come before the networks they contain
+        :return: The interval starts and the prefix lengths covering each interval
+        :rtype: tuple
+        """
+        starts = [0]
+        covers = [()]
+        stack = []
+
+        def _cut(start):
+            # start a new interval covered by the networks in stack
+            cover = tuple(prefixlen for _last, prefixlen in stack)
+            if starts[-1] == start:
+                covers[-1] = cover
+            elif covers[-1] != cover:
+                starts.append(start)
+                covers.append(cover)
+
+        for first, prefixlen, last in ranges:
+            while stack and stack[-1][0] < first:
+                end = stack.pop()[0]
+                _cut(end + 1)
+            stack.append((last, prefixlen))
+            _cut(first)
+        while stack:
+            end = stack.pop()[0]
+            _cut(end + 1)
+        return starts, covers
+
+    def count(self, network):
+        """Count the networks containing a network
+        :param network: The network to look up
+        :type network: ipaddress.IPv4Network or ipaddress.IPv6Network
+        :return: The number of networks of the list it is in
+        :rtype: int
+        """
+        starts, covers = self._tables[_get_network_version(network)]
+        cover = covers[bisect_right(starts, int(network.network_address)) - 1]
+        return bisect_right(cover, network.prefixlen)
+
+    def contains(self, network):
+        """Check if a network is in any of the networks
+        :param network: The network to look up
+        :type network: ipaddress.IPv4Network or ipaddress.IPv6Network
+        :rtype: bool
+        """
+        starts, covers = self._tables[_get_network_version(network)]
+        cover = covers[bisect_right(starts, int(network.network_address)) - 1]
+        return bool(cover) and cover[0] <= network.prefixlen
+
+
+# Compiled network lists, keyed by the content of the list
+NETWORK_INDEX_CACHE_SIZE = 16
+_NETWORK_INDEX_CACHE = OrderedDict()
+
+# The same compiled network lists, keyed by the id of the list object, a
+# test applied by select to every address of a list gets the same list
+# every time and should not hash it again. The list is kept so that its id
+# is not reused, and its fingerprint tells if it was changed in place.
+NETWORK_INDEX_SAMPLE_SIZE = 64
+_NETWORK_INDEX_BY_ID = OrderedDict()
+
+
+def _fingerprint(networks):
+    """A cheap fingerprint of a list of networks, its length and a
+    sample of its items, evenly spread
+    :param networks: The networks
+    :type networks: list
+    :rtype: tuple
+    """
+    step = max(1, len(networks) // NETWORK_INDEX_SAMPLE_SIZE)
+    return len(networks), networks[::step], networks[-1:]
+
+
+def _remember(cache, key, value):
+    cache[key] = value
+    if len(cache) > NETWORK_INDEX_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def network_index(networks, validate=None):
+    """Compile a list of networks to a NetworkIndex, memoized on the
+    list object, then on the content of the list
+    :param networks: The networks
+    :type networks: list
+    :param validate: Called before a new index is built, so that the
+        networks are only validated once
+    :type validate: callable
+    :rtype: NetworkIndex
+    """
+    try:
+        fingerprint = _fingerprint(networks)
+    except TypeError:
+        fingerprint = None
+    if fingerprint is not None:
+        known = _NETWORK_INDEX_BY_ID.get(id(networks))
+        if known is not None and known[0] is networks and known[1] == fingerprint:
+            _NETWORK_INDEX_BY_ID.move_to_end(id(networks))
+            return known[2]
+
+    try:
+        key = tuple(networks)
+        index = _NETWORK_INDEX_CACHE.get(key)
+    except TypeError:
+        # not a list of strings, validate will complain
+        key = index = None
+    if index is not None:
+        _NETWORK_INDEX_CACHE.move_to_end(key)
+    else:
+        if validate is not None:
+            validate()
+        index = NetworkIndex(networks)
+        if key is not None:
+            _remember(_NETWORK_INDEX_CACHE, key, index)
+    if key is not None and fingerprint is not None:
+        _remember(_NETWORK_INDEX_BY_ID, id(networks), (networks, fingerprint, index))
+    return index
+
+
 def _validate_args(plugin, doc, params):
     """argspec validator utility function"""
 
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+A content addressed, on disk cache of cli_parse results
+
+The parsed structure of a text is stored in a SQLite database under the
+sha256 of everything the parse depends on: the text, the parser name,
+command and vars, the version of its library, the OS and the raw
+contents of its template. An unchanged output parsed with an unchanged
+template is then read back without running the parser at all. The database is shared by every fork of the
+play and every run, and the least recently used results are evicted
+once their total size goes over a bound.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+
+
+try:
+    import sqlite3
+
+    HAS_SQLITE3 = True
+except ImportError:
+    HAS_SQLITE3 = False
+
+
+PARSE_CACHE_FILE = "cli_parse_cache.sqlite"
+PARSE_CACHE_SIZE = 100
+
+# Bumped when the stored format or the key changes
+_KEY_VERSION = 2
+
+
+def parse_cache_key(text, parser, template, oper_sys=None, library=None):
+    """The cache key of a parse
+    :param text: The text parsed
+    :type text: str
+    :param parser: The parser task args, name, command and vars
+    :type parser: dict
+    :param template: The raw contents of the parser template
+    :type template: bytes
+    :param oper_sys: The OS of the parse, the one of the parser task
+        args or else the one of the host
+    :type oper_sys: str
+    :param library: The name and version of the library of the parser
+    :type library: str
+    :return: The key or None if the parser vars can not be serialized
+    :rtype: str
+    """
+    key = dict((k, parser.get(k)) for k in ("name", "command", "vars"))
+    key.update(
+        {
+            "version": _KEY_VERSION,
+            "os": oper_sys,
+            "library": library,
+            "text": text,
+            "template": hashlib.sha256(template).hexdigest(),
+        },
+    )
+    try:
+        serialized = json.dumps(key, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ParseCache(object):
+    """Parse results stored in a SQLite database, bounded in size"""
+
+    def __init__(self, path, max_size=PARSE_CACHE_SIZE, clock=time.time):
+        """
+        :param path: The SQLite database, or a directory to create it in
+        :type path: str
+        :param max_size: The maximum total size of the results, in megabytes
+        :type max_size: int
+        :param clock: The function giving the current time
+        :type clock: callable
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, PARSE_CACHE_FILE)
+        self.path = path
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._db = None
+        self._db_pid = None
+
+    def _connection(self):
+        """The connection to the database, None if it can not be used"""
+        if self._db_pid != os.getpid():
+            # a connection must not be used across a fork, a broken
+            # database is only tried once per process
+            self._db_pid = os.getpid()
+            self._db = self._open() if HAS_SQLITE3 else None
+        return self._db
+
+    def _open(self):
+        """Open the database and create its table if needed"""
+        try:
+            db = sqlite3.connect(self.path, timeout=5)
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error:
+                pass
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed"
+                " (key TEXT PRIMARY KEY, parsed TEXT, size INTEGER, used REAL)",
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS parsed_used ON parsed (used)")
+            db.commit()
+            return db
+        except sqlite3.Error:
+            # a cache which can not be opened is no cache at all
+            return None
+
+    def get(self, key):
+        """Look a parsed structure up, marking it as recently used
+        :param key: The cache key, see parse_cache_key
+        :type key: str
+        :return: The parsed structure or None if unknown
+        """
+        db = self._connection()
+        row = None
+        if db is not None and key is not None:
+            try:
+                row = db.execute("SELECT parsed FROM parsed WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    with db:
+                        db.execute(
+                            "UPDATE parsed SET used = ? WHERE key = ?",
+                            (self.clock(), key),
+                        )
+            except sqlite3.Error:
+                pass
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, parsed):
+        """Store a parsed structure, then evict the least recently used
+        ones over the size bound
+        :param key: The cache key, see parse_cache_key
+        :type key: str
+        :param parsed: The parsed structure, made of native types
+        """
+        db = self._connection()
+        if db is None or key is None:
+            return
+        value = json.dumps(parsed)
+        limit = self.max_size * 1024 * 1024
+        if len(value) > limit:
+            return
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)",
+                    (key, value, len(value), self.clock()),
+                )
+                self._evict(db, limit)
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _evict(db, limit):
+        """Delete the least recently used results until the total size
+        is within the limit"""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM parsed").fetchone()[0]
+        if total <= limit:
+            return
+        excess = total - limit
+        evict = []
+        for key, size in db.execute("SELECT key, size FROM parsed ORDER BY used"):
+            evict.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM parsed WHERE key = ?", evict)
+
+    def size(self):
+        """The number of results and their total size, in bytes
+        :rtype: tuple
+        """
+        db = self._connection()
+        if db is None:
+            return 0, 0
+        return tuple(db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parsed").fetchone())
+
+
+# The caches opened by this process, by path
+_PARSE_CACHES = {}
+
+
+def parse_cache(path, max_size=PARSE_CACHE_SIZE):
+    """Return the cache stored at a path, opened once per process
+    :param path: The SQLite database, or a directory to create it in
+    :type path: str
+    :param max_size: The maximum total size of the results, in megabytes
+    :type max_size: int
+    :rtype: ParseCache
+    """
+    cache = _PARSE_CACHES.get(path)
+    if cache is None:
+        cache = _PARSE_CACHES[path] = ParseCache(path, max_size)
+    cache.max_size = max_size
+    return cache
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Cached, concurrent host name and address resolution
+
+The resolvable test looks names up with getaddrinfo and addresses with
+gethostbyaddr, both blocking calls. The results can be kept for a time
+to live, failures for their own one, in a per process cache and in a
+SQLite database. Nothing is cached by default, a cached result would
+hide a change of the records from a task retried until a host resolves.
+Ansible runs every task of every host in a worker process of its own,
+so the per process cache alone does not outlive a task; the database,
+when given, is what the forks of the play share. A list of hosts is
+resolved on a bounded pool of daemon threads, every lookup is given up
+after a timeout, and the names and addresses found in an /etc/hosts
+style file are resolvable without any lookup.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import ipaddress
+import os
+import queue
+import socket
+import threading
+import time
+
+from collections import OrderedDict
+
+
+try:
+    import sqlite3
+
+    HAS_SQLITE3 = True
+except ImportError:
+    HAS_SQLITE3 = False
+
+
+RESOLVER_CACHE_ENV = "ANSIBLE_UTILS_RESOLVABLE_CACHE"
+RESOLVER_CACHE_SIZE = 65536
+TTL = 0
+NEGATIVE_TTL = 0
+WORKERS = 16
+
+
+def _cache_key(host):
+    """The cache key of a host, the normalized address of an IP address
+    or the lower case name of a host name
+    :return: The key and whether host is an IP address
+    :rtype: tuple
+    """
+    try:
+        return "addr:{0}".format(ipaddress.ip_address(host)), True
+    except ValueError:
+        return "name:{0}".format(host.lower().rstrip(".")), False
+
+
+class ResolverCache(object):
+    """A bounded cache of lookup results, each with its own expiry time,
+    optionally backed by a SQLite database shared between processes"""
+
+    def __init__(self, maxsize=RESOLVER_CACHE_SIZE, path=None, clock=time.time):
+        """
+        :param maxsize: The maximum number of results kept in memory
+        :type maxsize: int
+        :param path: The SQLite database shared with other processes,
+            the results are only kept in memory if not given
+        :type path: str
+        :param clock: The function giving the current time, in seconds
+            since the epoch as the expiry times are shared between hosts
+        :type clock: callable
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._db = None
+        self._db_path = None
+        self._db_pid = None
+
+    def _connection(self):
+        """The connection to the shared database, None if there is none
+        or it can not be used"""
+        if self._db_pid != os.getpid():
+            # a connection must not be used across a fork, open a new one
+            self._db = self._db_path = None
+            self._db_pid = os.getpid()
+        if self._db_path != self.path:
+            # the database was changed, a broken one is only tried once
+            if self._db is not None:
+                self._db.close()
+            self._db = None
+            self._db_path = self.path
+            if self.path and HAS_SQLITE3:
+                self._open()
+        return self._db
+
+    def _open(self):
+        """Open the shared database and create its table if needed"""
+        try:
+            db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS resolvable"
+                " (key TEXT PRIMARY KEY, resolvable INTEGER, expires REAL)",
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS resolvable_expires ON resolvable (expires)")
+            db.commit()
+            self._db = db
+        except sqlite3.Error:
+            # a cache which can not be opened is no cache at all
+            self._db = None
+
+    def get(self, key):
+        """Look a result up
+        :param key: The cache key, see _cache_key
+        :type key: str
+        :return: The result or None if unknown or expired
+        :rtype: bool
+        """
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        db = self._connection()
+        if db is not None:
+            try:
+                row = db.execute(
+                    "SELECT resolvable, expires FROM resolvable WHERE key = ? AND expires > ?",
+                    (key, now),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                self._remember(key, bool(row[0]), row[1])
+                self.hits += 1
+                return bool(row[0])
+
+        self.misses += 1
+        return None
+
+    def set(self, key, resolvable, ttl):
+        """Store a result
+        :param key: The cache key, see _cache_key
+        :type key: str
+        :param resolvable: The result
+        :type resolvable: bool
+        :param ttl: The number of seconds the result is kept
+        :type ttl: int
+        """
+        if ttl <= 0:
+            return
+        expires = self.clock() + ttl
+        self._remember(key, resolvable, expires)
+        db = self._connection()
+        if db is not None:
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO resolvable VALUES (?, ?, ?)",
+                        (key, int(resolvable), expires),
+                    )
+                    # the expired results are dropped so the database stays bounded
+                    db.execute("DELETE FROM resolvable WHERE expires <= ?", (self.clock(),))
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key, resolvable, expires):
+        self._entries[key] = (resolvable, expires)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget the results kept in memory, the shared database is
+        left alone"""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class HostsIndex(object):
+    """The names and addresses of an /etc/hosts style file"""
+
+    def __init__(self, lines=()):
+        """
+        :param lines: The lines of the file
+        :type lines: iterable
+        """
+        self.names = set()
+        self.addresses = set()
+        for line in lines:
+            fields = line.split("#", 1)[0].split()
+            if len(fields) < 2:
+                continue
+            try:
+                address = ipaddress.ip_address(fields[0].split("%", 1)[0])
+            except ValueError:
+                continue
+            self.addresses.add(str(address))
+            self.names.update(name.lower().rstrip(".") for name in fields[1:])
+
+    @classmethod
+    def from_file(cls, path):
+        """:rtype: HostsIndex"""
+        with open(path) as f:
+            return cls(f)
+
+    def __contains__(self, key):
+        """Check if a cache key, see _cache_key, is in the file"""
+        kind, host = key.split(":", 1)
+        return host in (self.addresses if kind == "addr" else self.names)
+
+
+# Parsed hosts files, keyed by path and checked against their mtime and size
+_HOSTS_INDEXES = {}
+
+
+def hosts_index(path):
+    """Parse an /etc/hosts style file, once until the file changes
+    :param path: The path of the file
+    :type path: str
+    :rtype: HostsIndex
+    :raises OSError: If the file can not be read
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime, st.st_size)
+    cached = _HOSTS_INDEXES.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _HOSTS_INDEXES[path] = (stamp, HostsIndex.from_file(path))
+    return cached[1]
+
+
+class Resolver(object):
+    """Resolve host names and IP addresses through a ResolverCache"""
+
+    def __init__(
+        self,
+        cache=None,
+        getaddrinfo=socket.getaddrinfo,
+        gethostbyaddr=socket.gethostbyaddr,
+    ):
+        """
+        :param cache: The cache of the results, a new in memory one by default
+        :type cache: ResolverCache
+        :param getaddrinfo: The function resolving host names
+        :param gethostbyaddr: The function resolving IP addresses
+        """
+        self.cache = ResolverCache() if cache is None else cache
+        self.getaddrinfo = getaddrinfo
+        self.gethostbyaddr = gethostbyaddr
+
+    def _lookup(self, host, is_address):
+        """Resolve a host, without the cache"""
+        try:
+            if is_address:
+                self.gethostbyaddr(host)
+            else:
+                self.getaddrinfo(host, None)
+        except Exception:
+            return False
+        return True
+
+    def resolvable(self, host, **kwargs):
+        """Check if a host name or IP address can be resolved, see
+        resolvable_many for the keyword arguments
+        :rtype: bool
+        """
+        return self.resolvable_many([host], **kwargs)[0]
+
+    def resolvable_many(
+        self,
+        hosts,
+        timeout=None,
+        workers=WORKERS,
+        index=None,
+        ttl=TTL,
+        negative_ttl=NEGATIVE_TTL,
+    ):
+        """Check if host names and IP addresses can be resolved, the ones
+        neither in the hosts index nor in the cache are looked up
+        concurrently
+        :param hosts: The host names and IP addresses
+        :type hosts: list
+        :param timeout: The number of seconds a lookup is given before it
+            counts as failed, a timed out lookup is not cached
+        :type timeout: float
+        :param workers: The maximum number of lookups run at once
+        :type workers: int
+        :param index: The names and addresses resolvable without a lookup
+        :type index: HostsIndex
+        :param ttl: The number of seconds a successful lookup is cached
+        :type ttl: int
+        :param negative_ttl: The number of seconds a failed lookup is cached
+        :type negative_ttl: int
+        :return: Whether each host can be resolved, in the same order
+        :rtype: list
+        """
+        # the hosts to look up are left in the results as their cache key
+        results = []
+        pending = OrderedDict()
+        cached = ttl > 0 or negative_ttl > 0
+        for host in hosts:
+            key, is_address = _cache_key(host)
+            if index is not None and key in index:
+                results.append(True)
+                continue
+            result = None
+            if cached and key not in pending:
+                result = self.cache.get(key)
+                # a result is only used by a call which would have cached it
+                if result is not None and (ttl if result else negative_ttl) <= 0:
+                    result = None
+            if result is None:
+                # addresses are looked up in their normalized form
+                pending[key] = (key[5:] if is_address else host, is_address)
+                result = key
+            results.append(result)
+        if not pending:
+            return results
+
+        found = self._lookup_all(pending, timeout, workers)
+        for key, resolvable in found.items():
+            self.cache.set(key, resolvable, ttl if resolvable else negative_ttl)
+        return [
+            found.get(result, False) if isinstance(result, str) else result for result in results
+        ]
+
+    def _lookup_all(self, pending, timeout, workers):
+        """Run the lookups of the pending hosts on a pool of threads
+        :param pending: The (host, is_address) to look up, by cache key
+        :type pending: OrderedDict
+        :return: The result of the lookups which did not time out, by key
+        :rtype: dict
+        """
+        if len(pending) == 1 and timeout is None:
+            key, (host, is_address) = next(iter(pending.items()))
+            return {key: self._lookup(host, is_address)}
+
+        jobs = queue.Queue()
+        for item in pending.items():
+            jobs.put(item)
+        results = queue.Queue()
+        started = {}
+
+        def run():
+            while True:
+                try:
+                    key, (host, is_address) = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                started[key] = time.monotonic()
+                results.put((key, self._lookup(host, is_address)))
+
+        # a lookup can not be stopped, the threads are daemons so the ones
+        # stuck in a lookup which timed out do not hold the process up
+        for _i in range(max(1, min(workers, len(pending)))):
+            thread = threading.Thread(target=run, name="resolvable")
+            thread.daemon = True
+            thread.start()
+
+        found = {}
+        given_up = set()
+        while len(found) + len(given_up) < len(pending):
+            wait_for = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadlines = []
+                for key, start in list(started.items()):
+                    if key in found or key in given_up:
+                        continue
+                    if now - start >= timeout:
+                        given_up.add(key)
+                    else:
+                        deadlines.append(start + timeout)
+                if len(found) + len(given_up) >= len(pending):
+                    break
+                wait_for = max(0, min(deadlines) - now) if deadlines else timeout
+            try:
+                key, resolvable = results.get(timeout=wait_for)
+            except queue.Empty:
+                continue
+            if key not in given_up:
+                found[key] = resolvable
+        return found
+
+
+# The resolver of the resolvable test, its cache lives as long as the process
+_RESOLVER = Resolver()
+
+
+def resolver(cache_file=None):
+    """Return the resolver of the resolvable test
+    :param cache_file: The SQLite database shared between processes,
+        defaults to the ANSIBLE_UTILS_RESOLVABLE_CACHE environment variable
+    :type cache_file: str
+    :rtype: Resolver
+    """
+    _RESOLVER.cache.path = cache_file or os.environ.get(RESOLVER_CACHE_ENV) or None
+    return _RESOLVER
@@ -31,3 +31,4 @@ def _validate_args(plugin, doc, params):
                 argspec_errors=argspec_result.get("errors"),
             ),
         )
+    return updated_params
@@ -12,11 +12,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-import json
-
 from ansible.module_utils.common.text.converters import to_native
 from jinja2.exceptions import TemplateSyntaxError
 
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import to_native_types
+
 
 # Note, this file can only be used on the control node
 # where ansible is installed
@@ -58,7 +58,7 @@ def _to_well_known_type(obj):
     :param obj: the obj to convert
     :type obj: unknown
     """
-    return json.loads(json.dumps(obj))
+    return to_native_types(obj)
 
 
 def _run_test(entry, test, right, tests):
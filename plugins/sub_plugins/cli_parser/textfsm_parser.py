@@ -38,12 +38,17 @@ EXAMPLES = r"""
   register: nxos_textfsm_text
 """
 
+import copy
+import io
 import os
 
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.text.converters import to_native
 
-from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import CliParserBase
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.cli_parser import (
+    CliParserBase,
+    TemplateCache,
+)
 
 
 try:
@@ -54,6 +59,40 @@ except ImportError:
     HAS_TEXTFSM = False
 
 
+def _compile_template(content):
+    """Compile the content of a textfsm template"""
+    return textfsm.TextFSM(io.StringIO(content))
+
+
+def _clone_fsm(fsm):
+    """A fresh parser sharing the compiled states of a cached one
+
+    Only the values and their options hold the state of a parse, they
+    are copied and the copy is reset, the compiled rules are shared.
+    This is several times cheaper than copy.deepcopy or compiling the
+    template again.
+    """
+    clone = copy.copy(fsm)
+    clone.values = []
+    for value in fsm.values:
+        value = copy.copy(value)
+        value.fsm = clone
+        options = []
+        for option in value.options:
+            option = copy.copy(option)
+            option.value = value
+            options.append(option)
+        value.options = options
+        clone.values.append(value)
+    clone.Reset()
+    return clone
+
+
+# The compiled templates of this process, that is of the task at hand,
+# every parse uses a clone
+_TEMPLATE_CACHE = TemplateCache(_compile_template)
+
+
 class CliParser(CliParserBase):
     """The textfsm parser class
     Convert raw text to structured data using textfsm
@@ -61,6 +100,7 @@ class CliParser(CliParserBase):
 
     DEFAULT_TEMPLATE_EXTENSION = "textfsm"
     PROVIDE_TEMPLATE_CONTENTS = False
+    LIBRARY = "textfsm"
 
     @staticmethod
     def _check_reqs():
@@ -101,11 +141,16 @@ class CliParser(CliParserBase):
                 ),
             }
         try:
-            template = open(self._task_args.get("parser").get("template_path"))
-        except IOError as exc:
+            re_table = _clone_fsm(_TEMPLATE_CACHE.get(template_path))
+        except (IOError, OSError) as exc:
             return {"errors": to_native(exc)}
+        if self._debug:
+            self._debug(
+                "textfsm template cache: {hits} hits, {misses} misses, {size} templates".format(
+                    **_TEMPLATE_CACHE.info()
+                ),
+            )
 
-        re_table = textfsm.TextFSM(template)
         fsm_results = re_table.ParseText(cli_output)
 
         results = list()
@@ -61,6 +61,7 @@ class CliParser(CliParserBase):
 
     DEFAULT_TEMPLATE_EXTENSION = "ttp"
     PROVIDE_TEMPLATE_CONTENTS = False
+    LIBRARY = "ttp"
 
     @staticmethod
     def _check_reqs():
@@ -58,7 +58,10 @@ from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.text.converters import to_text
 from ansible.utils.display import Display
 
-from ansible_collections.ansible.utils.plugins.module_utils.common.utils import to_list
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import (
+    to_list,
+    to_native_types,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.validate import ValidateBase
 
 
@@ -140,7 +143,7 @@ class Validate(ValidateBase):
             if isinstance(self._data, str):
                 self._data = json.loads(self._data)
             else:
-                self._data = json.loads(json.dumps(self._data))
+                self._data = to_native_types(self._data)
 
         except (TypeError, JSONDecodeError) as exe:
             msg = (
@@ -157,7 +160,7 @@ class Validate(ValidateBase):
                 if isinstance(self._criteria, str):
                     criteria.append(json.loads(item))
                 else:
-                    criteria.append(json.loads(json.dumps(item)))
+                    criteria.append(to_native_types(item))
 
             self._criteria = criteria
         except (TypeError, JSONDecodeError) as exe:
@@ -9,8 +9,13 @@ Test plugin file for netaddr tests: in_any_network
 
 from __future__ import absolute_import, division, print_function
 
+from functools import partial
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    ip_network,
+    network_index,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.utils import _validate_args
-from ansible_collections.ansible.utils.plugins.test.in_network import _in_network
 
 
 __metaclass__ = type
@@ -92,12 +97,18 @@ def _in_any_network(ip, networks):
     """Test if an IP or network is in any network"""
 
     params = {"ip": ip, "networks": networks}
-    _validate_args("in_any_network", DOCUMENTATION, params)
-
-    bools = [_in_network(ip, network) for network in networks]
-    if True in bools:
-        return True
-    return False
+    # the address is validated on every call, the networks only when
+    # they are compiled, not for every address
+    _validate_args("in_any_network", DOCUMENTATION, dict(params, networks=[]))
+    index = network_index(
+        networks,
+        validate=partial(_validate_args, "in_any_network", DOCUMENTATION, params),
+    )
+
+    try:
+        return index.contains(ip_network(ip))
+    except Exception:
+        return False
 
 
 class TestModule(object):
@@ -9,6 +9,7 @@ Test plugin file for netaddr tests: private
 
 from __future__ import absolute_import, division, print_function
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ip_special_ranges
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_ipaddress,
     ip_address,
@@ -78,7 +79,8 @@ def _private(ip):
     _validate_args("private", DOCUMENTATION, params)
 
     try:
-        return ip_address(ip).is_private
+        addr = ip_address(ip)
+        return ip_special_ranges.is_private(int(addr), addr.version)
     except Exception:
         return False
 
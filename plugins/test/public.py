@@ -9,6 +9,7 @@ Test plugin file for netaddr tests: public
 
 from __future__ import absolute_import, division, print_function
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ip_special_ranges
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_ipaddress,
     _validate_args,
@@ -78,7 +79,8 @@ def _public(ip):
     _validate_args("public", DOCUMENTATION, params)
 
     try:
-        return ip_address(ip).is_global
+        addr = ip_address(ip)
+        return ip_special_ranges.is_global(int(addr), addr.version)
     except Exception:
         return False
 
@@ -9,6 +9,7 @@ Test plugin file for netaddr tests: reserved
 
 from __future__ import absolute_import, division, print_function
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ip_special_ranges
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_ipaddress,
     ip_address,
@@ -78,7 +79,8 @@ def _reserved(ip):
     _validate_args("reserved", DOCUMENTATION, params)
 
     try:
-        return ip_address(ip).is_reserved
+        addr = ip_address(ip)
+        return ip_special_ranges.is_reserved(int(addr), addr.version)
     except Exception:
         return False
 
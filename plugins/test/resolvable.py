@@ -8,21 +8,19 @@ Test plugin file for netaddr tests: resolvable
 """
 from __future__ import absolute_import, division, print_function
 
-import socket
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.validation import check_type_str
 
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
     _need_ipaddress,
 )
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.resolver import (
+    hosts_index,
+    resolver,
+)
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.utils import _validate_args
 
 
-try:
-    import ipaddress
-
-    HAS_IPADDRESS = True
-except ImportError:
-    HAS_IPADDRESS = False
-
 __metaclass__ = type
 
 DOCUMENTATION = """
@@ -32,13 +30,60 @@ DOCUMENTATION = """
     short_description: Test if an IP or name can be resolved via /etc/hosts or DNS
     description:
         - This plugin checks if the provided IP address of host name can be resolved using /etc/hosts or DNS
+        - Every evaluation looks the host up again unless I(ttl) or I(negative_ttl) is set, the results are
+          then cached for that many seconds. A cached result hides a change of the DNS records, a task
+          retried C(until) a host is resolvable should not cache failed lookups.
+        - Ansible evaluates a task in a worker process of its own, the cache only lasts for the task on
+          the host at hand unless I(cache_file) is set, the tasks and the forks of the play then share
+          the results through that database.
+        - A list of hosts is resolved concurrently, the test is true if all of them can be resolved.
+          With I(ttl) set, a later C(select('ansible.utils.resolvable', ttl=...)) over the same list
+          does not look the hosts up again.
     options:
         host:
             description:
             - A string that represents the IP address or the host name
             - 'For example: C("docs.ansible.com"), C(127.0.0.1), or C(::1)'
-            type: str
+            - A list of them, looked up on a pool of I(workers) threads.
+            - Any other value, as well as the items of a list, is converted to a string.
+            type: raw
             required: True
+        timeout:
+            description:
+            - The number of seconds a lookup is given before the host counts as not resolvable.
+            - A lookup which timed out is not cached. Its thread can not be stopped, it is left to finish
+              in the background and does not prevent the worker process from exiting.
+            - By default the timeouts of the system resolver apply.
+            type: float
+        workers:
+            description:
+            - The maximum number of lookups run at once for a list of hosts.
+            type: int
+            default: 16
+        hosts_file:
+            description:
+            - An /etc/hosts style file, the names and addresses it lists are resolvable without any lookup.
+            - The file is read again only when it changes.
+            type: path
+        ttl:
+            description:
+            - The number of seconds a successful lookup is cached, with C(0) successful lookups are neither
+              cached nor read from the cache.
+            type: int
+            default: 0
+        negative_ttl:
+            description:
+            - The number of seconds a failed lookup is cached, with C(0) failed lookups are neither cached nor
+              read from the cache.
+            type: int
+            default: 0
+        cache_file:
+            description:
+            - A SQLite database the results are shared through between processes, created if needed.
+            - Defaults to the C(ANSIBLE_UTILS_RESOLVABLE_CACHE) environment variable.
+            - Only used when I(ttl) or I(negative_ttl) is set, the expired results are removed as new ones
+              are stored.
+            type: path
     notes:
 """
 
@@ -107,6 +152,17 @@ EXAMPLES = r"""
 #     "changed": false,
 #     "msg": "All assertions passed"
 # }
+
+- name: Resolve a list of names at once, then keep the resolvable ones
+  ansible.builtin.set_fact:
+    all_resolvable: "{{ names is ansible.utils.resolvable(timeout=2, workers=32, ttl=300) }}"
+    resolvable_names: "{{ names | select('ansible.utils.resolvable', ttl=300) }}"
+  vars:
+    names: ['docs.ansible.com', 'www.redhat.com', 'foo.google.com']
+
+- name: Share the results between the forks of the play and skip the names in a hosts file
+  ansible.builtin.set_fact:
+    data: "{{ inventory_hostname is ansible.utils.resolvable(hosts_file='files/hosts', ttl=300, cache_file='/tmp/resolvable.sqlite') }}"
 """
 
 RETURN = """
@@ -118,29 +174,27 @@ RETURN = """
 
 
 @_need_ipaddress
-def _resolvable(host):
+def _resolvable(host, **kwargs):
     """Test if an IP or name can be resolved via /etc/hosts or DNS"""
 
     params = {"host": host}
-    _validate_args("resolvable", DOCUMENTATION, params)
-
-    try:
-        ipaddress.ip_address(host)
-        ip = True
-    except Exception:
-        ip = False
-    if ip:
-        try:
-            socket.gethostbyaddr(host)
-            return True
-        except Exception:
-            return False
-    else:
+    params.update(kwargs)
+    params = _validate_args("resolvable", DOCUMENTATION, params)
+
+    host = params.pop("host")
+    hosts = host if isinstance(host, (list, tuple)) else [host]
+    # converted as the str type of the argspec converts a single value
+    hosts = [h if isinstance(h, str) else check_type_str(h) for h in hosts]
+
+    hosts_file = params.pop("hosts_file")
+    if hosts_file:
         try:
-            socket.getaddrinfo(host, None)
-            return True
-        except Exception:
-            return False
+            params["index"] = hosts_index(hosts_file)
+        except (IOError, OSError) as exc:
+            raise AnsibleError("resolvable: can not read {0}: {1}".format(hosts_file, exc))
+
+    results = resolver(params.pop("cache_file")).resolvable_many(hosts, **params)
+    return all(results)
 
 
 class TestModule(object):
@@ -13,11 +13,28 @@ from unittest import TestCase
 
 from ansible_collections.ansible.utils.plugins.module_utils.common.argspec_validate import (
     AnsibleArgSpecValidator,
+    clear_schema_cache,
+    schema_cache_info,
 )
 
 from .fixtures.docstring import DOCUMENTATION
 
 
+FLAT_DOCUMENTATION = """
+options:
+    ip:
+        type: str
+        required: True
+    networks:
+        type: list
+        elements: str
+    version:
+        type: int
+        default: 4
+        choices: [4, 6]
+"""
+
+
 class TestSortList(TestCase):
     def test_simple_pass(self):
         data = {"param_str": "string"}
@@ -155,3 +172,64 @@ class TestSortList(TestCase):
         valid, errors, _updated_data = aav.validate()
         self.assertFalse(valid)
         self.assertIn("Invalid schema. Invalid keys found: not_valid", errors)
+
+    def test_schema_cache(self):
+        clear_schema_cache()
+        for _i in range(3):
+            aav = AnsibleArgSpecValidator(
+                data={"param_str": "string"},
+                schema=DOCUMENTATION,
+                schema_format="doc",
+                schema_conditionals={},
+                name="test_action",
+            )
+            valid, _errors, updated_data = aav.validate()
+            self.assertTrue(valid)
+            self.assertEqual(updated_data["param_default"], True)
+        self.assertEqual(schema_cache_info(), {"hits": 2, "misses": 1, "size": 1})
+
+    def test_schema_cache_conditionals(self):
+        clear_schema_cache()
+        data = {"param_str": "string"}
+        aav = AnsibleArgSpecValidator(data=data, schema=DOCUMENTATION, name="test_action")
+        valid, _errors, _updated_data = aav.validate()
+        self.assertTrue(valid)
+        aav = AnsibleArgSpecValidator(
+            data=data,
+            schema=DOCUMENTATION,
+            schema_conditionals={"required_together": [["param_str", "param_bool"]]},
+            name="test_action",
+        )
+        valid, _errors, _updated_data = aav.validate()
+        self.assertFalse(valid)
+        self.assertEqual(schema_cache_info()["misses"], 2)
+
+    def test_fast_validate(self):
+        aav = AnsibleArgSpecValidator(data={}, schema=FLAT_DOCUMENTATION)
+        compiled = aav._get_compiled_schema()
+        self.assertEqual(
+            compiled.fast_validate({"ip": "10.1.1.1", "networks": ["10.0.0.0/8"]}),
+            {"ip": "10.1.1.1", "networks": ["10.0.0.0/8"], "version": 4},
+        )
+        # coercion and errors are left to the ArgumentSpecValidator
+        self.assertIsNone(compiled.fast_validate({"ip": 167837953}))
+        self.assertIsNone(compiled.fast_validate({"ip": "10.1.1.1", "version": 5}))
+        self.assertIsNone(compiled.fast_validate({"networks": ["10.0.0.0/8"]}))
+        self.assertIsNone(compiled.fast_validate({"ip": "10.1.1.1", "invalid": True}))
+
+    def test_fast_validate_fallback(self):
+        aav = AnsibleArgSpecValidator(data={"ip": 167837953}, schema=FLAT_DOCUMENTATION)
+        valid, _errors, updated_data = aav.validate()
+        self.assertTrue(valid)
+        self.assertEqual(updated_data["ip"], "167837953")
+        aav = AnsibleArgSpecValidator(
+            data={"ip": "10.1.1.1", "version": 5}, schema=FLAT_DOCUMENTATION
+        )
+        valid, errors, _updated_data = aav.validate()
+        self.assertFalse(valid)
+        self.assertIn("value of version must be one of: 4, 6, got: 5", errors[0])
+
+    def test_fast_validate_unsupported_schema(self):
+        aav = AnsibleArgSpecValidator(data={}, schema=DOCUMENTATION)
+        compiled = aav._get_compiled_schema()
+        self.assertIsNone(compiled.fast_validate({"param_str": "string"}))
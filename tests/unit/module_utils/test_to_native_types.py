@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+
+from collections import OrderedDict
+from enum import IntEnum
+from unittest import TestCase
+
+from ansible.parsing.yaml.objects import AnsibleUnicode
+
+from ansible_collections.ansible.utils.plugins.module_utils.common.utils import to_native_types
+
+
+class Number(IntEnum):
+    ONE = 1
+
+
+class Items(list):
+    pass
+
+
+def _types(obj):
+    """The types of a structure, keys included, in order"""
+    if isinstance(obj, dict):
+        return [type(obj)] + [t for k, v in obj.items() for t in [type(k)] + _types(v)]
+    if isinstance(obj, list):
+        return [type(obj)] + [t for v in obj for t in _types(v)]
+    return [type(obj)]
+
+
+class TestToNativeTypes(TestCase):
+    def test_round_trip(self):
+        """Check the result is the one of a JSON round trip, types included"""
+        cases = [
+            1,
+            None,
+            AnsibleUnicode("text"),
+            Number.ONE,
+            (),
+            {},
+            [1, (2, 3), Items([4, [5]])],
+            OrderedDict([("b", OrderedDict([("c", (1,))])), ("a", [Number.ONE])]),
+            {1: "int", None: "none", False: "bool", 1.5: "float", "1": "str"},
+            [AnsibleUnicode("a"), {AnsibleUnicode("key"): [AnsibleUnicode("value")]}],
+            {"list": [[[], {}], [{"a": [OrderedDict()]}]]},
+        ]
+        for case in cases:
+            expected = json.loads(json.dumps(case))
+            result = to_native_types(case)
+            self.assertEqual(result, expected)
+            self.assertEqual(_types(result), _types(expected))
+
+    def test_native_not_copied(self):
+        native = {"a": [{"b": [1, "c"]}, None], "d": {"e": 1.5}}
+        self.assertIs(to_native_types(native), native)
+        mixed = [native["a"], (native["d"],)]
+        result = to_native_types(mixed)
+        self.assertIsNot(result, mixed)
+        self.assertIs(result[0], native["a"])
+        self.assertIs(result[1][0], native["d"])
+
+    def test_shared(self):
+        shared = [1, [2]]
+        self.assertEqual(to_native_types([shared, (shared,)]), [[1, [2]], [[1, [2]]]])
+
+    def test_deep(self):
+        value = []
+        for _i in range(100000):
+            value = [OrderedDict([("a", value)])]
+        depth = 0
+        result = to_native_types(value)
+        while result:
+            self.assertIs(type(result[0]), dict)
+            result = result[0]["a"]
+            depth += 1
+        self.assertEqual(depth, 100000)
+
+    def test_circular(self):
+        value = [1]
+        value.append({"a": value})
+        with self.assertRaises(ValueError):
+            to_native_types(value)
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError) as exc:
+            to_native_types({"a": [{1, 2}]})
+        self.assertIn("set", str(exc.exception))
+        with self.assertRaises(TypeError):
+            to_native_types({(1, 2): "tuple key"})
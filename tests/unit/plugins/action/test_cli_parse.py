@@ -7,8 +7,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import shutil
 import tempfile
 
+from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -104,7 +106,10 @@ class TestCli_Parse(TestCase):
             **kwargs,
         )
 
-        self.assertIn("one of the following is required: command, text", result["errors"])
+        self.assertIn(
+            "one of the following is required: command, text, commands",
+            result["errors"],
+        )
 
     def test_fn_check_argspec_fail_no_parser_name(self):
         """Confirm failed argspec no parser name"""
@@ -535,3 +540,270 @@ class TestCli_Parse(TestCase):
         result = self._plugin.run(task_vars=task_vars)
         self.assertEqual(result["failed"], True)
         self.assertEqual([msg], result["msg"])
+
+    def test_fn_extended_check_argspec_commands_missing_parser(self):
+        """Confirm failed argspec when a command has no parser"""
+        self._plugin._task.args = {
+            "commands": [
+                {"command": "show version", "parser": {"name": "ansible.utils.textfsm"}},
+                {"command": "show interface"},
+            ],
+        }
+        self._plugin._extended_check_argspec()
+        self.assertTrue(self._plugin._result["failed"])
+        self.assertIn("every entry of commands", self._plugin._result["msg"])
+
+    def test_fn_extended_check_argspec_commands_duplicate(self):
+        """Confirm failed argspec when a command is listed twice"""
+        self._plugin._task.args = {
+            "commands": [
+                {"command": "show version"},
+                {"command": "show interface"},
+                {"command": "show version", "parser": {"name": "ansible.utils.json"}},
+            ],
+            "parser": {"name": "ansible.utils.textfsm"},
+        }
+        self._plugin._extended_check_argspec()
+        self.assertTrue(self._plugin._result["failed"])
+        self.assertIn("commands must be unique", self._plugin._result["msg"])
+        self.assertIn("show version", self._plugin._result["msg"])
+        self.assertNotIn("show interface", self._plugin._result["msg"])
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_batch_decoded(self, mock_rpc):
+        """Check the output the connection returns decoded is parsed as text"""
+        mock_rpc.return_value = [{"version": "9.2(2)"}, ["a", 1]]
+        self._plugin._connection.socket_path = tempfile.NamedTemporaryFile().name
+        self._plugin._task.args = {
+            "commands": [{"command": "show version | json"}, {"command": "show list | json"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertNotIn("failed", result)
+        self.assertEqual(
+            result["parsed"],
+            {"show version | json": {"version": "9.2(2)"}, "show list | json": ["a", 1]},
+        )
+        self.assertEqual(result["stdout"]["show version | json"], '{"version": "9.2(2)"}')
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_batch_network(self, mock_rpc):
+        """Check a batch of commands is sent in a single request and
+        parsed with a parser per command
+        """
+        mock_out = self._load_fixture("nxos_show_version.txt")
+        mock_rpc.return_value = [mock_out, "{}", mock_out]
+        self._plugin._connection.socket_path = tempfile.NamedTemporaryFile().name
+        template_path = os.path.join(
+            os.path.dirname(__file__),
+            "fixtures",
+            "nxos_show_version.textfsm",
+        )
+        self._plugin._task.args = {
+            "commands": [
+                {"command": "show version"},
+                {"command": "show json", "parser": {"name": "ansible.utils.json"}},
+                {"command": "show version | no-more"},
+            ],
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+            "set_fact": "new_fact",
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        mock_rpc.assert_called_once_with(
+            "run_commands",
+            commands=["show version", "show json", "show version | no-more"],
+            check_rc=True,
+        )
+        self.assertEqual(
+            sorted(result["parsed"]),
+            ["show json", "show version", "show version | no-more"],
+        )
+        self.assertEqual(result["parsed"]["show version"][0]["version"], "9.2(2)")
+        self.assertEqual(result["parsed"]["show json"], {})
+        self.assertEqual(result["parsed"]["show version | no-more"][0]["version"], "9.2(2)")
+        self.assertEqual(result["stdout"]["show json"], "{}")
+        self.assertEqual(result["ansible_facts"]["new_fact"], result["parsed"])
+        # the task args are left as they were
+        self.assertNotIn("text", self._plugin._task.args)
+
+    def test_fn_run_batch_lx(self):
+        """Check a batch of commands run one by one without a persistent
+        connection, and the first failure stops the task
+        """
+        self._plugin._connection.socket_path = None
+        self._plugin._low_level_execute_command = MagicMock()
+        self._plugin._low_level_execute_command.side_effect = [
+            {"rc": 0, "stdout": "[1]", "stdout_lines": ["[1]"], "stderr": ""},
+            {"rc": 1, "stdout": "", "stdout_lines": [], "stderr": "not found"},
+        ]
+        self._plugin._task.args = {
+            "commands": [{"command": "one"}, {"command": "two"}, {"command": "three"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertEqual(result, {"failed": True, "msg": "not found"})
+        self.assertEqual(self._plugin._low_level_execute_command.call_count, 2)
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_batch_parser_error(self, mock_rpc):
+        """Check the failing command is named when its output can not be parsed"""
+        mock_rpc.return_value = ["{}", "not json"]
+        self._plugin._connection.socket_path = tempfile.NamedTemporaryFile().name
+        self._plugin._task.args = {
+            "commands": [{"command": "one"}, {"command": "two"}],
+            "parser": {"name": "ansible.utils.json"},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        result = self._plugin.run(task_vars=task_vars)
+        self.assertTrue(result["failed"])
+        self.assertTrue(result["msg"].startswith("two: "))
+        self.assertNotIn("stdout", result)
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_cache(self, mock_rpc):
+        """Check an unchanged output is read back from the cache without
+        running the parser
+        """
+        mock_out = self._load_fixture("nxos_show_version.txt")
+        mock_rpc.return_value = mock_out
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(
+            os.path.dirname(__file__),
+            "fixtures",
+            "nxos_show_version.textfsm",
+        )
+        args = {
+            "command": "show version",
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+            "cache": {"path": tmpdir},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+
+        def run():
+            self.setUp()
+            self._plugin._connection.socket_path = tempfile.NamedTemporaryFile().name
+            self._plugin._task.args = deepcopy(args)
+            return self._plugin.run(task_vars=task_vars)
+
+        results = [run()]
+        # the parser is not run on a cache hit
+        with patch(
+            "ansible_collections.ansible.utils.plugins.sub_plugins.cli_parser."
+            "textfsm_parser.CliParser.parse",
+            side_effect=AssertionError("parsed again"),
+        ):
+            results.append(run())
+        self.assertFalse(results[0]["cache_hit"])
+        self.assertTrue(results[1]["cache_hit"])
+        self.assertEqual(results[1]["parsed"], results[0]["parsed"])
+        self.assertEqual(results[1]["parsed"][0]["version"], "9.2(2)")
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "cli_parse_cache.sqlite")))
+
+    @patch("ansible.module_utils.connection.Connection.__rpc__")
+    def test_fn_run_batch_cache(self, mock_rpc):
+        """Check the cache hits of a batch are reported per command"""
+        mock_out = self._load_fixture("nxos_show_version.txt")
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(
+            os.path.dirname(__file__),
+            "fixtures",
+            "nxos_show_version.textfsm",
+        )
+        args = {
+            "commands": [{"command": "one"}, {"command": "two"}],
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+            "cache": {"path": os.path.join(tmpdir, "cache.sqlite")},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        results = []
+        for response in (
+            [mock_out, mock_out],
+            [mock_out, mock_out.replace("9.2(2)", "9.3(8)")],
+        ):
+            self.setUp()
+            mock_rpc.return_value = response
+            self._plugin._connection.socket_path = tempfile.NamedTemporaryFile().name
+            self._plugin._task.args = deepcopy(args)
+            results.append(self._plugin.run(task_vars=task_vars))
+        self.assertEqual(results[0]["cache_hit"], {"one": False, "two": False})
+        self.assertEqual(results[1]["cache_hit"], {"one": True, "two": False})
+        self.assertEqual(results[1]["parsed"]["one"][0]["version"], "9.2(2)")
+        self.assertEqual(results[1]["parsed"]["two"][0]["version"], "9.3(8)")
+
+    def _run_cache(self, args, task_vars):
+        """Run the plugin twice with the same text, return both results"""
+        results = []
+        for _i in range(2):
+            self.setUp()
+            self._plugin._task.args = deepcopy(args)
+            results.append(self._plugin.run(task_vars=deepcopy(task_vars)))
+        return results
+
+    def test_fn_run_cache_key(self):
+        """Check the OS of the host and the library version of the parser
+        are part of the cache key
+        """
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(
+            os.path.dirname(__file__),
+            "fixtures",
+            "nxos_show_version.textfsm",
+        )
+        args = {
+            "text": self._load_fixture("nxos_show_version.txt"),
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+            "cache": {"path": tmpdir},
+        }
+        task_vars = {"inventory_hostname": "mockdevice", "ansible_network_os": "cisco.nxos.nxos"}
+        results = self._run_cache(args, task_vars)
+        self.assertEqual([r["cache_hit"] for r in results], [False, True])
+
+        task_vars["ansible_network_os"] = "cisco.ios.ios"
+        self.assertFalse(self._run_cache(args, task_vars)[0]["cache_hit"])
+
+        with patch(
+            "ansible_collections.ansible.utils.plugins.action.cli_parse.version",
+            return_value="0.0.1",
+        ):
+            self.assertFalse(self._run_cache(args, task_vars)[0]["cache_hit"])
+
+    def test_fn_run_cache_no_template(self):
+        """Check a parser without a template is not cached"""
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        args = {
+            "text": '{"a": 1}',
+            "parser": {"name": "ansible.utils.json"},
+            "cache": {"path": tmpdir},
+        }
+        results = self._run_cache(args, {"inventory_hostname": "mockdevice"})
+        self.assertEqual([r["cache_hit"] for r in results], [False, False])
+        self.assertEqual(results[1]["parsed"], {"a": 1})
+        self.assertEqual(self._plugin._cache.size()[0], 0)
+
+    def test_fn_run_cache_template_not_utf8(self):
+        """Check a template which is not utf-8 is left to the parser as
+        without the cache
+        """
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(tmpdir, "show_version.textfsm")
+        with open(template_path, "wb") as fhand:
+            fhand.write(b"# r\xe9sum\xe9\nValue version (\\S+)\n\nStart\n  ^${version}\n")
+        args = {
+            "text": "9.2(2)",
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+        }
+        task_vars = {"inventory_hostname": "mockdevice"}
+        expected = self._run_cache(args, task_vars)[0]
+        args["cache"] = {"path": tmpdir}
+        results = self._run_cache(args, task_vars)
+        self.assertEqual([r.pop("cache_hit") for r in results], [False, True])
+        self.assertEqual(results, [expected, expected])
+        self.assertEqual(expected["parsed"], [{"version": "9.2(2)"}])
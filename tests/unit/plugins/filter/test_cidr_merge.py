@@ -65,3 +65,14 @@ class TestCidrMerge(TestCase):
         with self.assertRaises(AnsibleFilterError) as error:
             _cidr_merge(*args, **kwargs)
         self.assertIn("cidr_merge: invalid action 'span1'", str(error.exception))
+
+    def test_valid_data_merge_generator(self):
+        """test for cidr_merge plugin with a generator"""
+
+        args = ["", (subnet for subnet in VALID_DATA_MEREGE), "merge"]
+        result = _cidr_merge(*args)
+        self.assertEqual(result, VALID_OUTPUT_MERGE)
+
+        args = ["", (subnet for subnet in VALID_DATA_SPAN), "span"]
+        result = _cidr_merge(*args)
+        self.assertEqual(result, VALID_OUTPUT_SPAN)
@@ -14,6 +14,8 @@ __metaclass__ = type
 
 from unittest import TestCase
 
+from ansible.errors import AnsibleFilterError
+
 from ansible_collections.ansible.utils.plugins.filter.hwaddr import _hwaddr
 
 
@@ -32,3 +34,35 @@ class Test_hwaddr(TestCase):
         args = ["", "1a:2b:3c:4d:5e:6f", "cisco"]
         result = _hwaddr(*args)
         self.assertEqual(result, "1a2b.3c4d.5e6f")
+
+    def test_hwaddr_filter_list(self):
+        """hwaddr filter with a list of addresses"""
+        args = ["", ["1A2B.3C4D.5E6F", "1a-2b-3c-4d-5e-70", "1a2b3c4d5e71"], "linux"]
+        result = _hwaddr(*args)
+        self.assertEqual(result, ["1a:2b:3c:4d:5e:6f", "1a:2b:3c:4d:5e:70", "1a:2b:3c:4d:5e:71"])
+
+        args = ["", ["1a:2b:3c:4d:5e:6f", "invalid", "01:02:03:04:05:06:07:08"], "bool"]
+        result = _hwaddr(*args)
+        self.assertEqual(result, [True, None, True])
+
+        args = ["", ["1a:2b:3c:4d:5e:6f", "invalid"], "cisco"]
+        with self.assertRaises(AnsibleFilterError) as error:
+            _hwaddr(*args)
+        self.assertIn("hwaddr: not a hardware address: invalid", str(error.exception))
+
+    def test_hwaddr_filter_list_not_str(self):
+        """Items of a list are converted to strings like a single value"""
+        values = [0x1A2B3C4D5E6F, 1.5, None]
+        for query in ("", "bool", "linux"):
+            expected = []
+            for value in values:
+                try:
+                    expected.append(_hwaddr("", value, query))
+                except AnsibleFilterError as error:
+                    expected.append(str(error))
+            try:
+                result = _hwaddr("", values, query)
+            except AnsibleFilterError as error:
+                self.assertIn(str(error), expected)
+            else:
+                self.assertEqual(result, expected)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_contains filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_contains import _ip_contains
+
+
+class Test_ip_contains(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        args = ["", ["10.0.0.0/8"]]
+        kwargs = {}
+        with self.assertRaises(AnsibleError) as error:
+            _ip_contains(*args, **kwargs)
+        self.assertIn("missing required arguments: other", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_contains("", ["10.0.0.0/8"], ["10.0.0.0/33"])
+        self.assertIn(
+            "ip_contains: invalid IP address or network '10.0.0.0/33'", str(error.exception)
+        )
+
+    def test_ip_contains_filter(self):
+        """ip_contains filter"""
+        self.assertTrue(_ip_contains("", ["10.0.0.0/25", "10.0.0.128/25"], "10.0.0.0/24"))
+        self.assertTrue(
+            _ip_contains("", ["10.0.0.0/8", "2001:db8::/32"], ["10.1.1.1", "2001:db8::1"])
+        )
+        self.assertFalse(_ip_contains("", ["10.0.0.0/25"], "10.0.0.0/24"))
+        self.assertFalse(_ip_contains("", ["10.0.0.0/8"], ["10.0.0.1", "::ffff:10.0.0.1"]))
+        self.assertTrue(_ip_contains("", ["10.0.0.0/8"], []))
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_difference filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_difference import _ip_difference
+
+
+class Test_ip_difference(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        args = ["", ["10.0.0.0/8"]]
+        kwargs = {}
+        with self.assertRaises(AnsibleError) as error:
+            _ip_difference(*args, **kwargs)
+        self.assertIn("missing required arguments: other", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_difference("", ["10.0.0.0/8"], ["10.0.0.0/33"])
+        self.assertIn(
+            "ip_difference: invalid IP address or network '10.0.0.0/33'", str(error.exception)
+        )
+
+    def test_ip_difference_filter(self):
+        """ip_difference filter"""
+        result = _ip_difference("", ["192.0.2.0/24"], ["192.0.2.0/25", "192.0.2.192/26"])
+        self.assertEqual(result, ["192.0.2.128/26"])
+
+        result = _ip_difference(
+            "", ["10.0.0.0/30", "2001:db8::/126"], ["10.0.0.1", "2001:db8::/127"]
+        )
+        self.assertEqual(result, ["10.0.0.0/32", "10.0.0.2/31", "2001:db8::2/127"])
+        self.assertEqual(_ip_difference("", "10.0.0.0/24", "0.0.0.0/0"), [])
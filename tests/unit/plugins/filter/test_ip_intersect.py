@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_intersect filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_intersect import _ip_intersect
+
+
+class Test_ip_intersect(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        args = ["", ["10.0.0.0/8"]]
+        kwargs = {}
+        with self.assertRaises(AnsibleError) as error:
+            _ip_intersect(*args, **kwargs)
+        self.assertIn("missing required arguments: other", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_intersect("", ["10.0.0.0/8"], ["10.0.0.0/33"])
+        self.assertIn(
+            "ip_intersect: invalid IP address or network '10.0.0.0/33'", str(error.exception)
+        )
+
+    def test_ip_intersect_filter(self):
+        """ip_intersect filter"""
+        result = _ip_intersect("", ["10.0.0.0/22", "2001:db8::/48"], ["10.0.2.0/23", "2001:db8::1"])
+        self.assertEqual(result, ["10.0.2.0/23", "2001:db8::1/128"])
+
+        result = _ip_intersect("", ["10.0.0.0/24", "10.0.2.0/24"], ["10.0.0.128/25", "10.0.1.0/24"])
+        self.assertEqual(result, ["10.0.0.128/25"])
+        self.assertEqual(_ip_intersect("", "10.0.0.0/8", "2001:db8::/32"), [])
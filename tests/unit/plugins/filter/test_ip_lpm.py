@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_lpm filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_lpm import _ip_lpm, _prefix_trie
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_prefix_trie import PrefixTrie
+
+
+ROUTES = ["0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.1.2.128/25", "::/0"]
+
+
+class Test_ip_lpm(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        args = [""]
+        kwargs = {}
+        with self.assertRaises(AnsibleError) as error:
+            _ip_lpm(*args, **kwargs)
+        self.assertIn("missing required arguments", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_lpm("", "10.0.0.1", ["10.0.0.0/8", "floop"])
+        self.assertIn("ip_lpm: invalid prefix floop", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_lpm("", "10.0.0.1", [{"destination": "10.0.0.0/8"}])
+        self.assertIn("key 'prefix' not found", str(error.exception))
+
+    def test_ip_lpm_filter(self):
+        """ip_lpm filter"""
+        hosts = ["10.1.2.200", "10.1.2.3", "10.1.3.1", "10.2.0.1", "8.8.8.8", "2001:db8::1"]
+        result = _ip_lpm("", hosts, ROUTES)
+        self.assertEqual(
+            [(r["address"], r["prefix"], r["prefixlen"]) for r in result],
+            [
+                ("10.1.2.200", "10.1.2.128/25", 25),
+                ("10.1.2.3", "10.1.2.0/24", 24),
+                ("10.1.3.1", "10.1.0.0/16", 16),
+                ("10.2.0.1", "10.0.0.0/8", 8),
+                ("8.8.8.8", "0.0.0.0/0", 0),
+                ("2001:db8::1", "::/0", 0),
+            ],
+        )
+
+    def test_ip_lpm_no_match(self):
+        """ip_lpm filter without a matching prefix"""
+        no_match = {"prefix": None, "prefixlen": None, "payload": None}
+        result = _ip_lpm("", "192.0.2.1", ["10.0.0.0/8"])
+        self.assertEqual(result, dict(no_match, address="192.0.2.1"))
+        result = _ip_lpm("", "floop", ["10.0.0.0/8"])
+        self.assertEqual(result, dict(no_match, address="floop"))
+        # the whole network has to be in the prefix
+        result = _ip_lpm("", "10.0.0.0/7", ["10.0.0.0/8"])
+        self.assertEqual(result, dict(no_match, address="10.0.0.0/7"))
+
+    def test_ip_lpm_payload(self):
+        """ip_lpm filter with payloads"""
+        routes = [
+            {"destination": "0.0.0.0/0", "next_hop": "192.0.2.1"},
+            {"destination": "10.1.0.0/16", "next_hop": "10.0.0.1"},
+        ]
+        result = _ip_lpm("", "10.1.2.3", routes, key="destination")
+        self.assertEqual(result["payload"], routes[1])
+        result = _ip_lpm("", "10.2.0.1", routes, "destination")
+        self.assertEqual(result["payload"]["next_hop"], "192.0.2.1")
+
+        result = _ip_lpm("", "2001:db8:1::1", {"2001:db8::/32": "lab", "2001:db8:1::/48": "site1"})
+        self.assertEqual(result["payload"], "site1")
+        self.assertEqual(result["prefix"], "2001:db8:1::/48")
+
+    def test_ip_lpm_cache(self):
+        """ip_lpm indexes a list of prefixes once, until its content changes"""
+        routes = ["10.0.0.0/8", "10.1.0.0/16"]
+        self.assertIs(_prefix_trie(routes), _prefix_trie(list(routes)))
+        self.assertEqual(_ip_lpm("", "10.1.2.3", routes)["prefix"], "10.1.0.0/16")
+        routes[1] = "10.2.0.0/16"
+        self.assertEqual(_ip_lpm("", "10.1.2.3", routes)["prefix"], "10.0.0.0/8")
+        payloads = [{"prefix": "10.0.0.0/8", "next_hop": "192.0.2.1"}]
+        self.assertEqual(_ip_lpm("", "10.1.2.3", payloads)["payload"]["next_hop"], "192.0.2.1")
+        payloads[0]["next_hop"] = "192.0.2.2"
+        self.assertEqual(_ip_lpm("", "10.1.2.3", payloads)["payload"]["next_hop"], "192.0.2.2")
+
+    def test_ip_lpm_cache_payloads(self):
+        """ip_lpm returns the payloads of the call, not the ones of the cached index"""
+        routes = [{"prefix": "10.0.0.0/8", "next_hop": "192.0.2.1"}]
+        self.assertIs(_ip_lpm("", "10.1.2.3", routes)["payload"], routes[0])
+        other = [{"prefix": "10.0.0.0/8", "next_hop": "192.0.2.9"}]
+        self.assertIs(_ip_lpm("", "10.1.2.3", other)["payload"], other[0])
+        # the last duplicate wins
+        routes.append({"prefix": "10.0.0.0/8", "next_hop": "192.0.2.2"})
+        self.assertIs(_ip_lpm("", "10.1.2.3", routes)["payload"], routes[1])
+
+
+class TestPrefixTrie(TestCase):
+    def test_lookup(self):
+        trie = PrefixTrie(ROUTES)
+        self.assertEqual(len(trie), len(ROUTES))
+        self.assertEqual(str(trie.lookup("10.1.2.129")[0]), "10.1.2.128/25")
+        self.assertEqual(str(trie.lookup("10.1.2.0/24")[0]), "10.1.2.0/24")
+        self.assertEqual(str(trie.lookup("10.1.2.0/23")[0]), "10.1.0.0/16")
+        self.assertIsNone(PrefixTrie(["10.0.0.0/8"]).lookup("::1"))
+
+    def test_add(self):
+        trie = PrefixTrie()
+        # host bits are ignored and adding a prefix again replaces its payload
+        trie.add("10.1.2.3/24", "first")
+        trie.add("10.1.2.0/24", "second")
+        trie.add("10.1.3.0/24")
+        self.assertEqual(len(trie), 2)
+        prefix, payload = trie.lookup("10.1.2.3")
+        self.assertEqual((str(prefix), payload), ("10.1.2.0/24", "second"))
+        self.assertIsNone(trie.lookup("10.1.4.1"))
+        with self.assertRaises(ValueError):
+            trie.add("floop")
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_sort filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_sort import _ip_sort
+
+
+class Test_ip_sort(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_sort("", "10.0.0.1", output="strings")
+        self.assertIn("value of output must be one of: values, keys", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_sort("", ["10.0.0.1", "10.0.0.0/33"])
+        self.assertIn("ip_sort: invalid IP address or network '10.0.0.0/33'", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_sort("", [{"address": "10.0.0.1"}])
+        self.assertIn("ip_sort: key 'prefix' not found", str(error.exception))
+
+    def test_ip_sort_filter(self):
+        """ip_sort filter"""
+        values = [
+            "10.0.0.10",
+            "2001:db8::1",
+            "10.0.0.0/24",
+            "::ffff:10.0.0.1",
+            "10.0.0.9",
+            "10.0.0.0/8",
+        ]
+        self.assertEqual(
+            _ip_sort("", values),
+            [
+                "10.0.0.0/8",
+                "10.0.0.0/24",
+                "10.0.0.9",
+                "10.0.0.10",
+                "::ffff:10.0.0.1",
+                "2001:db8::1",
+            ],
+        )
+        self.assertEqual(_ip_sort("", values, reverse=True), _ip_sort("", values)[::-1])
+        self.assertEqual(
+            _ip_sort("", ["10.0.0.1/255.255.255.0", "10.0.0.0/0.0.0.255", 167772160]),
+            ["10.0.0.0/0.0.0.255", 167772160, "10.0.0.1/255.255.255.0"],
+        )
+        self.assertEqual(_ip_sort("", []), [])
+
+    def test_ip_sort_stable(self):
+        """values with the same key keep their order, unique keeps the first one"""
+        values = ["10.0.0.2", "10.0.0.1/32", "10.0.0.1", "10.0.0.3"]
+        self.assertEqual(
+            _ip_sort("", values),
+            ["10.0.0.1/32", "10.0.0.1", "10.0.0.2", "10.0.0.3"],
+        )
+        self.assertEqual(
+            _ip_sort("", values, reverse=True),
+            ["10.0.0.3", "10.0.0.2", "10.0.0.1/32", "10.0.0.1"],
+        )
+        self.assertEqual(_ip_sort("", values, unique=True), ["10.0.0.1/32", "10.0.0.2", "10.0.0.3"])
+        self.assertEqual(
+            _ip_sort("", values, reverse=True, unique=True),
+            ["10.0.0.3", "10.0.0.2", "10.0.0.1/32"],
+        )
+
+    def test_ip_sort_dictionaries(self):
+        """ip_sort filter with a list of dictionaries and output=keys"""
+        interfaces = [
+            {"name": "eth1", "address": "192.168.1.10/24"},
+            {"name": "eth0", "address": "10.0.0.1/24"},
+            {"name": "lo", "address": "::1"},
+        ]
+        self.assertEqual(
+            [entry["name"] for entry in _ip_sort("", interfaces, key="address")],
+            ["eth0", "eth1", "lo"],
+        )
+        self.assertEqual(
+            _ip_sort("", ["::1", "10.0.0.1/24"], output="keys"),
+            [
+                {"value": "10.0.0.1/24", "version": 4, "int": 167772161, "prefixlen": 24},
+                {"value": "::1", "version": 6, "int": 1, "prefixlen": 128},
+            ],
+        )
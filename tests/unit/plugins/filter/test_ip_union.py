@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for ip_union filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.ip_union import _ip_union
+
+
+class Test_ip_union(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        args = ["", ["10.0.0.0/8"]]
+        kwargs = {}
+        with self.assertRaises(AnsibleError) as error:
+            _ip_union(*args, **kwargs)
+        self.assertIn("missing required arguments: other", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _ip_union("", ["10.0.0.0/8"], ["10.0.0.0/33"])
+        self.assertIn("ip_union: invalid IP address or network '10.0.0.0/33'", str(error.exception))
+
+    def test_ip_union_filter(self):
+        """ip_union filter"""
+        result = _ip_union(
+            "", ["10.0.0.0/25", "2001:db8::/33"], ["10.0.0.128/25", "2001:db8:8000::/33"]
+        )
+        self.assertEqual(result, ["10.0.0.0/24", "2001:db8::/32"])
+
+        result = _ip_union("", "10.0.0.5/30", ["10.0.0.0/30", "10.0.0.8"])
+        self.assertEqual(result, ["10.0.0.0/29", "10.0.0.8/32"])
+        self.assertEqual(_ip_union("", [], []), [])
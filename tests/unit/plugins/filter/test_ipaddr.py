@@ -28,7 +28,11 @@ from ansible_collections.ansible.utils.plugins.filter.nthhost import nthhost
 from ansible_collections.ansible.utils.plugins.filter.previous_nth_usable import previous_nth_usable
 from ansible_collections.ansible.utils.plugins.filter.reduce_on_network import reduce_on_network
 from ansible_collections.ansible.utils.plugins.filter.slaac import slaac
-from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import ipaddr
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    ipaddr,
+    ipaddr_cache_clear,
+    ipaddr_cache_info,
+)
 
 
 netaddr = pytest.importorskip("netaddr")
@@ -607,6 +611,9 @@ class TestIpFilter(TestCase):
         self.assertEqual(next_nth_usable(address, 1), None)
         address = "1.12.1.254/24"
         self.assertEqual(next_nth_usable(address, 2), None)
+        address = "::/120"
+        self.assertEqual(next_nth_usable(address, 2), "::2")
+        self.assertEqual(next_nth_usable(address, -2), None)
 
     def test_previous_nth_usable(self):
         address = "1.12.1.0/24"
@@ -625,6 +632,9 @@ class TestIpFilter(TestCase):
         self.assertEqual(previous_nth_usable(address, 1), None)
         address = "1.12.1.254/24"
         self.assertEqual(previous_nth_usable(address, 2), "1.12.1.252")
+        address = "::/120"
+        self.assertEqual(previous_nth_usable(address, -2), "::2")
+        self.assertEqual(previous_nth_usable(address, 2), None)
 
     def test_network_in_usable(self):
         subnet = "1.12.1.0/24"
@@ -657,6 +667,7 @@ class TestIpFilter(TestCase):
         subnet = "1.12.1.0/24"
         address = "1.12.2.0"
         self.assertEqual(network_in_usable(subnet, address), False)
+        self.assertEqual(network_in_usable("floop", "floop"), False)
 
     def test_network_in_network(self):
         subnet = "1.12.1.0/24"
@@ -722,3 +733,29 @@ class TestIpFilter(TestCase):
     def test_ip4_hex(self):
         self.assertEqual(ip4_hex("192.0.2.24"), "c0000218")
         self.assertEqual(ip4_hex("192.0.2.24", "."), "c0.00.02.18")
+
+    def test_ipaddr_cache(self):
+        ipaddr_cache_clear()
+        self.assertEqual(ipaddr("192.0.2.24/24", "address"), "192.0.2.24")
+        self.assertEqual(ipaddr("192.0.2.24/24", "network/prefix"), "192.0.2.0/24")
+        self.assertEqual(ipaddr("192.0.2.24/24"), "192.0.2.24/24")
+        self.assertEqual(ipaddr(3221226008, "address"), "192.0.2.24")
+        self.assertEqual(ipaddr(3221226008), "192.0.2.24")
+        self.assertFalse(ipaddr("floop"))
+        self.assertFalse(ipaddr("floop"))
+        info = ipaddr_cache_info()
+        self.assertEqual(info["misses"], 3)
+        self.assertEqual(info["hits"], 4)
+        self.assertEqual(info["size"], 3)
+        self.assertAlmostEqual(info["hit_rate"], 4 / 7.0)
+
+    def test_ipaddr_chained_query(self):
+        addresses = ["192.168.1.10/24", "8.8.8.8/24", "10.1.1.1", "floop"]
+        self.assertEqual(
+            ipaddr(addresses, "private|network/prefix"),
+            ["192.168.1.0/24", "10.1.1.1/32"],
+        )
+        self.assertEqual(ipaddr("192.168.1.10/24", "private|192.168.0.0/16|prefix"), 24)
+        self.assertFalse(ipaddr("8.8.8.8", "private|network/prefix"))
+        with pytest.raises(AnsibleFilterError, match="ipaddr: unknown filter type: floop"):
+            ipaddr("192.168.1.10/24", "private|floop")
@@ -73,3 +73,36 @@ class TestIpAddr(TestCase):
         with self.assertRaises(AnsibleFilterError) as error:
             _ipmath(*args, **kwargs)
         self.assertIn("You must pass a valid IP address", str(error.exception))
+
+    def test_ipmath_list(self):
+        """ipmath with a list of addresses or of amounts"""
+
+        self.assertEqual(
+            _ipmath("", ["10.0.0.0/24", "10.0.1.0/24", "2001:db8::"], 1),
+            ["10.0.0.1", "10.0.1.1", "2001:db8::1"],
+        )
+        self.assertEqual(
+            _ipmath("", "192.168.1.5", range(1, 4)),
+            ["192.168.1.6", "192.168.1.7", "192.168.1.8"],
+        )
+        self.assertEqual(_ipmath("", ["10.0.0.1", "10.0.0.1"], [1, "-1"]), ["10.0.0.2", "10.0.0.0"])
+        self.assertEqual(_ipmath("", [], 1), [])
+
+    def test_ipmath_list_invalid_data(self):
+        """Check passing invalid data in a list"""
+
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ipmath("", ["10.0.0.1", "255.255.255.255"], 1)
+        self.assertIn(
+            "ipmath: 255.255.255.255 (item 1) +1: result outside valid IP address boundary",
+            str(error.exception),
+        )
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ipmath("", ["10.0.0.1", "10.0.0.256"], 1)
+        self.assertIn("10.0.0.256 (item 1) is invalid", str(error.exception))
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ipmath("", ["10.0.0.1"], [1, 2])
+        self.assertIn("value and amount must be lists of the same length", str(error.exception))
+        with self.assertRaises(AnsibleFilterError) as error:
+            _ipmath("", ["10.0.0.1"], "one")
+        self.assertIn("one is not a valid integer", str(error.exception))
@@ -16,6 +16,8 @@ from unittest import TestCase
 
 import pytest
 
+from ansible.errors import AnsibleFilterError
+
 from ansible_collections.ansible.utils.plugins.filter.ipsubnet import _ipsubnet
 
 
@@ -177,3 +179,38 @@ def test_ipvsubnet_get_subnet(test_case, expected):
 )
 def test_ipvsubnet_get_subnet_fail(test_case):
     assert _ipsubnet("", *test_case) is False
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        [{"offset": 0, "limit": 3}, ["192.168.0.0/20", "192.168.16.0/20", "192.168.32.0/20"]],
+        [{"offset": -2}, ["192.168.224.0/20", "192.168.240.0/20"]],
+        [{"offset": 1, "limit": 2, "step": 5}, ["192.168.16.0/20", "192.168.96.0/20"]],
+        [{"offset": 16}, []],
+    ],
+)
+def test_ipvsubnet_list_subnets(kwargs, expected):
+    assert list(_ipsubnet("", subnet, "20", **kwargs)) == expected
+
+
+def test_ipvsubnet_list_subnets_lazy():
+    subnets = _ipsubnet("", "2001:db8::/32", "128", step=2)
+    assert subnets.size == 2**95
+    assert subnets[-1] == "2001:db8:ffff:ffff:ffff:ffff:ffff:fffe/128"
+    assert list(subnets[1:3]) == ["2001:db8::2/128", "2001:db8::4/128"]
+
+    with pytest.raises(AnsibleFilterError, match="ipsubnet: step must be a positive integer"):
+        _ipsubnet("", subnet, "20", step=0)
+    with pytest.raises(AnsibleFilterError, match="Requested subnet size of 8 is invalid"):
+        _ipsubnet("", subnet, "8", limit=1)
+
+
+def test_ipvsubnet_list_subnets_length():
+    assert len(_ipsubnet("", subnet, "20", offset=0)) == 16
+    subnets = _ipsubnet("", "2001:db8::/32", "128", offset=0)
+    assert subnets
+    assert subnets.size == 2**96
+    with pytest.raises(AnsibleFilterError, match="read its size attribute instead"):
+        len(subnets)
+    assert not _ipsubnet("", subnet, "20", offset=16)
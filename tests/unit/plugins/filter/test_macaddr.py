@@ -32,3 +32,13 @@ class Test_macaddr(TestCase):
         args = ["", "1a:2b:3c:4d:5e:6f", "cisco"]
         result = _macaddr(*args)
         self.assertEqual(result, "1a2b.3c4d.5e6f")
+
+    def test_macaddr_filter_list(self):
+        """macaddr filter with a list of addresses"""
+        args = ["", ["1a:2b:3c:4d:5e:6f", "1a2b.3c4d.5e70"], "pgsql"]
+        result = _macaddr(*args)
+        self.assertEqual(result, ["1a2b3c:4d5e6f", "1a2b3c:4d5e70"])
+
+        args = ["", ["1a:2b:3c:4d:5e:6f", "invalid"]]
+        result = _macaddr(*args)
+        self.assertEqual(result, ["1a:2b:3c:4d:5e:6f", None])
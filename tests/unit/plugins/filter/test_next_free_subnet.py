@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for next_free_subnet filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.next_free_subnet import _next_free_subnet
+
+
+class Test_next_free_subnet(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        # missing required arguments
+        with self.assertRaises(AnsibleError) as error:
+            _next_free_subnet("", "10.0.0.0/24")
+        self.assertIn("missing required arguments: prefix", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _next_free_subnet("", "10.0.0.0/33", prefix=29)
+        self.assertIn("next_free_subnet: invalid IP network '10.0.0.0/33'", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _next_free_subnet("", "10.0.0.0/24", prefix=16)
+        self.assertIn("invalid prefix /16 for the network 10.0.0.0/24", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _next_free_subnet("", "10.0.0.0/24", prefix=29, count=-1)
+        self.assertIn("count must not be negative", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _next_free_subnet("", "10.0.0.0/24", ["10.0.0.0/40"], prefix=29)
+        self.assertIn("next_free_subnet: invalid IP address or network", str(error.exception))
+
+    def test_next_free_subnet_filter(self):
+        """next_free_subnet filter"""
+        used = ["192.0.2.0/28", "192.0.2.20", "198.51.100.0/24"]
+        self.assertEqual(_next_free_subnet("", "192.0.2.0/24", used, prefix=29), ["192.0.2.24/29"])
+        self.assertEqual(
+            _next_free_subnet("", "192.0.2.0/24", used, prefix=29, count=2),
+            ["192.0.2.24/29", "192.0.2.32/29"],
+        )
+        self.assertEqual(
+            _next_free_subnet("", "192.0.2.0/24", used, prefix=26, align=25),
+            ["192.0.2.128/26"],
+        )
+        self.assertEqual(
+            _next_free_subnet("", "192.0.2.0/24", prefix=25, count=3),
+            ["192.0.2.0/25", "192.0.2.128/25"],
+        )
+        self.assertEqual(_next_free_subnet("", "192.0.2.0/24", ["192.0.0.0/16"], prefix=29), [])
+        self.assertEqual(
+            _next_free_subnet("", "2001:db8::/32", ["2001:db8::/48", "10.0.0.0/8"], prefix=48),
+            ["2001:db8:1::/48"],
+        )
+
+    def test_next_free_subnet_host_bits(self):
+        """the host bits of the network and of the used networks are ignored"""
+        self.assertEqual(
+            _next_free_subnet("", "192.0.2.77/24", ["192.0.2.5/25"], prefix=25),
+            ["192.0.2.128/25"],
+        )
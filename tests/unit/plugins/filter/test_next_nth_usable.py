@@ -32,3 +32,13 @@ class Test_Next_Nth_Usable(TestCase):
         args = ["", "192.168.122.254/24", 2]
         result = _next_nth_usable(*args)
         self.assertEqual(result, None)
+
+    def test_next_nth_usable_filter_list(self):
+        """next_nth_usable filter with a list of addresses or of offsets"""
+        args = ["", ["192.168.122.1/24", "192.168.122.254/24", "invalid"], 2]
+        result = _next_nth_usable(*args)
+        self.assertEqual(result, ["192.168.122.3", None, False])
+
+        args = ["", "10.0.0.1/29", [1, 5, 6]]
+        result = _next_nth_usable(*args)
+        self.assertEqual(result, ["10.0.0.2", "10.0.0.6", None])
@@ -32,3 +32,13 @@ class Test_nthhost(TestCase):
         args = ["", "10.0.0.0/8", "-1"]
         result = _nthhost(*args)
         self.assertEqual(result, "10.255.255.255")
+
+    def test_nthhost_filter_list(self):
+        """nthhost filter with a list of networks or of indexes"""
+        args = ["", ["10.0.0.0/24", "10.0.1.0/24", "invalid"], 1]
+        result = _nthhost(*args)
+        self.assertEqual(result, ["10.0.0.1", "10.0.1.1", False])
+
+        args = ["", "10.0.0.0/30", [0, "1", -1, 4]]
+        result = _nthhost(*args)
+        self.assertEqual(result, ["10.0.0.0", "10.0.0.1", "10.0.0.3", False])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit test file for prefix_overlaps filter plugin
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.ansible.utils.plugins.filter.prefix_overlaps import _prefix_overlaps
+
+
+class Test_prefix_overlaps(TestCase):
+    def setUp(self):
+        pass
+
+    def test_invalid_data(self):
+        """Check passing invalid argspec"""
+
+        with self.assertRaises(AnsibleError) as error:
+            _prefix_overlaps("", ["10.0.0.0/8"], output="pairs_and_groups")
+        self.assertIn("value of output must be one of: pairs, groups", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _prefix_overlaps("", ["10.0.0.0/8", "10.0.0.0/33"])
+        self.assertIn("prefix_overlaps: invalid prefix '10.0.0.0/33'", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _prefix_overlaps("", [{"network": "10.0.0.0/8"}])
+        self.assertIn("prefix_overlaps: key 'prefix' not found", str(error.exception))
+
+    def test_prefix_overlaps_filter(self):
+        """prefix_overlaps filter"""
+        prefixes = ["10.0.0.0/16", "192.0.2.0/24", "10.0.1.0/24", "192.0.2.0/24", "2001:db8::/32"]
+        self.assertEqual(
+            _prefix_overlaps("", prefixes),
+            [
+                {
+                    "prefix": "10.0.0.0/16",
+                    "index": 0,
+                    "other": "10.0.1.0/24",
+                    "other_index": 2,
+                    "relation": "contains",
+                },
+                {
+                    "prefix": "192.0.2.0/24",
+                    "index": 1,
+                    "other": "192.0.2.0/24",
+                    "other_index": 3,
+                    "relation": "duplicate",
+                },
+            ],
+        )
+        self.assertEqual(len(_prefix_overlaps("", prefixes, stop_at_first=True)), 1)
+        self.assertEqual(_prefix_overlaps("", ["10.0.0.0/24", "10.0.1.0/24"]), [])
+
+    def test_prefix_overlaps_groups(self):
+        """prefix_overlaps filter with output=groups"""
+        prefixes = ["10.0.1.0/24", "10.0.0.0/16", "10.1.0.0/16", "10.0.2.0/24", "10.1.0.5/17"]
+        self.assertEqual(
+            _prefix_overlaps("", prefixes, output="groups"),
+            [["10.0.0.0/16", "10.0.1.0/24", "10.0.2.0/24"], ["10.1.0.0/16", "10.1.0.5/17"]],
+        )
+        self.assertEqual(
+            _prefix_overlaps("", prefixes, output="groups", stop_at_first=True),
+            [["10.0.0.0/16", "10.0.1.0/24", "10.0.2.0/24"]],
+        )
+        # a nested prefix containing others is only part of its top-level group
+        self.assertEqual(
+            _prefix_overlaps("", ["10.1.1.0/24", "10.0.0.0/8", "10.1.0.0/16"], output="groups"),
+            [["10.0.0.0/8", "10.1.0.0/16", "10.1.1.0/24"]],
+        )
+
+    def test_prefix_overlaps_dictionaries(self):
+        """prefix_overlaps filter with a list of dictionaries"""
+        sites = [
+            {"name": "site1", "subnet": "10.1.0.0/16"},
+            {"name": "site2", "subnet": "10.1.128.0/17"},
+        ]
+        result = _prefix_overlaps("", sites, key="subnet")
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["other"], "10.1.128.0/17")
+        self.assertEqual(sites[result[0]["other_index"]]["name"], "site2")
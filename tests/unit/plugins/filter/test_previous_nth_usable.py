@@ -34,3 +34,13 @@ class Test_previous_Nth_Usable(TestCase):
         args = ["", "192.168.122.1/24", 2]
         result = _previous_nth_usable(*args)
         self.assertEqual(result, None)
+
+    def test_previous_nth_usable_filter_list(self):
+        """previous_nth_usable filter with a list of addresses or of offsets"""
+        args = ["", ["192.168.122.10/24", "192.168.122.1/24"], 2]
+        result = _previous_nth_usable(*args)
+        self.assertEqual(result, ["192.168.122.8", None])
+
+        args = ["", ["10.0.0.6/29", "10.0.0.6/29"], [1, 5]]
+        result = _previous_nth_usable(*args)
+        self.assertEqual(result, ["10.0.0.5", "10.0.0.1"])
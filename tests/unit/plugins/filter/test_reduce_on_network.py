@@ -39,3 +39,37 @@ class Test_reduce_on_network(TestCase):
         args = ["", list1, "192.168.0.0/24"]
         result = _reduce_on_network(*args)
         self.assertEqual(result, ["192.168.0.34"])
+
+    def test_reduce_on_network_filter_2(self):
+        """reduce_on_network filter, invalid values and other IP versions"""
+        list1 = ["10.0.0.1", "10.0.0.2", "floop", "", "::ffff:10.0.0.1", "10.0.0.0/24"]
+        args = ["", list1, "10.0.0.0/31"]
+        self.assertEqual(_reduce_on_network(*args), ["10.0.0.1"])
+        args = ["", list1, "0.0.0.0/0"]
+        self.assertEqual(_reduce_on_network(*args), ["10.0.0.1", "10.0.0.2", "10.0.0.0/24"])
+        args = ["", list1, "floop"]
+        self.assertEqual(_reduce_on_network(*args), [])
+
+    def test_reduce_on_network_filter_networks(self):
+        """reduce_on_network filter with a list of networks"""
+        list1 = ["192.168.0.34", "10.3.0.3", "192.168.2.34", "2001:db8::1"]
+        networks = ["192.168.0.0/16", "192.168.0.0/24", "192.168.0.1/24", "2001:db8::/32", "floop"]
+        args = ["", list1, networks]
+        result = _reduce_on_network(*args)
+        self.assertEqual(
+            result,
+            {
+                "192.168.0.0/16": ["192.168.0.34", "192.168.2.34"],
+                "192.168.0.0/24": ["192.168.0.34"],
+                "192.168.0.1/24": ["192.168.0.34"],
+                "2001:db8::/32": ["2001:db8::1"],
+                "floop": [],
+            },
+        )
+
+    def test_reduce_on_network_filter_networks_invalid(self):
+        """reduce_on_network filter with a list of networks which are not strings"""
+        args = ["", ["10.0.0.1"], [{"network": "10.0.0.0/8"}]]
+        with self.assertRaises(AnsibleError) as error:
+            _reduce_on_network(*args)
+        self.assertIn("networks must be strings, got dict", str(error.exception))
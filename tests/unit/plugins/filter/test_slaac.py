@@ -30,3 +30,26 @@ class Test_slaac(TestCase):
         ]
         result = _slaac(*args)
         self.assertEqual(result, "fdcf:1894:23b5:d38c:c031:b3ff:fe83:bf2b")
+
+    def test_slaac_filter_list(self):
+        """slaac filter with a list of MAC addresses or of networks"""
+        args = ["", "2001:db8::/64", ["c2:31:b3:83:bf:2b", "c231.b383.bf2c", "invalid"]]
+        result = _slaac(*args)
+        self.assertEqual(
+            result,
+            ["2001:db8::c031:b3ff:fe83:bf2b", "2001:db8::c031:b3ff:fe83:bf2c", False],
+        )
+
+        args = ["", ["2001:db8::/64", "2001:db8:1::/64", "10.0.0.0/8"], "c2:31:b3:83:bf:2b"]
+        for backend in ("netaddr", "ipaddress"):
+            result = _slaac(*args, backend=backend)
+            self.assertEqual(
+                result,
+                ["2001:db8::c031:b3ff:fe83:bf2b", "2001:db8:1:0:c031:b3ff:fe83:bf2b", False],
+            )
+
+    def test_slaac_filter_list_not_str(self):
+        """Items of the lists are converted to strings like single values"""
+        args = ["", "2001:db8::/64", [0xC231B383BF2B, None]]
+        result = _slaac(*args)
+        self.assertEqual(result, [_slaac("", "2001:db8::/64", item) for item in args[2]])
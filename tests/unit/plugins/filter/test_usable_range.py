@@ -12,6 +12,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ipaddress import ip_address
 from unittest import TestCase
 
 from ansible.errors import AnsibleError
@@ -72,6 +73,8 @@ VALID_OUTPUT_3 = {
 }
 VALID_OUTPUT_4 = {"number_of_ips": 1, "usable_ips": ["2001:db8:abcd:12::"]}
 
+VALID_OUTPUT_5 = [str(ip_address("::ffff:0.0.0.0")), str(ip_address("::ffff:0.0.0.1"))]
+
 
 class TestUsableRange(TestCase):
     def setUp(self):
@@ -125,3 +128,71 @@ class TestUsableRange(TestCase):
         ip = VALID_DATA[3]
         result = _usable_range(ip)
         self.assertEqual(result, VALID_OUTPUT_4)
+
+    def test_window(self):
+        """Check listing a window of the addresses"""
+
+        result = _usable_range("10.1.0.0/16", start=8, count=2)
+        self.assertEqual(result, {"number_of_ips": 65536, "usable_ips": ["10.1.0.8", "10.1.0.9"]})
+
+        result = _usable_range("2001:db8::/64", start=-1)
+        self.assertEqual(result["usable_ips"], ["2001:db8::ffff:ffff:ffff:ffff"])
+
+        result = _usable_range("10.0.0.8/30", start=4)
+        self.assertEqual(result, {"number_of_ips": 4, "usable_ips": []})
+
+        result = _usable_range("10.0.0.0/20")
+        self.assertEqual(len(result["usable_ips"]), 4096)
+
+        with self.assertRaises(AnsibleError) as error:
+            _usable_range("10.0.0.0/20", max_items=1024)
+        self.assertIn("more than max_items 1024", str(error.exception))
+
+        with self.assertRaises(AnsibleError) as error:
+            _usable_range("10.0.0.8/30", count=-1)
+        self.assertIn("count must not be negative", str(error.exception))
+
+    def test_range_output(self):
+        """Check the range only output"""
+
+        result = _usable_range("2001:db8::/64", output="range")
+        self.assertEqual(
+            result,
+            {
+                "number_of_ips": 2**64,
+                "count": 2**64,
+                "first_ip": "2001:db8::",
+                "last_ip": "2001:db8::ffff:ffff:ffff:ffff",
+            },
+        )
+
+        result = _usable_range("10.0.0.8/30", start=1, count=2, output="range")
+        self.assertEqual(
+            result,
+            {"number_of_ips": 4, "count": 2, "first_ip": "10.0.0.9", "last_ip": "10.0.0.10"},
+        )
+
+    def test_lazy_output(self):
+        """Check the lazy output"""
+
+        addresses = _usable_range("10.0.0.0/8", output="lazy")["usable_ips"]
+        self.assertEqual(len(addresses), 2**24)
+        self.assertEqual(addresses[-1], "10.255.255.255")
+        self.assertEqual(list(addresses[1:3]), ["10.0.0.1", "10.0.0.2"])
+
+        addresses = _usable_range("::ffff:0.0.0.0/127", output="lazy")["usable_ips"]
+        self.assertEqual(list(addresses), VALID_OUTPUT_5)
+
+    def test_lazy_output_max_items(self):
+        """Check a lazy output larger than max_items can not be iterated over"""
+
+        addresses = _usable_range("10.0.0.0/8", output="lazy", max_items=1048576)["usable_ips"]
+        with self.assertRaises(ValueError) as error:
+            list(addresses)
+        self.assertIn("more than max_items 1048576", str(error.exception))
+        self.assertEqual(len(list(addresses[:1048576])), 1048576)
+
+        addresses = _usable_range("10.0.0.0/24", output="lazy", max_items=10)["usable_ips"]
+        with self.assertRaises(ValueError):
+            list(addresses)
+        self.assertEqual(list(addresses[2:4]), ["10.0.0.2", "10.0.0.3"])
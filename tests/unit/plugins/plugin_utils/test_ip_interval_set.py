@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the IP interval sets
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_interval_set import (
+    IPIntervalSet,
+    ip_interval_set,
+)
+
+
+def _set(*values):
+    return ip_interval_set(list(values), "test")
+
+
+class TestIPIntervalSet(TestCase):
+    def test_ranges(self):
+        s = _set("10.0.0.8/29", "10.0.0.0/29", "10.0.0.32", "::1", "::/128")
+        self.assertEqual(list(s.ranges(4)), [(0x0A000000, 0x0A00000F), (0x0A000020, 0x0A000020)])
+        self.assertEqual(list(s.ranges(6)), [(0, 1)])
+        self.assertEqual(len(s), 3)
+        self.assertEqual(s.size(), 19)
+        self.assertEqual(s.size(4), 17)
+        self.assertEqual(s.cidrs(), ["10.0.0.0/28", "10.0.0.32/32", "::/127"])
+        self.assertEqual([str(p) for p in s.prefixes()], s.cidrs())
+
+    def test_operations(self):
+        a = _set("10.0.0.0/24", "10.0.2.0/24", "2001:db8::/32")
+        b = _set("10.0.0.128/25", "10.0.1.0/24", "10.0.2.64/26", "2001:db8:1::/48")
+        self.assertEqual(a.union(b), _set("10.0.0.0/23", "10.0.2.0/24", "2001:db8::/32"))
+        self.assertEqual(
+            a.intersection(b).cidrs(),
+            ["10.0.0.128/25", "10.0.2.64/26", "2001:db8:1::/48"],
+        )
+        self.assertEqual(
+            a.difference(b).cidrs()[:4],
+            ["10.0.0.0/25", "10.0.2.0/26", "10.0.2.128/25", "2001:db8::/48"],
+        )
+        self.assertEqual(b.difference(b), IPIntervalSet())
+        self.assertTrue(a.union(b).issuperset(a))
+        self.assertFalse(a.issuperset(b))
+        self.assertTrue(a.issuperset(IPIntervalSet()))
+
+    def test_contains_range(self):
+        s = _set("10.0.0.0/25", "10.0.0.128/25", "10.0.2.0/24")
+        self.assertTrue(s.contains_range(0x0A000000, 0x0A0000FF, 4))
+        self.assertFalse(s.contains_range(0x0A0000FF, 0x0A000200, 4))
+        self.assertFalse(s.contains_range(0, 0, 4))
+        self.assertFalse(s.contains_range(0x0A000000, 0x0A000000, 6))
+
+    def test_subnets(self):
+        # 10.0.0.1 - 10.0.0.23 holds the /29s at .8 and .16
+        s = _set("10.0.0.1", "10.0.0.2/31", "10.0.0.4/30", "10.0.0.8/29", "10.0.0.16/29")
+        self.assertEqual(list(s.subnets(4, 29)), [0x0A000008, 0x0A000010])
+        self.assertEqual(
+            list(s.subnets(4, 30)),
+            [0x0A000004, 0x0A000008, 0x0A00000C, 0x0A000010, 0x0A000014],
+        )
+        self.assertEqual(list(s.subnets(4, 30, align=28)), [0x0A000010])
+        self.assertEqual(list(s.subnets(4, 27)), [])
+        self.assertEqual(list(s.subnets(6, 64)), [])
+
+    def test_ip_interval_set(self):
+        s = _set("10.0.0.0/24")
+        self.assertIs(ip_interval_set(s, "test"), s)
+        self.assertEqual(ip_interval_set("10.0.0.5/24", "test"), s)
+        with pytest.raises(AnsibleFilterError, match="test: invalid IP address or network 'floop'"):
+            _set("10.0.0.0/24", "floop")
+        with pytest.raises(AnsibleFilterError, match="test: expected an IP address or network"):
+            ip_interval_set(None, "test")
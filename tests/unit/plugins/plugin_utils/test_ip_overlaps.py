@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the overlap detection in lists of IP prefixes
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from itertools import islice
+from unittest import TestCase
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_overlaps import (
+    overlapping_groups,
+    overlapping_pairs,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import IPPrefix
+
+
+def _prefixes(*values):
+    return [IPPrefix.parse(value) for value in values]
+
+
+class TestIpOverlaps(TestCase):
+    def test_overlapping_pairs(self):
+        prefixes = _prefixes(
+            "10.0.1.0/24",
+            "2001:db8::/32",
+            "10.0.0.0/8",
+            "10.0.1.128/25",
+            "10.0.0.0/16",
+            "11.0.0.0/8",
+            "2001:db8::/48",
+            "10.0.1.0/24",
+        )
+        self.assertEqual(
+            list(overlapping_pairs(prefixes)),
+            [
+                (2, 4),
+                (2, 0),
+                (4, 0),
+                (2, 7),
+                (4, 7),
+                (0, 7),
+                (2, 3),
+                (4, 3),
+                (0, 3),
+                (7, 3),
+                (1, 6),
+            ],
+        )
+        self.assertEqual(list(overlapping_pairs(_prefixes("10.0.0.0/24", "::/0"))), [])
+        self.assertEqual(list(overlapping_pairs([])), [])
+
+    def test_overlapping_groups(self):
+        prefixes = _prefixes(
+            "10.0.1.0/24",
+            "10.0.0.0/16",
+            "10.1.0.0/16",
+            "10.0.2.0/24",
+            "10.1.0.0/17",
+            "10.2.0.0/16",
+        )
+        self.assertEqual(list(overlapping_groups(prefixes)), [[1, 0, 3], [2, 4]])
+        self.assertEqual(list(overlapping_groups(_prefixes("10.0.0.0/24"))), [])
+
+    def test_duplicates(self):
+        # the enclosing prefixes are not copied for every prefix
+        prefixes = _prefixes(*["10.0.0.0/24"] * 20000)
+        self.assertEqual(list(islice(overlapping_pairs(prefixes), 3)), [(0, 1), (0, 2), (1, 2)])
+        groups = list(overlapping_groups(prefixes))
+        self.assertEqual(groups, [list(range(20000))])
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the streaming merge of IP prefixes
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ip_range_merge import (
+    RangeMerger,
+    merge_prefixes,
+    range_to_prefixes,
+)
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import (
+    IPPrefix,
+    int_to_str,
+)
+
+
+def _merge(values, chunk_size=2, stats=None):
+    return [
+        "{0}/{1}".format(int_to_str(address, version), prefixlen)
+        for address, prefixlen, version in merge_prefixes(
+            values,
+            IPPrefix.parse,
+            chunk_size=chunk_size,
+            stats=stats,
+        )
+    ]
+
+
+class TestIpRangeMerge(TestCase):
+    def test_range_to_prefixes(self):
+        self.assertEqual(list(range_to_prefixes(0, 2**32 - 1, 4)), [(0, 0)])
+        self.assertEqual(list(range_to_prefixes(1, 6, 4)), [(1, 32), (2, 31), (4, 31), (6, 32)])
+        self.assertEqual(list(range_to_prefixes(5, 4, 6)), [])
+
+    def test_merger_chunks(self):
+        merger = RangeMerger(4, chunk_size=2)
+        for first in (40, 0, 20, 10, 30, 11, 31, 50):
+            merger.add(first, first + 9)
+        self.assertEqual(list(merger.ranges()), [(0, 59)])
+        self.assertEqual(len(merger), 1)
+        self.assertEqual(merger.count, 8)
+        self.assertGreater(merger.peak_bytes, 0)
+
+    def test_merge_prefixes(self):
+        values = [
+            "2001:db8::/33",
+            "192.168.128.0/17",
+            "2001:db8:8000::/33",
+            "192.168.0.0/17",
+            "10.0.0.1",
+            "10.0.0.2",
+            "10.0.0.3",
+        ]
+        self.assertEqual(
+            _merge(values),
+            ["10.0.0.1/32", "10.0.0.2/31", "192.168.0.0/16", "2001:db8::/32"],
+        )
+        self.assertEqual(_merge(iter(values), chunk_size=1), _merge(values))
+        self.assertEqual(_merge([]), [])
+
+    def test_merge_prefixes_host_bits(self):
+        # like netaddr, a network with host bits is kept as is unless merged
+        self.assertEqual(_merge(["10.0.0.5/24", "10.2.0.0/24"]), ["10.0.0.5/24", "10.2.0.0/24"])
+        self.assertEqual(_merge(["10.0.0.5/24", "10.0.1.0/24"]), ["10.0.0.0/23"])
+        self.assertEqual(_merge(["10.0.0.5/24", "10.0.0.5/24"]), ["10.0.0.0/24"])
+        self.assertEqual(_merge(["10.0.0.0/25", "10.0.0.5/24"]), ["10.0.0.0/24"])
+
+    def test_merge_prefixes_stats(self):
+        stats = {}
+        self.assertEqual(
+            _merge(["10.0.0.0/25", "10.0.0.128/25", "::1"], stats=stats),
+            [
+                "10.0.0.0/24",
+                "::1/128",
+            ],
+        )
+        self.assertEqual(stats["prefixes"], 3)
+        self.assertEqual(stats["networks"], 2)
+        self.assertGreater(stats["peak_bytes"], 0)
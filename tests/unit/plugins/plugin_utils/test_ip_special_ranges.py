@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the IANA special-purpose address table
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ip_special_ranges
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_stdlib import str_to_int
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import ipaddr
+
+
+def _classify(address):
+    value, version = str_to_int(address)
+    return (
+        ip_special_ranges.is_global(value, version),
+        ip_special_ranges.is_private(value, version),
+        ip_special_ranges.is_reserved(value, version),
+        ip_special_ranges.is_loopback(value, version),
+        ip_special_ranges.is_multicast(value, version),
+    )
+
+
+class TestIpSpecialRanges(TestCase):
+    def test_table_covers_address_space(self):
+        for version in (4, 6):
+            starts, flags = ip_special_ranges._TABLES[version]
+            self.assertEqual(starts[0], 0)
+            self.assertEqual(starts, sorted(set(starts)))
+            self.assertEqual(len(starts), len(flags))
+            # neighbouring intervals always have different flags
+            self.assertTrue(all(a != b for a, b in zip(flags, flags[1:])))
+
+    def test_classify(self):
+        # global, private, reserved, loopback, multicast
+        expected = {
+            "0.0.0.0": (False, True, False, False, False),
+            "8.8.8.8": (True, False, False, False, False),
+            "10.255.255.255": (False, True, False, False, False),
+            "11.0.0.0": (True, False, False, False, False),
+            "100.64.0.1": (False, False, False, False, False),
+            "127.0.0.1": (False, True, False, True, False),
+            "192.0.0.8": (False, True, False, False, False),
+            "192.0.0.9": (True, False, False, False, False),
+            "192.0.0.11": (False, True, False, False, False),
+            "224.0.0.1": (True, False, False, False, True),
+            "255.255.255.255": (False, True, True, False, False),
+            "::1": (False, True, True, True, False),
+            "2001::1": (False, True, False, False, False),
+            "2001:4:112::1": (True, False, False, False, False),
+            "2001:4860::8888": (True, False, False, False, False),
+            "2002::1": (False, True, False, False, False),
+            "fe80::1": (False, True, False, False, False),
+            "ff02::1": (True, False, False, False, True),
+            "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff": (True, False, False, False, True),
+        }
+        for address, flags in expected.items():
+            self.assertEqual(_classify(address), flags, address)
+
+    def test_ipaddr_queries(self):
+        self.assertEqual(ipaddr("100.64.0.1", "private"), "100.64.0.1")
+        self.assertIsNone(ipaddr("100.64.0.1", "public"))
+        self.assertEqual(ipaddr("2002:c000:0204::1", "private"), "2002:c000:0204::1")
+        self.assertIsNone(ipaddr("255.255.255.0", "public"))
+        self.assertIsNone(ipaddr("224.0.0.1", "public"))
+        self.assertEqual(ipaddr("230.0.0.1/8", "multicast"), "230.0.0.1/8")
+        self.assertIsNone(ipaddr("224.0.0.1/3", "multicast"))
+        self.assertEqual(ipaddr("224.0.0.1/3", "unicast"), "224.0.0.1/3")
+        self.assertEqual(ipaddr("::1", "loopback"), "::1")
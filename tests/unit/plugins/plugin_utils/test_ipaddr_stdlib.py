@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the stdlib (ipaddress) backend of the ipaddr filters.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.ansible.utils.plugins.filter.cidr_merge import cidr_merge
+from ansible_collections.ansible.utils.plugins.filter.ipmath import ipmath
+from ansible_collections.ansible.utils.plugins.filter.ipsubnet import ipsubnet
+from ansible_collections.ansible.utils.plugins.filter.nthhost import nthhost
+from ansible_collections.ansible.utils.plugins.filter.slaac import slaac
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ipaddr_stdlib
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddr_utils import (
+    IPADDR_BACKEND_ENV,
+    ipaddr,
+    ipaddr_backend,
+    mac_linux,
+)
+
+
+netaddr = pytest.importorskip("netaddr")
+
+VALUES = [
+    "192.168.1.10/24",
+    "10.0.0.1/31",
+    "8.8.8.8",
+    "169.254.1.1",
+    "224.0.0.1",
+    "255.255.255.255",
+    "1.2.3.4/255.255.0.0",
+    "3232235777",
+    "167772160/8",
+    "2001:db8::1/64",
+    "2002:c000:0204::1",
+    "fe80::1/64",
+    "::1",
+    "::ffff:192.168.1.1",
+    "floop",
+]
+
+QUERIES = [
+    "",
+    "6to4",
+    "address",
+    "broadcast",
+    "cidr",
+    "first_usable",
+    "host",
+    "hostmask",
+    "int",
+    "ipv4",
+    "ipv6",
+    "last_usable",
+    "link-local",
+    "multicast",
+    "netmask",
+    "network/prefix",
+    "next_usable",
+    "peer",
+    "private",
+    "public",
+    "range_usable",
+    "revdns",
+    "size_usable",
+    "type",
+    "wrap",
+    "1",
+    "-1",
+    "192.168.0.0/16",
+]
+
+
+def _ipaddr_result(value, query, backend):
+    try:
+        return ipaddr(value, query, backend=backend)
+    except AnsibleFilterError as exc:
+        return str(exc)
+
+
+class TestIpaddrBackend(TestCase):
+    def test_backend_selection(self):
+        with patch.dict(os.environ, {IPADDR_BACKEND_ENV: ""}):
+            self.assertEqual(ipaddr_backend(), "netaddr")
+            self.assertEqual(ipaddr_backend("ipaddress"), "ipaddress")
+        with patch.dict(os.environ, {IPADDR_BACKEND_ENV: "ipaddress"}):
+            self.assertEqual(ipaddr_backend(), "ipaddress")
+            self.assertEqual(ipaddr_backend("netaddr"), "netaddr")
+        with pytest.raises(AnsibleFilterError, match="Unknown ipaddr backend 'floop'"):
+            ipaddr_backend("floop")
+
+    def test_ipaddr_backends_match(self):
+        for value in VALUES:
+            for query in QUERIES:
+                self.assertEqual(
+                    _ipaddr_result(value, query, "ipaddress"),
+                    _ipaddr_result(value, query, "netaddr"),
+                    "{0} | ipaddr('{1}')".format(value, query),
+                )
+
+    def test_ipaddr_stdlib_objects(self):
+        v = ipaddr_stdlib.StdlibIPNetwork.parse("192.168.1.10/24")
+        self.assertEqual(str(v.network), "192.168.1.0")
+        self.assertEqual(str(v.broadcast), "192.168.1.255")
+        self.assertEqual(v.size, 256)
+        self.assertEqual(str(v[-1]), "192.168.1.255")
+        self.assertIn(ipaddr_stdlib.StdlibIPAddress.parse("192.168.1.200"), v)
+        self.assertEqual([str(n) for n in v.supernet(22)], ["192.168.0.0/22", "192.168.0.0/23"])
+        self.assertIsNone(ipaddr_stdlib.StdlibIPNetwork.parse("10.0.0.1/31").broadcast)
+        with pytest.raises(ValueError, match="invalid IPNetwork 192.168.1.10/33"):
+            ipaddr_stdlib.StdlibIPNetwork.parse("192.168.1.10/33")
+
+    def test_filters_with_ipaddress_backend(self):
+        kwargs = {"backend": "ipaddress"}
+        self.assertEqual(ipsubnet("192.168.0.0/16", "20", -1, **kwargs), "192.168.240.0/20")
+        self.assertEqual(ipsubnet("192.168.144.5", "20", **kwargs), "192.168.144.0/20")
+        self.assertEqual(ipsubnet("192.168.144.5", "192.168.0.0/16", **kwargs), "36870")
+        self.assertEqual(nthhost("10.0.0.0/8", "305", **kwargs), "10.0.1.49")
+        self.assertEqual(ipmath("192.168.1.5/24", -10, **kwargs), "192.168.0.251")
+        self.assertEqual(ipmath("2001:db8::ffff", 1, **kwargs), "2001:db8::1:0")
+        self.assertEqual(
+            slaac("fdcf:1894:23b5:d38c:0000:0000:0000:0000", "c2:31:b3:83:bf:2b", **kwargs),
+            "fdcf:1894:23b5:d38c:c031:b3ff:fe83:bf2b",
+        )
+        self.assertEqual(
+            cidr_merge(["1.12.1.0/25", "1.12.1.128/25", "1.12.2.0/24"], **kwargs),
+            ["1.12.1.0/24", "1.12.2.0/24"],
+        )
+        self.assertEqual(cidr_merge(["1.12.1.1", "1.12.1.255"], "span", **kwargs), "1.12.1.0/24")
+
+
+class TestIPPrefix(TestCase):
+    def test_derived_fields(self):
+        p = ipaddr_stdlib.IPPrefix.parse("192.168.1.10/24")
+        self.assertEqual((p.version, p.prefixlen), (4, 24))
+        self.assertEqual(p.format(p.value), "192.168.1.10")
+        self.assertEqual(p.format(p.network), "192.168.1.0")
+        self.assertEqual(p.format(p.broadcast), "192.168.1.255")
+        self.assertEqual(p.size, 256)
+        self.assertEqual(str(p), "192.168.1.10/24")
+        self.assertEqual(
+            p, ipaddr_stdlib.IPPrefix.from_network(netaddr.IPNetwork("192.168.1.10/24"))
+        )
+
+    def test_usable_range(self):
+        p = ipaddr_stdlib.IPPrefix.parse("2001:db8::5/126")
+        self.assertEqual([p.format(v) for v in p.usable_range()], ["2001:db8::5", "2001:db8::6"])
+        p = ipaddr_stdlib.IPPrefix.parse("10.0.0.1/31")
+        self.assertEqual([p.format(v) for v in p.usable_range()], ["10.0.0.0", "10.0.0.1"])
+        self.assertIsNone(ipaddr_stdlib.IPPrefix.parse("10.0.0.1").usable_range())
+
+    def test_offset(self):
+        p = ipaddr_stdlib.IPPrefix.parse("255.255.255.250")
+        self.assertEqual(p.format(p.offset(5)), "255.255.255.255")
+        with pytest.raises(IndexError, match="result outside valid IP address boundary!"):
+            p.offset(6)
+
+    def test_immutable(self):
+        p = ipaddr_stdlib.IPPrefix.parse("10.0.0.0/8")
+        with pytest.raises(AttributeError, match="IPPrefix is immutable"):
+            p.prefixlen = 16
+        with pytest.raises(AttributeError):
+            p.extra = True
+        with pytest.raises(ValueError, match="invalid IPNetwork 10.0.0.0/33"):
+            ipaddr_stdlib.IPPrefix.parse("10.0.0.0/33")
+
+
+class TestMacAddress(TestCase):
+    def test_mac_to_int(self):
+        for value in (
+            "1a:2b:3c:4d:5e:6f",
+            "1A-2B-3C-4D-5E-6F",
+            "1a:2b:3c:4d:5e:f",
+            "1a2b.3c4d.5e6f",
+            "1a2b-3c4d-5e6f",
+            "1a2b3c4d5e6f",
+        ):
+            self.assertEqual(ipaddr_stdlib.mac_to_int(value), int(netaddr.EUI(value)), value)
+        with pytest.raises(ValueError, match="invalid MAC address"):
+            ipaddr_stdlib.mac_to_int("1a:2b:3c-4d:5e:6f")
+
+    def test_format_mac_dialects_match(self):
+        dialects = {
+            "bare": netaddr.mac_bare,
+            "cisco": netaddr.mac_cisco,
+            "eui48": netaddr.mac_eui48,
+            "linux": mac_linux,
+            "pgsql": netaddr.mac_pgsql,
+            "unix": netaddr.mac_unix,
+        }
+        for mac in (0, 0x010B3C4D5E0F, 0x1A2B3C4D5E6F, 0xFFFFFFFFFFFF):
+            for dialect, netaddr_dialect in dialects.items():
+                self.assertEqual(
+                    ipaddr_stdlib.format_mac(mac, dialect),
+                    str(netaddr.EUI(mac, dialect=netaddr_dialect)),
+                    "{0:x} {1}".format(mac, dialect),
+                )
@@ -14,9 +14,12 @@ __metaclass__ = type
 
 from unittest import TestCase
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import ipaddress_utils
 from ansible_collections.ansible.utils.plugins.plugin_utils.base.ipaddress_utils import (
+    NetworkIndex,
     _is_subnet_of,
     ip_network,
+    network_index,
 )
 
 
@@ -58,3 +61,67 @@ class TestIsSubnetOf(TestCase):
     def test_invalid_arguments_return_false(self):
         self.assertFalse(_is_subnet_of(None, ip_network("10.0.0.0/8")))
         self.assertFalse(_is_subnet_of(ip_network("10.0.0.0/8"), None))
+
+
+class TestNetworkIndex(TestCase):
+    def test_count(self):
+        index = NetworkIndex(
+            ["10.0.0.0/8", "10.1.0.0/16", "10.1.0.0/16", "10.2.0.0/24", "2001:db8::/32", "floop"],
+        )
+        expected = {
+            "10.1.1.1/32": 3,
+            "10.1.0.0/16": 3,
+            "10.0.0.0/15": 1,
+            "10.2.0.5/32": 2,
+            "10.2.1.0/24": 1,
+            "10.0.0.0/7": 0,
+            "11.0.0.1/32": 0,
+            "2001:db8:1::/48": 1,
+            "::1/128": 0,
+        }
+        for network, count in expected.items():
+            self.assertEqual(index.count(ip_network(network)), count, network)
+            self.assertEqual(index.contains(ip_network(network)), count > 0, network)
+
+    def test_adjacent_networks(self):
+        # a network spanning two networks of the list is in neither
+        index = NetworkIndex(["10.0.0.0/24", "10.0.1.0/24"])
+        self.assertFalse(index.contains(ip_network("10.0.0.0/23")))
+        self.assertTrue(index.contains(ip_network("10.0.1.128/25")))
+
+    def test_memoized(self):
+        ipaddress_utils._NETWORK_INDEX_CACHE.clear()
+        ipaddress_utils._NETWORK_INDEX_BY_ID.clear()
+        networks = ["10.0.0.0/8", "192.168.1.0/24"]
+        calls = []
+        index = network_index(networks, validate=lambda: calls.append(True))
+        self.assertIs(network_index(networks, validate=lambda: calls.append(True)), index)
+        self.assertIs(network_index(list(networks), validate=lambda: calls.append(True)), index)
+        self.assertEqual(len(calls), 1)
+        networks.append("172.16.0.0/12")
+        self.assertIsNot(network_index(networks), index)
+        self.assertTrue(network_index(networks).contains(ip_network("172.16.1.1")))
+        # a list changed in place, with the same length, is compiled again
+        networks[2] = "172.17.0.0/16"
+        self.assertFalse(network_index(networks).contains(ip_network("172.16.1.1")))
+        self.assertTrue(network_index(networks).contains(ip_network("172.17.1.1")))
+        self.assertLessEqual(
+            len(ipaddress_utils._NETWORK_INDEX_CACHE),
+            ipaddress_utils.NETWORK_INDEX_CACHE_SIZE,
+        )
+
+    def test_memoized_by_id(self):
+        ipaddress_utils._NETWORK_INDEX_CACHE.clear()
+        ipaddress_utils._NETWORK_INDEX_BY_ID.clear()
+        networks = ["10.{0}.{1}.0/24".format(i // 256, i % 256) for i in range(1000)]
+        index = network_index(networks)
+        # the same list object is not hashed again
+        ipaddress_utils._NETWORK_INDEX_CACHE.clear()
+        self.assertIs(network_index(networks), index)
+        # a list changed in place is compiled again
+        networks[0] = "172.16.0.0/24"
+        self.assertTrue(network_index(networks).contains(ip_network("172.16.0.1")))
+        networks.pop()
+        self.assertFalse(network_index(networks).contains(ip_network("10.3.231.1")))
+        networks[-1] = "172.17.0.0/24"
+        self.assertTrue(network_index(networks).contains(ip_network("172.17.0.1")))
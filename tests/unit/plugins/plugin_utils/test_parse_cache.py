@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the cli_parse result cache
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.parse_cache import (
+    ParseCache,
+    parse_cache,
+    parse_cache_key,
+)
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+PARSER = {"name": "ansible.utils.ttp", "command": "show version", "vars": {"a": 1}}
+
+
+class TestParseCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def test_key(self):
+        key = parse_cache_key("text", PARSER, b"template", "nxos", "ttp 0.10.1")
+        self.assertEqual(
+            key, parse_cache_key("text", dict(PARSER), b"template", "nxos", "ttp 0.10.1")
+        )
+        changed = [
+            parse_cache_key("other text", PARSER, b"template", "nxos", "ttp 0.10.1"),
+            parse_cache_key(
+                "text",
+                dict(PARSER, name="ansible.utils.textfsm"),
+                b"template",
+                "nxos",
+                "ttp 0.10.1",
+            ),
+            parse_cache_key("text", dict(PARSER, vars={"a": 2}), b"template", "nxos", "ttp 0.10.1"),
+            parse_cache_key("text", PARSER, b"template", "ios", "ttp 0.10.1"),
+            parse_cache_key("text", PARSER, b"template", "nxos", "ttp 0.10.0"),
+            parse_cache_key("text", PARSER, b"other template", "nxos", "ttp 0.10.1"),
+            parse_cache_key("text", PARSER, b"\xfftemplate", "nxos", "ttp 0.10.1"),
+        ]
+        self.assertEqual(len(set(changed + [key])), len(changed) + 1)
+        # the template path does not matter, the contents do
+        self.assertEqual(
+            key,
+            parse_cache_key(
+                "text", dict(PARSER, template_path="/t"), b"template", "nxos", "ttp 0.10.1"
+            ),
+        )
+        self.assertIsNone(parse_cache_key("text", dict(PARSER, vars={"a": object()}), b""))
+
+    def test_get_set(self):
+        cache = ParseCache(self.tmpdir)
+        self.assertEqual(cache.path, os.path.join(self.tmpdir, "cli_parse_cache.sqlite"))
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", [{"version": "9.2(2)"}])
+        self.assertEqual(cache.get("key"), [{"version": "9.2(2)"}])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # another process reads the results from the database
+        self.assertEqual(ParseCache(cache.path).get("key"), [{"version": "9.2(2)"}])
+        self.assertIs(parse_cache(cache.path), parse_cache(cache.path))
+
+    def test_evict(self):
+        # about 0.4 megabytes each, 2 fit in a megabyte
+        value = "x" * 400000
+        cache = ParseCache(os.path.join(self.tmpdir, "cache.sqlite"), max_size=1, clock=Clock())
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.get("a")
+        cache.set("c", value)
+        self.assertEqual(cache.size()[0], 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), value)
+        self.assertEqual(cache.get("c"), value)
+        # too large to be cached at all
+        cache.set("d", "x" * 2000000)
+        self.assertIsNone(cache.get("d"))
+
+    def test_broken(self):
+        cache = ParseCache(os.path.join(self.tmpdir, "missing", "cache.sqlite"))
+        cache.set("key", {})
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.size(), (0, 0))
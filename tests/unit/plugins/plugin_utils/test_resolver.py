@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Unit tests for the cached resolver, against a stub resolver
+"""
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+from unittest import TestCase
+
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.resolver import (
+    HostsIndex,
+    Resolver,
+    ResolverCache,
+    hosts_index,
+)
+
+
+class StubResolver(object):
+    """getaddrinfo and gethostbyaddr answering from a dict, recording the
+    lookups and how many ran at once"""
+
+    def __init__(self, records, delays=None):
+        self.records = records
+        self.delays = delays or {}
+        self.lookups = []
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def _lookup(self, host):
+        with self._lock:
+            self.lookups.append(host)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delays.get(host, 0))
+            if host not in self.records:
+                raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+            return self.records[host]
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def getaddrinfo(self, host, port):
+        return self._lookup(host.lower().rstrip("."))
+
+    def gethostbyaddr(self, address):
+        return self._lookup(address)
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _resolver(stub, **kwargs):
+    return Resolver(
+        cache=ResolverCache(**kwargs),
+        getaddrinfo=stub.getaddrinfo,
+        gethostbyaddr=stub.gethostbyaddr,
+    )
+
+
+RECORDS = {"www.example.com": [], "192.0.2.1": ("gw", [], ["192.0.2.1"]), "2001:db8::1": ()}
+
+
+class TestResolver(TestCase):
+    def test_resolvable(self):
+        stub = StubResolver(RECORDS)
+        resolver = _resolver(stub)
+        self.assertTrue(resolver.resolvable("www.example.com"))
+        self.assertTrue(resolver.resolvable("192.0.2.1"))
+        self.assertTrue(resolver.resolvable("2001:DB8:0::1"))
+        self.assertFalse(resolver.resolvable("foo.example.com"))
+        self.assertFalse(resolver.resolvable("192.0.2.2"))
+
+    def test_cache_ttl(self):
+        stub = StubResolver(RECORDS)
+        clock = Clock()
+        resolver = _resolver(stub, clock=clock)
+        for _i in range(3):
+            self.assertTrue(resolver.resolvable("WWW.example.com.", ttl=60, negative_ttl=10))
+            self.assertFalse(resolver.resolvable("foo.example.com", ttl=60, negative_ttl=10))
+        self.assertEqual(stub.lookups, ["www.example.com", "foo.example.com"])
+        self.assertEqual(resolver.cache.hits, 4)
+
+        # the negative result expires first
+        clock.now += 30
+        resolver.resolvable_many(["www.example.com", "foo.example.com"], ttl=60, negative_ttl=10)
+        self.assertEqual(stub.lookups[2:], ["foo.example.com"])
+        clock.now += 60
+        resolver.resolvable_many(["www.example.com"], ttl=0)
+        resolver.resolvable_many(["www.example.com"], ttl=0)
+        self.assertEqual(stub.lookups[3:], ["www.example.com", "www.example.com"])
+
+    def test_cache_size(self):
+        cache = ResolverCache(maxsize=2)
+        for key in ("name:a", "name:b", "name:a", "name:c"):
+            cache.set(key, True, 60)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("name:b"))
+        self.assertTrue(cache.get("name:a"))
+
+    def test_bulk(self):
+        stub = StubResolver(RECORDS, delays={"www.example.com": 0.05, "foo.example.com": 0.05})
+        resolver = _resolver(stub)
+        hosts = ["www.example.com", "foo.example.com", "192.0.2.1", "www.example.com"] * 2
+        self.assertEqual(
+            resolver.resolvable_many(hosts, workers=4, ttl=60, negative_ttl=10),
+            [True, False, True, True] * 2,
+        )
+        # every host is looked up once, concurrently
+        self.assertEqual(sorted(stub.lookups), ["192.0.2.1", "foo.example.com", "www.example.com"])
+        self.assertGreater(stub.peak, 1)
+        self.assertLessEqual(stub.peak, 4)
+        self.assertEqual(
+            resolver.resolvable_many(hosts, ttl=60, negative_ttl=10),
+            [True, False, True, True] * 2,
+        )
+        self.assertEqual(len(stub.lookups), 3)
+        # nothing is cached by default
+        self.assertEqual(resolver.resolvable_many(hosts[:2]), [True, False])
+        self.assertEqual(resolver.resolvable_many(hosts[:2]), [True, False])
+        self.assertEqual(len(stub.lookups), 7)
+
+    def test_bulk_workers(self):
+        names = ["host{0}.example.com".format(i) for i in range(20)]
+        stub = StubResolver(dict((name, []) for name in names), dict.fromkeys(names, 0.01))
+        resolver = _resolver(stub)
+        self.assertTrue(all(resolver.resolvable_many(names, workers=3)))
+        self.assertLessEqual(stub.peak, 3)
+
+    def test_timeout(self):
+        stub = StubResolver(RECORDS, delays={"www.example.com": 0.5})
+        resolver = _resolver(stub)
+        start = time.monotonic()
+        self.assertEqual(
+            resolver.resolvable_many(["www.example.com", "192.0.2.1"], timeout=0.1),
+            [False, True],
+        )
+        self.assertLess(time.monotonic() - start, 0.4)
+        # a lookup which timed out is not cached
+        self.assertIsNone(resolver.cache.get("name:www.example.com"))
+        self.assertTrue(resolver.resolvable("www.example.com", timeout=2))
+
+    def test_timeout_daemon(self):
+        """A lookup which timed out does not hold the process up on exit"""
+        stub = StubResolver(RECORDS, delays={"www.example.com": 0.5})
+        resolver = _resolver(stub)
+        self.assertEqual(resolver.resolvable_many(["www.example.com"], timeout=0.1), [False])
+        stuck = [t for t in threading.enumerate() if t.name == "resolvable" and t.is_alive()]
+        self.assertTrue(stuck)
+        self.assertTrue(all(t.daemon for t in stuck))
+
+    def test_hosts_index(self):
+        index = HostsIndex(
+            [
+                "# comment",
+                "127.0.0.1   localhost localhost.localdomain",
+                "fe80::1%lo0 link-local  # scoped",
+                "2001:db8:0::10 Router.Example.COM. router",
+                "not-an-address name",
+                "192.0.2.99",
+            ],
+        )
+        stub = StubResolver({})
+        resolver = _resolver(stub)
+        hosts = ["localhost", "router.example.com", "2001:db8::10", "fe80::1", "name"]
+        self.assertEqual(resolver.resolvable_many(hosts, index=index), [True] * 4 + [False])
+        self.assertEqual(stub.lookups, ["name"])
+
+    def test_hosts_index_file(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "hosts")
+        with open(path, "w") as f:
+            f.write("192.0.2.1 one\n")
+        index = hosts_index(path)
+        self.assertIs(hosts_index(path), index)
+        with open(path, "a") as f:
+            f.write("192.0.2.2 two\n")
+        self.assertIn("name:two", hosts_index(path))
+
+    def test_shared_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "resolvable.sqlite")
+        stub = StubResolver(RECORDS)
+        self.assertEqual(
+            _resolver(stub, path=path).resolvable_many(
+                ["www.example.com", "foo.example.com"],
+                ttl=60,
+                negative_ttl=10,
+            ),
+            [True, False],
+        )
+        # another process reads the results from the database
+        other = _resolver(stub, path=path)
+        self.assertEqual(
+            other.resolvable_many(["www.example.com", "foo.example.com"], ttl=60, negative_ttl=10),
+            [True, False],
+        )
+        self.assertEqual(len(stub.lookups), 2)
+        self.assertEqual(other.cache.hits, 2)
+
+    def test_shared_cache_broken(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        stub = StubResolver(RECORDS)
+        resolver = _resolver(stub, path=tmpdir)
+        self.assertTrue(resolver.resolvable("www.example.com", ttl=60))
+        self.assertTrue(resolver.resolvable("www.example.com", ttl=60))
+        self.assertEqual(len(stub.lookups), 1)
+
+    def test_shared_cache_prune(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        clock = Clock()
+        cache = ResolverCache(path=os.path.join(tmpdir, "resolvable.sqlite"), clock=clock)
+        cache.set("name:a", True, 60)
+        cache.set("name:b", False, 10)
+        clock.now += 30
+        cache.set("name:c", True, 60)
+        rows = cache._connection().execute("SELECT key FROM resolvable ORDER BY key").fetchall()
+        # the expired result is dropped from the database on write
+        self.assertEqual(rows, [("name:a",), ("name:c",)])
@@ -7,12 +7,15 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import shutil
+import tempfile
 
 from unittest import TestCase
 
 import pytest
 
 from ansible_collections.ansible.utils.plugins.sub_plugins.cli_parser.textfsm_parser import (
+    _TEMPLATE_CACHE,
     CliParser,
 )
 
@@ -68,3 +71,51 @@ class TestTextfsmParser(TestCase):
         result = parser.parse()
         errors = {"errors": "error while reading template_path file {0}".format(fake_path)}
         self.assertEqual(result, errors)
+
+    def test_textfsm_parser_template_cache(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        template_path = os.path.join(tmpdir, "interfaces.textfsm")
+        template = (
+            "Value Filldown VRF (\\S+)\n"
+            "Value Required INTF (\\S+)\n"
+            "Value List ADDR (\\S+)\n"
+            "\n"
+            "Start\n"
+            "  ^VRF ${VRF}\n"
+            "  ^Interface ${INTF} -> Record\n"
+            "  ^ addr ${ADDR}\n"
+        )
+        with open(template_path, "w") as fhand:
+            fhand.write(template)
+
+        messages = []
+        task_args = {
+            "text": "VRF a\n addr 1\n addr 2\nInterface e1\nInterface e2\n",
+            "parser": {"name": "ansible.utils.textfsm", "template_path": template_path},
+        }
+        parsed_output = [
+            {"VRF": "a", "INTF": "e1", "ADDR": ["1", "2"]},
+            {"VRF": "a", "INTF": "e2", "ADDR": []},
+        ]
+        _TEMPLATE_CACHE.clear()
+        for _i in range(3):
+            # every parse starts from a fresh state
+            parser = CliParser(task_args=task_args, task_vars=[], debug=messages.append)
+            self.assertEqual(parser.parse(), {"parsed": parsed_output})
+        self.assertEqual(_TEMPLATE_CACHE.info()["misses"], 1)
+        self.assertEqual(_TEMPLATE_CACHE.info()["hits"], 2)
+        self.assertEqual(
+            messages[-1],
+            "textfsm template cache: 2 hits, 1 misses, 1 templates",
+        )
+
+        # touching the template does not compile it again, changing it does
+        os.utime(template_path, (0, 0))
+        CliParser(task_args=task_args, task_vars=[], debug=False).parse()
+        self.assertEqual(_TEMPLATE_CACHE.info()["misses"], 1)
+        with open(template_path, "w") as fhand:
+            fhand.write(template.replace("Value Required INTF", "Value INTF"))
+        result = CliParser(task_args=task_args, task_vars=[], debug=False).parse()
+        self.assertEqual(result["parsed"][-1], {"VRF": "a", "INTF": "", "ADDR": []})
+        self.assertEqual(_TEMPLATE_CACHE.info()["misses"], 2)
@@ -100,3 +100,29 @@ class TestTextfsmParser(TestCase):
         result = parser.parse()
         errors = {"errors": "error while reading template_path file {0}".format(fake_path)}
         self.assertEqual(result, errors)
+
+    def test_ttp_parser_record_set(self):
+        """A variable recorded by a parse is not seen by the next ones"""
+        template_path = os.path.join(os.path.dirname(__file__), "fixtures", "ios_record_set.ttp")
+
+        def parse(text, **parser_vars):
+            task_args = {
+                "text": text,
+                "parser": {
+                    "name": "ansible.utils.ttp",
+                    "template_path": template_path,
+                    "vars": parser_vars,
+                },
+            }
+            return CliParser(task_args=task_args, task_vars=[], debug=False).parse()
+
+        with_hostname = "hostname r1\ninterface Gi1\n description up\n"
+        without_hostname = "interface Gi2\n description down\n"
+        first = parse(with_hostname)
+        self.assertEqual(first["parsed"][0][0]["interfaces"]["hostname"], "r1")
+        second = parse(without_hostname)
+        self.assertEqual(second["parsed"][0][0]["interfaces"]["hostname"], "hostname")
+        third = parse(without_hostname, ttp_vars={"hostname": "r2"})
+        self.assertEqual(third["parsed"][0][0]["interfaces"]["hostname"], "r2")
+        self.assertEqual(parse(with_hostname), first)
+        self.assertEqual(parse(without_hostname), second)
@@ -13,9 +13,12 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from unittest import TestCase
+from unittest.mock import patch
 
 from ansible.errors import AnsibleError
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base.utils import _validate_args
+from ansible_collections.ansible.utils.plugins.test import in_any_network
 from ansible_collections.ansible.utils.plugins.test.in_any_network import _in_any_network
 
 
@@ -37,6 +40,17 @@ class TestInAnyNetwork(TestCase):
             )
         self.assertIn("unable to convert to list", str(error.exception))
 
+    def test_validate_ip(self):
+        """Check the address is validated even when the networks are
+        already compiled"""
+        networks = ["10.0.0.0/8", "192.168.1.0/24"]
+        with patch.object(in_any_network, "_validate_args", wraps=_validate_args) as validate:
+            for ip in ("10.1.1.1", "8.8.8.8"):
+                _in_any_network(ip=ip, networks=networks)
+        validated = [call[0][2]["ip"] for call in validate.call_args_list]
+        self.assertEqual(validated.count("10.1.1.1"), 1)
+        self.assertEqual(validated.count("8.8.8.8"), 1)
+
     def test_valid_data(self):
         """Check passing valid data as per criteria"""
 
@@ -45,3 +45,7 @@ class TestInOneNetwork(TestCase):
 
         result = _in_one_network(ip="8.8.8.8", networks=["10.0.0.0/8", "10.1.1.0/24"])
         self.assertEqual(result, False)
+
+        # duplicated networks count twice
+        result = _in_one_network(ip="10.1.1.1", networks=["10.0.0.0/8", "10.0.0.0/8"])
+        self.assertEqual(result, False)
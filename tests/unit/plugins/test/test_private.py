@@ -38,5 +38,12 @@ class TestPrivate(TestCase):
         result = _private(ip="8.8.8.8")
         self.assertEqual(result, False)
 
+        # shared address space is neither private nor public
+        result = _private(ip="100.64.0.1")
+        self.assertEqual(result, False)
+
+        result = _private(ip="2002::1")
+        self.assertEqual(result, True)
+
         result = _private(ip="string")
         self.assertEqual(result, False)
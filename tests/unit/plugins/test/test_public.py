@@ -38,5 +38,11 @@ class TestPublic(TestCase):
         result = _public(ip="10.1.1.1")
         self.assertEqual(result, False)
 
+        result = _public(ip="100.64.0.1")
+        self.assertEqual(result, False)
+
+        result = _public(ip="2001:4:112::1")
+        self.assertEqual(result, True)
+
         result = _public(ip="string")
         self.assertEqual(result, False)
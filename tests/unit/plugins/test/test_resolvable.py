@@ -12,14 +12,37 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+import shutil
+import socket
+import tempfile
+
 from unittest import TestCase
+from unittest.mock import patch
+
+from ansible.errors import AnsibleError
 
+from ansible_collections.ansible.utils.plugins.plugin_utils.base import resolver
 from ansible_collections.ansible.utils.plugins.test.resolvable import _resolvable
 
 
+def _stub_getaddrinfo(host, port):
+    if not host.endswith(".stub.test"):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    return []
+
+
 class TestResolvable(TestCase):
     def setUp(self):
-        pass
+        resolver._RESOLVER.cache.clear()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        patcher = patch.dict(
+            os.environ,
+            {resolver.RESOLVER_CACHE_ENV: os.path.join(tmpdir, "cache.sqlite")},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_invalid_data(self):
         """Check passing invalid argspec"""
@@ -46,3 +69,52 @@ class TestResolvable(TestCase):
 
         result = _resolvable(host="invalidhost")
         self.assertEqual(result, False)
+
+    @patch.object(resolver._RESOLVER, "getaddrinfo", _stub_getaddrinfo)
+    def test_list(self):
+        """Check a list of hosts against a stub resolver"""
+
+        result = _resolvable(host=["a.stub.test", "b.stub.test"], workers=2, timeout=5, ttl=60)
+        self.assertEqual(result, True)
+
+        result = _resolvable(["a.stub.test", "invalid.host"], ttl=60)
+        self.assertEqual(result, False)
+        self.assertEqual(resolver._RESOLVER.cache.hits, 1)
+
+    @patch.object(resolver._RESOLVER, "getaddrinfo", _stub_getaddrinfo)
+    def test_not_str(self):
+        """Check values which are not strings are converted to strings"""
+
+        self.assertEqual(_resolvable(host=1), False)
+        self.assertEqual(_resolvable(host=2130706433), _resolvable(host="2130706433"))
+        self.assertEqual(_resolvable(host=["a.stub.test", 1]), False)
+        self.assertEqual(_resolvable(host=("a.stub.test",)), True)
+
+    @patch.object(resolver._RESOLVER, "getaddrinfo")
+    def test_not_cached(self, getaddrinfo):
+        """Check nothing is cached nor shared by default"""
+
+        getaddrinfo.side_effect = [socket.gaierror(socket.EAI_NONAME, "not known"), []]
+        self.assertEqual(_resolvable("new.stub.test"), False)
+        # the record appeared meanwhile
+        self.assertEqual(_resolvable("new.stub.test"), True)
+        self.assertEqual(resolver._RESOLVER.cache.hits, 0)
+        with patch.dict(os.environ, clear=True):
+            self.assertIsNone(resolver.resolver().cache.path)
+
+    @patch.object(resolver._RESOLVER, "getaddrinfo", _stub_getaddrinfo)
+    def test_hosts_file(self):
+        """Check the names of a hosts file are resolvable without a lookup"""
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "hosts")
+        with open(path, "w") as f:
+            f.write("192.0.2.1 router.lab\n")
+
+        self.assertEqual(_resolvable("router.lab", hosts_file=path), True)
+        self.assertEqual(_resolvable("router.lab"), False)
+
+        with self.assertRaises(AnsibleError) as error:
+            _resolvable("router.lab", hosts_file=os.path.join(tmpdir, "missing"))
+        self.assertIn("resolvable: can not read", str(error.exception))